@@ -0,0 +1,83 @@
+"""
+Readability Benchmark
+Measures readability (syllable counting) throughput in words per second
+over the site's content, before and after memoized, dictionary-backed
+syllable counting.
+
+Usage:
+    python -m mcp.benchmark_readability content docs --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from mcp.utils import content_analyzer
+from mcp.utils.content_analyzer import BLOCK_BREAK, count_syllables, heuristic_syllables, scan_content
+
+TEXT_EXTENSIONS = (".md", ".mdx", ".html", ".txt")
+
+def load_pages(paths):
+    pages = []
+    for root_path in paths:
+        for root, dirs, files in os.walk(root_path):
+            dirs[:] = [d for d in dirs if d not in ("node_modules", ".git")]
+            for file in files:
+                if file.endswith(TEXT_EXTENSIONS):
+                    with open(os.path.join(root, file), "r", encoding="utf-8", errors="ignore") as f:
+                        pages.append([token for token in scan_content(f.read())["tokens"] if token != BLOCK_BREAK])
+    return pages
+
+def per_word_heuristic(pages):
+    # Previous behaviour: the character loop runs for every word on every page
+    return sum(heuristic_syllables(word) for words in pages for word in words)
+
+def memoized(pages):
+    return sum(count_syllables(word) for words in pages for word in words)
+
+def measure(label, fn, pages, words, repeat, reset=None):
+    best = float("inf")
+    for _ in range(repeat):
+        if reset:
+            reset()
+        started = time.perf_counter()
+        fn(pages)
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<34} {words / best:>14,.0f} words/s  ({best * 1000:.1f} ms)")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark readability throughput")
+    parser.add_argument("paths", nargs="*", default=["content", "docs"], help="Directories of content to read")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (best is reported)")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.paths)
+    words = sum(len(page) for page in pages)
+    if not words:
+        print("No content found", file=sys.stderr)
+        return 1
+    distinct = len({word for page in pages for word in page})
+    print(f"{len(pages)} pages, {words:,} words, {distinct:,} distinct")
+
+    def cold():
+        count_syllables.cache_clear()
+
+    def heuristic_only():
+        cold()
+        content_analyzer._syllable_dict = {}
+
+    measure("before: heuristic per word", per_word_heuristic, pages, words, args.repeat)
+    measure("after: LRU cache, cold", memoized, pages, words, args.repeat, reset=heuristic_only)
+    memoized(pages)
+    measure("after: LRU cache, warm", memoized, pages, words, args.repeat)
+
+    content_analyzer._syllable_dict = None
+    if content_analyzer.load_syllable_dict():
+        measure("after: LRU cache + dictionary, cold", memoized, pages, words, args.repeat, reset=cold)
+    else:
+        print(f"(no syllable dictionary at {content_analyzer.SYLLABLE_DICT_PATH}; see mcp.build_syllable_dict)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
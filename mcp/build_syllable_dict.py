@@ -0,0 +1,65 @@
+"""
+Syllable Dictionary Builder
+Converts a CMU Pronouncing Dictionary file into the compact syllable
+dictionary read by mcp.utils.content_analyzer.
+
+Only words the vowel-group heuristic gets wrong are kept (pass --all to keep
+every word), so the file stays small and lookups fall through to the
+heuristic for everything else.
+
+Usage:
+    python -m mcp.build_syllable_dict cmudict.dict -o mcp/data/syllables.txt
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import defaultdict
+
+from mcp.utils.content_analyzer import SYLLABLE_DICT_PATH, heuristic_syllables
+
+_ENTRY = re.compile(r"^([a-z][a-z'\-.]*?)(?:\(\d+\))?\s+([^#]+)")
+
+def read_cmudict(path: str) -> dict:
+    """
+    word -> syllable count (vowel phones carry a stress digit), first
+    pronunciation wins
+    """
+    syllables = {}
+    with open(path, "r", encoding="latin-1") as f:
+        for line in f:
+            if line.startswith(";;;"):
+                continue
+            match = _ENTRY.match(line.lower())
+            if not match or match.group(1) in syllables:
+                continue
+            phones = match.group(2).split()
+            syllables[match.group(1)] = sum(1 for phone in phones if phone[-1].isdigit())
+    return syllables
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the syllable dictionary from CMUdict")
+    parser.add_argument("cmudict", help="Path to cmudict.dict")
+    parser.add_argument("-o", "--output", default=str(SYLLABLE_DICT_PATH), help="Output file path")
+    parser.add_argument("--all", action="store_true", help="Keep words the heuristic already counts correctly")
+    args = parser.parse_args(argv)
+
+    by_count = defaultdict(list)
+    total = 0
+    for word, count in read_cmudict(args.cmudict).items():
+        total += 1
+        if count and (args.all or heuristic_syllables(word) != count):
+            by_count[count].append(word)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        for count in sorted(by_count):
+            f.write(f"{count} {' '.join(sorted(by_count[count]))}\n")
+
+    kept = sum(len(words) for words in by_count.values())
+    print(f"Kept {kept} of {total} words -> {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Performance Budgets CLI
+Checks a build directory against performance-budgets.json and exits
+non-zero when any budget is exceeded, for use in CI.
+
+Usage:
+    python -m mcp.check_budgets --build-dir dist --json budgets-report.json
+"""
+
+import argparse
+import json
+import sys
+
+from mcp.utils.budgets import evaluate_budgets
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check a build against performance budgets")
+    parser.add_argument("--build-dir", default="dist", help="Build output directory")
+    parser.add_argument("--budgets", default=None, help="Budgets file (defaults to performance-budgets.json)")
+    parser.add_argument("--json", dest="json_output", help="Also write the full result as JSON to this path")
+    args = parser.parse_args(argv)
+
+    result = evaluate_budgets(args.build_dir, args.budgets)
+    if args.json_output:
+        with open(args.json_output, "w") as f:
+            json.dump(result, f, indent=2)
+
+    if "error" in result:
+        print(result["error"], file=sys.stderr)
+        return 2
+
+    for check in result["budgets"]:
+        status = "PASS" if check["passed"] else "FAIL"
+        if check.get("error"):
+            print(f"{status} {check['id']}: {check['error']}")
+        elif check["passed"]:
+            print(f"{status} {check['id']}: {check['actual']} <= {check['limit']}")
+        else:
+            print(f"{status} {check['id']}: {check['actual']} > {check['limit']} (+{check['overage']})")
+
+    print(f"{len(result['failures'])} of {result['checked']} budgets exceeded")
+    return 0 if result["passed"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Metrics Export CLI
+Downloads collected performance samples from a running MCP server as
+Arrow IPC or Parquet.
+
+Usage:
+    python -m mcp.export_metrics -o metrics.parquet --format parquet \\
+        --url-prefix https://example.com/case-studies --since 2026-01-01
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import urllib.parse
+import urllib.request
+
+DEFAULT_SERVER = os.environ.get("VITE_MCP_URL", "http://localhost:8000")
+
+def build_export_url(server: str, export_format: str, url_prefix=None, since=None, until=None) -> str:
+    """
+    Build the /analytics/export URL for the given filters
+    """
+    params = {"format": export_format}
+    if url_prefix:
+        params["url_prefix"] = url_prefix
+    if since:
+        params["since"] = since
+    if until:
+        params["until"] = until
+    return f"{server.rstrip('/')}/analytics/export?{urllib.parse.urlencode(params)}"
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export collected performance metrics")
+    parser.add_argument("-o", "--output", required=True, help="Output file path")
+    parser.add_argument("--format", choices=["arrow", "parquet"], default=None,
+                        help="Export format (defaults from the output extension)")
+    parser.add_argument("--url-prefix", help="Only export samples whose URL starts with this")
+    parser.add_argument("--since", help="ISO timestamp lower bound")
+    parser.add_argument("--until", help="ISO timestamp upper bound")
+    parser.add_argument("--server", default=DEFAULT_SERVER, help="MCP server base URL")
+    args = parser.parse_args(argv)
+
+    export_format = args.format or ("parquet" if args.output.endswith(".parquet") else "arrow")
+    url = build_export_url(args.server, export_format, args.url_prefix, args.since, args.until)
+
+    # Stream straight to disk so large exports never sit in memory
+    with urllib.request.urlopen(url) as response, open(args.output, "wb") as out:
+        rows = response.headers.get("X-Row-Count", "?")
+        shutil.copyfileobj(response, out, length=1024 * 1024)
+
+    print(f"Exported {rows} rows -> {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,8 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from mcp.utils.load_shedder import InFlightMiddleware, shedder
+from mcp.utils.navigation_model import navigation_model
 from mcp.routes import (
     logo, preview, export,
     analytics, images, seo,
@@ -7,7 +10,13 @@ from mcp.routes import (
     content, cache, cleanup, pr_validation
 )
 
-app = FastAPI(title="MCP Optimization Server")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Transitions recorded since the last periodic save would otherwise be lost
+    navigation_model.save()
+
+app = FastAPI(title="MCP Optimization Server", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,6 +25,9 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+# Every request counts toward the ingest shedder's queue depth
+app.add_middleware(InFlightMiddleware, shedder=shedder)
+
 # Branding routes
 app.include_router(logo.router, prefix="/generate-logo")
 app.include_router(preview.router, prefix="/preview-layout")
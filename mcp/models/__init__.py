@@ -1,4 +1,5 @@
-# MCP Optimization Server Models
+"""
+MCP Optimization Server Models
 
 This package contains all Pydantic models for the MCP Optimization Server.
-
+"""
@@ -11,10 +11,13 @@ class PerformanceMetrics(BaseModel):
     timestamp: Optional[str] = None
     user_agent: Optional[str] = None
     connection_type: Optional[str] = None
+    referrer: Optional[str] = None  # Previous page, for the navigation model
 
 class PerformanceReport(BaseModel):
     metrics: PerformanceMetrics
     score: Dict[str, str]  # "good", "needs-improvement", "poor"
     recommendations: List[str]
     historical_trend: Optional[Dict[str, Any]] = None
-
+    sampled: bool = True  # False if the beacon was dropped by adaptive sampling
+    sample_rate: float = 1.0  # Rate the beacon was sampled at (weight = 1 / rate)
+    degraded: bool = False  # True if report/trend work was shed under load
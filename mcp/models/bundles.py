@@ -4,6 +4,7 @@ from typing import List, Dict, Optional
 class BundleAnalysisRequest(BaseModel):
     build_output: str  # Path to build output or bundle stats JSON
     threshold_kb: int = 100  # Alert threshold in KB
+    build_dir: Optional[str] = None  # Build directory with a Vite manifest, enables route-level analysis
 
 class ChunkAnalysis(BaseModel):
     name: str
@@ -13,6 +14,24 @@ class ChunkAnalysis(BaseModel):
     can_split: bool
     split_recommendations: List[str]
 
+class DuplicateModule(BaseModel):
+    name: str
+    chunks: List[str]  # Chunks that ship a copy of the module
+    size_bytes: int
+    wasted_bytes: int  # size_bytes * (copies - 1)
+
+class RouteCost(BaseModel):
+    path: str
+    component: str
+    module: str
+    chunk: str  # Manifest key of the route's page chunk
+    js_bytes: int  # JS required to render the route, entry included
+    css_bytes: int
+    total_bytes: int
+    gzip_bytes: int
+    chunk_count: int
+    files: List[str] = []  # JS/CSS files the route loads
+
 class BundleAnalysisResponse(BaseModel):
     total_size_kb: float
     total_gzipped_kb: float
@@ -20,4 +39,12 @@ class BundleAnalysisResponse(BaseModel):
     large_chunks: List[ChunkAnalysis]
     recommendations: List[str]
     lazy_load_candidates: List[str]
+    duplicate_modules: List[DuplicateModule] = []
+    duplicated_bytes: int = 0
+    route_costs: List[RouteCost] = []
 
+class BundleBaselineRequest(BaseModel):
+    sha: Optional[str] = None  # Git SHA to store under (defaults to HEAD)
+    build_dir: str = "dist"  # Build directory to analyze
+    build_output: Optional[str] = None  # Bundle stats path or JSON, used instead of build_dir
+    threshold_kb: int = 100
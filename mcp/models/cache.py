@@ -4,15 +4,19 @@ from typing import List, Dict, Optional
 class CacheStrategyRequest(BaseModel):
     asset_types: List[str]  # static, html, api, images, fonts, css, js
     platform: str = "vercel"  # vercel, netlify, cloudflare, custom
+    build_dir: Optional[str] = None  # Emit exact per-file rules for this build
 
 class CacheRule(BaseModel):
     pattern: str  # URL pattern or file extension
     cache_control: str  # Cache-Control header value
     etag: bool = True
     last_modified: bool = True
+    fingerprinted: Optional[bool] = None  # Set for per-file build rules
+    verified_by: Optional[str] = None  # content or manifest-attested, for fingerprinted build files
 
 class CacheStrategyResponse(BaseModel):
     rules: List[CacheRule]
-    config: Dict[str, Any]  # Platform-specific config (vercel.json, netlify.toml, etc.)
+    config: Dict  # Platform-specific config (vercel.json, netlify.toml, etc.)
     recommendations: List[str]
+    build_id: Optional[str] = None  # Build the per-file rules were generated for
 
@@ -6,6 +6,11 @@ class ContentAnalysisRequest(BaseModel):
     page_type: str  # homepage, about, case-study, blog-post, etc.
     target_keywords: Optional[List[str]] = None
 
+class SiteContentRequest(BaseModel):
+    roots: Optional[List[str]] = None  # Directories to walk, relative to the repo root (default: content, src/pages)
+    target_keywords: Optional[List[str]] = None
+    max_workers: Optional[int] = None  # Process pool size (default: CPU count)
+
 class ContentMetrics(BaseModel):
     word_count: int
     reading_time_minutes: float
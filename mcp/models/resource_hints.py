@@ -11,11 +11,18 @@ class ResourceHint(BaseModel):
 class ResourceHintsRequest(BaseModel):
     page_url: str
     critical_resources: List[str]  # URLs of critical resources
-    next_pages: Optional[List[str]] = None  # URLs of likely next pages
+    next_pages: Optional[List[str]] = None  # URLs of likely next pages (predicted from analytics if omitted)
+    prefetch_threshold: Optional[float] = None  # Minimum confidence for predicted next pages
+    build_dir: Optional[str] = None  # Read resource sizes from here and optimize preloads
+    connection_type: Optional[str] = None  # slow-2g, 2g, 3g, 4g or desktop (default 4g)
+    connection_profiles: Optional[List[str]] = None  # Extra profiles to optimize for
     external_domains: Optional[List[str]] = None  # External domains to preconnect
 
 class ResourceHintsResponse(BaseModel):
     hints: List[ResourceHint]
     html_tags: List[str]  # Ready-to-use HTML tags
     priority_order: List[str]  # Order of importance
+    link_headers: List[str] = []  # The same hints as HTTP Link header values
+    expected_critical_bytes: Optional[int] = None  # Bytes of the chosen preloads
+    profiles: Optional[Dict[str, Dict]] = None  # Preload choice per connection profile
 
@@ -1,4 +1,5 @@
-# MCP Routes Package
+"""
+MCP Routes Package
 
 This package contains all FastAPI route handlers for the MCP Optimization Server.
-
+"""
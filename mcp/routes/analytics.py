@@ -1,40 +1,67 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from mcp.models.analytics import PerformanceMetrics, PerformanceReport
 from mcp.utils.performance_analyzer import analyze_performance, store_metrics, get_historical_trend
+from mcp.utils.load_shedder import shedder
+from mcp.utils.metrics_store import MetricsStore
+from mcp.utils.metrics_export import EXPORT_FORMATS, stream_export, pa
+from mcp.utils.navigation_model import PREFETCH_THRESHOLD, navigation_model
+from typing import Optional
 import json
+import os
 from datetime import datetime
 
 router = APIRouter()
 
 # In-memory storage (replace with database in production)
-metrics_store = []
+# Keep only the last MCP_METRICS_CAPACITY entries (default 1000)
+metrics_store = MetricsStore(capacity=int(os.environ.get("MCP_METRICS_CAPACITY", 1000)))
 
 @router.post("/performance-report", response_model=PerformanceReport)
 async def generate_performance_report(metrics: PerformanceMetrics):
     """
     Analyze performance metrics and generate optimization recommendations
+
+    Under load, beacons are sampled per URL (the rate is stored with each
+    sample) and trend lookup, then report building, are shed. In-flight
+    requests are counted app-wide by InFlightMiddleware.
     """
     try:
-        # Store metrics with timestamp
-        metrics_dict = metrics.dict()
-        metrics_dict['timestamp'] = datetime.now().isoformat()
-        metrics_store.append(metrics_dict)
+        admitted, sample_rate = shedder.admit(metrics.url)
+
+        if admitted:
+            # Store metrics with timestamp and the rate they were kept at
+            metrics_dict = metrics.dict()
+            metrics_dict['sample_rate'] = sample_rate
+            metrics_store.append(metrics_dict)
+            if metrics.referrer:
+                navigation_model.record(metrics.referrer, metrics.url, weight=1 / sample_rate)
 
-        # Keep only last 1000 entries
-        if len(metrics_store) > 1000:
-            metrics_store.pop(0)
+        if shedder.should_shed("report"):
+            return PerformanceReport(
+                metrics=metrics,
+                score={},
+                recommendations=[],
+                sampled=admitted,
+                sample_rate=sample_rate,
+                degraded=True
+            )
 
         # Analyze performance
         analysis = analyze_performance(metrics)
 
         # Get historical trend
-        historical = get_historical_trend(metrics.url)
+        degraded = shedder.should_shed("trend")
+        historical = None if degraded else get_historical_trend(metrics.url)
 
         return PerformanceReport(
             metrics=metrics,
             score=analysis['score'],
             recommendations=analysis['recommendations'],
-            historical_trend=historical
+            historical_trend=historical,
+            sampled=admitted,
+            sample_rate=sample_rate,
+            degraded=degraded
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -43,9 +70,16 @@ async def generate_performance_report(metrics: PerformanceMetrics):
 async def get_metrics(url: str):
     """
     Get historical metrics for a URL
+
+    estimated_count re-weights each stored sample by 1 / sample_rate.
     """
     url_metrics = [m for m in metrics_store if m.get('url') == url]
-    return {"metrics": url_metrics, "count": len(url_metrics)}
+    estimated_count = sum(1 / m.get('sample_rate', 1.0) for m in url_metrics)
+    return {
+        "metrics": url_metrics,
+        "count": len(url_metrics),
+        "estimated_count": round(estimated_count, 1)
+    }
 
 @router.get("/trends/{url}")
 async def get_trends(url: str):
@@ -55,3 +89,51 @@ async def get_trends(url: str):
     trend = get_historical_trend(url)
     return trend
 
+@router.get("/next-pages")
+async def get_next_pages(url: str, k: int = 3, threshold: float = PREFETCH_THRESHOLD):
+    """
+    Pages most likely to be visited after `url`, from the navigation model
+    built from beacon referrers (only those above the confidence threshold)
+    """
+    return {
+        "url": url,
+        "predictions": navigation_model.predict(url, k, threshold),
+        "model": navigation_model.stats()
+    }
+
+@router.get("/ingest-status")
+async def get_ingest_status():
+    """
+    Get current ingest load, sampling and shedding state
+    """
+    return shedder.status()
+
+@router.get("/export")
+async def export_metrics(
+    format: str = "arrow",
+    url_prefix: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    batch_size: int = 65536
+):
+    """
+    Stream stored samples as Arrow IPC or Parquet for notebooks
+
+    URL prefix and time range filters are applied by the store before any
+    rows are encoded; output is written one record batch at a time.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if pa is None:
+        raise HTTPException(status_code=501, detail="Metrics export requires pyarrow: pip install pyarrow")
+
+    rows = metrics_store.scan(url_prefix=url_prefix, since=since, until=until)
+    extension = "arrows" if format == "arrow" else "parquet"
+    return StreamingResponse(
+        stream_export(rows, format, max(1, batch_size)),
+        media_type=EXPORT_FORMATS[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="metrics.{extension}"',
+            "X-Row-Count": str(len(rows))
+        }
+    )
@@ -1,11 +1,28 @@
-from fastapi import APIRouter, HTTPException
-from mcp.models.bundles import BundleAnalysisRequest, BundleAnalysisResponse
-from mcp.utils.bundle_analyzer import analyze_bundle
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from mcp.models.bundles import BundleAnalysisRequest, BundleAnalysisResponse, BundleBaselineRequest
+from mcp.utils.bundle_analyzer import analyze_bundle, iter_bundle_chunks
+from typing import Optional
+import asyncio
 import json
 import os
 
 router = APIRouter()
 
+def analyze_bundle_output(build_output: str, threshold_kb: int, build_dir: Optional[str] = None):
+    """
+    Analyze bundle stats from a file path (stream-parsed chunk by chunk)
+    or an inline JSON string
+    """
+    critical_path = None
+    if build_dir:
+        from mcp.utils.manifest_graph import analyze_critical_path
+        critical_path = analyze_critical_path(build_dir)
+
+    if os.path.exists(build_output):
+        with open(build_output, 'r') as f:
+            return analyze_bundle(iter_bundle_chunks(f), threshold_kb, critical_path)
+    return analyze_bundle(json.loads(build_output), threshold_kb, critical_path)
+
 @router.post("/analyze-bundle", response_model=BundleAnalysisResponse)
 async def analyze_bundle_endpoint(request: BundleAnalysisRequest):
     """
@@ -13,14 +30,7 @@ async def analyze_bundle_endpoint(request: BundleAnalysisRequest):
     Suggest lazy loading candidates
     """
     try:
-        # Check if build_output is a file path or JSON string
-        if os.path.exists(request.build_output):
-            with open(request.build_output, 'r') as f:
-                bundle_data = json.load(f)
-        else:
-            bundle_data = json.loads(request.build_output)
-
-        analysis = analyze_bundle(bundle_data, request.threshold_kb)
+        analysis = analyze_bundle_output(request.build_output, request.threshold_kb, request.build_dir)
         return BundleAnalysisResponse(**analysis)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Bundle analysis failed: {str(e)}")
@@ -37,3 +47,135 @@ async def analyze_build_output(build_dir: str = "dist"):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/critical-path")
+async def critical_path(build_dir: str = "dist"):
+    """
+    JS/CSS bytes each entry and route transitively requires, from the Vite
+    manifest import graph, plus startup chunks only one route needs
+    """
+    try:
+        from mcp.utils.manifest_graph import analyze_critical_path
+        analysis = analyze_critical_path(build_dir)
+        if "error" in analysis:
+            raise HTTPException(status_code=404, detail=analysis["error"])
+        return analysis
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/budgets")
+async def check_budgets(build_dir: str = "dist", budgets_file: Optional[str] = None):
+    """
+    Check a build against the performance budgets file. Only budgets whose
+    assets changed since the last check are recomputed.
+    """
+    try:
+        from mcp.utils.budgets import evaluate_budgets
+        result = evaluate_budgets(build_dir, budgets_file)
+        if "error" in result:
+            raise HTTPException(status_code=404, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"Budgets file not found: {e.filename}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.websocket("/watch")
+async def watch_build(websocket: WebSocket, build_dir: str = "dist"):
+    """
+    Stream bundle analysis for a build directory: a snapshot on connect,
+    then a diff (added/removed/changed files, totals) after every rebuild
+    """
+    from mcp.utils.build_watcher import get_watcher
+
+    await websocket.accept()
+    watcher = get_watcher(build_dir)
+    queue = await watcher.subscribe()
+
+    async def forward():
+        await websocket.send_json(watcher.snapshot())
+        while True:
+            await websocket.send_json(await queue.get())
+
+    sender = asyncio.create_task(forward())
+    try:
+        # Reading is what notices the client going away
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        await watcher.unsubscribe(queue)
+
+@router.get("/source-map-attribution")
+async def source_map_attribution(build_dir: str = "dist"):
+    """
+    Attribute built chunk bytes to source files and node_modules packages
+    using the .map files next to each chunk
+    """
+    try:
+        from mcp.utils.source_maps import attribute_build_directory
+        return attribute_build_directory(build_dir)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/baselines")
+async def store_bundle_baseline(request: BundleBaselineRequest):
+    """
+    Analyze a build (or bundle stats) and store its summary under a git SHA
+    """
+    try:
+        from mcp.utils.bundle_analyzer import analyze_build_directory
+        from mcp.utils.bundle_baselines import current_git_sha, save_baseline, summarize_analysis
+        from mcp.utils.source_maps import attribute_build_directory
+
+        sha = request.sha or current_git_sha()
+        if request.build_output:
+            analysis = analyze_bundle_output(request.build_output, request.threshold_kb)
+            summary = summarize_analysis(analysis)
+            source = "bundle-stats"
+        else:
+            analysis = analyze_build_directory(request.build_dir)
+            if "error" in analysis:
+                raise HTTPException(status_code=404, detail=analysis["error"])
+            summary = summarize_analysis(
+                analysis,
+                build_dir=request.build_dir,
+                attribution=attribute_build_directory(request.build_dir)
+            )
+            source = request.build_dir
+
+        return save_baseline(sha, summary, source)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/baselines")
+async def list_bundle_baselines():
+    """
+    List stored bundle baselines, newest first
+    """
+    from mcp.utils.bundle_baselines import list_baselines
+    return {"baselines": list_baselines()}
+
+@router.get("/diff")
+async def diff_bundles(base: str, head: Optional[str] = None):
+    """
+    Compare two stored baselines (e.g. main vs a PR build): added, removed,
+    grown and shrunk chunks and modules with raw and compressed deltas
+    """
+    try:
+        from mcp.utils.bundle_baselines import current_git_sha, diff_summaries, load_baseline, resolve_sha
+
+        head = head or current_git_sha()
+        diff = diff_summaries(load_baseline(base), load_baseline(head))
+        return {"base": resolve_sha(base), "head": resolve_sha(head), **diff}
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,32 +1,75 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from mcp.models.cache import CacheStrategyRequest, CacheStrategyResponse
-from mcp.utils.cache_optimizer import generate_cache_strategy
+from mcp.utils.cache_optimizer import generate_cache_strategy, get_platform_config
+from mcp.utils.response_cache import memoize_response, response_cache
+from typing import Any, Dict, List, Optional
 
 router = APIRouter()
 
+@memoize_response("/cache/generate-strategy", ttl_seconds=86400)
+async def _cache_strategy(request: CacheStrategyRequest) -> CacheStrategyResponse:
+    result = generate_cache_strategy(
+        asset_types=request.asset_types,
+        platform=request.platform
+    )
+    return CacheStrategyResponse(**result)
+
 @router.post("/generate-strategy", response_model=CacheStrategyResponse)
 async def generate_cache_strategy_endpoint(request: CacheStrategyRequest):
     """
     Generate optimal cache headers for different asset types
+
+    With build_dir, emits exact per-file rules for that build (cached per
+    build ID) instead of the generic patterns
     """
     try:
-        result = generate_cache_strategy(
-            asset_types=request.asset_types,
-            platform=request.platform
-        )
+        if not request.build_dir:
+            return await _cache_strategy(request)
+        result = generate_cache_strategy(request.asset_types, request.platform, request.build_dir)
+        if "error" in result:
+            raise HTTPException(status_code=404, detail=result["error"])
         return CacheStrategyResponse(**result)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@memoize_response("/cache/platform-config", ttl_seconds=86400)
+async def _platform_config(platform: str) -> Dict[str, Any]:
+    return get_platform_config(platform)
+
 @router.get("/platform-config/{platform}")
-async def get_platform_config(platform: str):
+async def get_platform_config_endpoint(
+    platform: str,
+    build_dir: Optional[str] = None,
+    pages: Optional[List[str]] = Query(None)
+):
     """
     Get cache configuration for a specific platform
+
+    With build_dir, resource hints for each page (default "/") are derived
+    from the build output and merged in as Link headers: Netlify _headers,
+    vercel.json headers, or Cloudflare rules that trigger 103 Early Hints
     """
     try:
-        from mcp.utils.cache_optimizer import get_platform_config
-        config = get_platform_config(platform)
-        return config
+        if not build_dir:
+            return await _platform_config(platform)
+        from mcp.utils.resource_hints import page_link_headers
+        return get_platform_config(platform, page_link_headers(pages or ["/"], build_dir))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/memoization-stats")
+async def get_memoization_stats():
+    """
+    Hit/miss counters for memoized analysis endpoints
+    """
+    return response_cache.stats()
+
+@router.delete("/memoization")
+async def clear_memoization():
+    """
+    Drop all memoized endpoint responses
+    """
+    response_cache.clear()
+    return {"cleared": True}
@@ -1,10 +1,15 @@
 from fastapi import APIRouter, HTTPException
-from mcp.models.content import ContentAnalysisRequest, ContentAnalysisResponse
+from fastapi.responses import StreamingResponse
+from mcp.models.content import ContentAnalysisRequest, ContentAnalysisResponse, SiteContentRequest
 from mcp.utils.content_analyzer import analyze_content
+from mcp.utils.response_cache import memoize_response
+from typing import Optional
+import json
 
 router = APIRouter()
 
 @router.post("/analyze-content", response_model=ContentAnalysisResponse)
+@memoize_response("/content/analyze-content", ttl_seconds=600)
 async def analyze_content_endpoint(request: ContentAnalysisRequest):
     """
     Analyze content for readability, SEO, and engagement
@@ -25,6 +30,7 @@ async def suggest_content_improvements(request: ContentAnalysisRequest):
     Get specific suggestions for improving content
     """
     try:
+        # Shares the memoized analysis with /analyze-content
         analysis = await analyze_content_endpoint(request)
         # Extract and format suggestions
         suggestions = {
@@ -37,3 +43,37 @@ async def suggest_content_improvements(request: ContentAnalysisRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/analyze-site")
+async def analyze_site(request: SiteContentRequest):
+    """
+    Analyze every page under content/ and src/pages in a process pool.
+    Streams NDJSON: one line per page, then a site summary line.
+    Results are cached by content hash, so reruns only analyze edited pages.
+    """
+    try:
+        from mcp.utils.site_content import iter_site_analysis
+
+        lines = (
+            json.dumps(result) + "\n"
+            for result in iter_site_analysis(request.roots, request.target_keywords, request.max_workers)
+        )
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/near-duplicates")
+async def near_duplicate_content(threshold: float = 0.7, path: Optional[str] = None):
+    """
+    Near-duplicate pages from the MinHash/LSH index (updated incrementally
+    for changed pages first). Returns clusters with Jaccard estimates, or
+    the pages similar to one `path` when given.
+    """
+    try:
+        from mcp.utils.near_duplicates import site_index, sync_site_index
+
+        sync = sync_site_index()
+        if path:
+            return {**sync, "path": path, "similar": site_index().similar(path, threshold)}
+        return {**sync, "clusters": site_index().clusters(threshold)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
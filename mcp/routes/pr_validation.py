@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 router = APIRouter()
 
@@ -9,11 +9,14 @@ class PRValidationRequest(BaseModel):
     pr_body: str
     linked_issues: List[str] = []
     checklist_completed: bool = False
+    build_dir: Optional[str] = None  # Check this build against the performance budgets
+    budgets_file: Optional[str] = None
 
 class PRValidationResponse(BaseModel):
     valid: bool
     errors: List[str] = []
     warnings: List[str] = []
+    budgets: Optional[Dict] = None
 
 @router.post("/validate", response_model=PRValidationResponse)
 async def validate_pr(request: PRValidationRequest):
@@ -52,12 +55,33 @@ async def validate_pr(request: PRValidationRequest):
     if 'accessibility' not in request.pr_body.lower() and 'a11y' not in request.pr_body.lower():
         warnings.append("Consider mentioning accessibility impact")
     
+    # Check performance budgets against the PR's build
+    budgets = None
+    if request.build_dir:
+        from mcp.utils.budgets import evaluate_budgets
+        try:
+            budgets = evaluate_budgets(request.build_dir, request.budgets_file)
+        except FileNotFoundError as e:
+            budgets = {"error": f"Budgets file not found: {e.filename}"}
+        if "error" in budgets:
+            warnings.append(f"Performance budgets not checked: {budgets['error']}")
+        else:
+            for failure in budgets["failures"]:
+                if failure.get("error"):
+                    warnings.append(f"Budget {failure['id']} not checked: {failure['error']}")
+                else:
+                    errors.append(
+                        f"Budget {failure['id']} exceeded: {failure['actual']} > {failure['limit']} "
+                        f"(+{failure['overage']}, {failure['overage_percent']}%)"
+                    )
+    
     valid = len(errors) == 0
     
     return PRValidationResponse(
         valid=valid,
         errors=errors,
-        warnings=warnings
+        warnings=warnings,
+        budgets=budgets
     )
 
 @router.post("/check-scope")
@@ -1,29 +1,50 @@
 from fastapi import APIRouter, HTTPException
 from mcp.models.resource_hints import ResourceHintsRequest, ResourceHintsResponse
+from mcp.utils.navigation_model import PREFETCH_THRESHOLD, navigation_model
 from mcp.utils.resource_hints import generate_resource_hints
+from mcp.utils.response_cache import memoize_response
 
 router = APIRouter()
 
+@memoize_response("/resource-hints/generate-hints", ttl_seconds=3600)
+async def _generate_hints(request: ResourceHintsRequest) -> ResourceHintsResponse:
+    return ResourceHintsResponse(**generate_resource_hints(request))
+
 @router.post("/generate-hints", response_model=ResourceHintsResponse)
 async def generate_resource_hints_endpoint(request: ResourceHintsRequest):
     """
     Analyze page and generate optimal resource hints
+
+    When next_pages is omitted, pages to prefetch are predicted from the
+    navigation model built from analytics referrers.
     """
     try:
-        result = generate_resource_hints(request)
-        return ResourceHintsResponse(**result)
+        if request.next_pages is None:
+            threshold = request.prefetch_threshold
+            if threshold is None:
+                threshold = PREFETCH_THRESHOLD
+            request = request.copy(update={"next_pages": navigation_model.next_pages(request.page_url, threshold=threshold)})
+        if request.build_dir:
+            # Sizes come from the build directory, which can change under the same request
+            return ResourceHintsResponse(**generate_resource_hints(request))
+        return await _generate_hints(request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/analyze-page")
-async def analyze_page_for_hints(page_url: str):
+@router.post("/analyze-page", response_model=ResourceHintsResponse)
+async def analyze_page_for_hints(page_url: str, build_dir: str = "dist"):
     """
-    Analyze a page URL and automatically detect resource hints
+    Derive resource hints for a page from its built HTML and the Vite
+    manifest: blocking CSS, fonts, LCP images, entry JS and its imports,
+    ordered by critical-path position and size
     """
     try:
         from mcp.utils.resource_hints import analyze_page_resources
-        hints = analyze_page_resources(page_url)
-        return hints
+        hints = analyze_page_resources(page_url, build_dir)
+        if "error" in hints:
+            raise HTTPException(status_code=404, detail=hints["error"])
+        return ResourceHintsResponse(**hints)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-
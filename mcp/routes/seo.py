@@ -1,10 +1,15 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from mcp.models.seo import PageData, SEOMetaResponse
+from mcp.utils.response_cache import memoize_response
 from mcp.utils.seo_generator import generate_seo_meta, validate_seo
+from typing import Optional
+import json
 
 router = APIRouter()
 
 @router.post("/generate-meta", response_model=SEOMetaResponse)
+@memoize_response("/seo/generate-meta", ttl_seconds=3600)
 async def generate_seo_meta_tags(page_data: PageData):
     """
     Generate optimized meta tags, Open Graph, Twitter Cards, and structured data
@@ -16,6 +21,7 @@ async def generate_seo_meta_tags(page_data: PageData):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/validate")
+@memoize_response("/seo/validate", ttl_seconds=3600)
 async def validate_seo_tags(page_data: PageData):
     """
     Validate SEO tags against best practices
@@ -26,15 +32,203 @@ async def validate_seo_tags(page_data: PageData):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/render-head")
+async def render_head_snippet(meta: SEOMetaResponse):
+    """
+    Render a /generate-meta result as an HTML <head> fragment
+    """
+    try:
+        from mcp.utils.head_renderer import render_head_bytes
+        return Response(render_head_bytes(meta), media_type="text/html; charset=utf-8")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/render-head-bulk")
+async def render_head_snippets(metas: list[SEOMetaResponse]):
+    """
+    Render many /generate-meta results; streams NDJSON lines of
+    {"index", "html"} in request order
+    """
+    try:
+        from mcp.utils.head_renderer import render_head
+        lines = (
+            json.dumps({"index": index, "html": render_head(meta)}) + "\n"
+            for index, meta in enumerate(metas)
+        )
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/render-head/cache-stats")
+async def render_head_cache_stats():
+    """
+    Hit/miss counters and size of the rendered <head> LRU cache
+    """
+    from mcp.utils.head_renderer import render_cache_info
+    return render_cache_info()
+
+async def _bulk_seo_response(request: Request, include_meta: bool) -> StreamingResponse:
+    """
+    NDJSON results for a JSON array or NDJSON (application/x-ndjson) body
+    """
+    from mcp.utils.seo_bulk import iter_bulk_seo, iter_ndjson
+
+    if "ndjson" in request.headers.get("content-type", ""):
+        # Decoded line by line as the body arrives; the body has to be fully
+        # read before the streaming response starts
+        pages = [page async for page in iter_ndjson(request.stream())]
+        lines = (json.dumps(result) + "\n" for result in iter_bulk_seo(pages, include_meta))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    try:
+        pages = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(pages, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    lines = (json.dumps(result) + "\n" for result in iter_bulk_seo(pages, include_meta))
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+@router.post("/validate-bulk")
+async def validate_seo_bulk(request: Request):
+    """
+    Validate many pages in one request, including duplicate titles and
+    descriptions across pages. Streams NDJSON: one line per page, then a
+    summary line.
+    """
+    try:
+        return await _bulk_seo_response(request, include_meta=False)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/generate-meta-bulk")
+async def generate_seo_meta_bulk(request: Request):
+    """
+    Generate meta tags for many pages in one request, with the same
+    per-page and cross-page validation as /validate-bulk
+    """
+    try:
+        return await _bulk_seo_response(request, include_meta=True)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def _sitemap_pages(request: Request):
+    """
+    PageData for each page of a JSON array or NDJSON (application/x-ndjson)
+    body; NDJSON pages are decoded as the body arrives
+    """
+    from mcp.utils.seo_bulk import iter_ndjson
+
+    if "ndjson" in request.headers.get("content-type", ""):
+        items = iter_ndjson(request.stream())
+    else:
+        try:
+            pages = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        if not isinstance(pages, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+
+        async def iter_list():
+            for page in pages:
+                yield page
+        items = iter_list()
+
+    index = 0
+    async for item in items:
+        try:
+            if isinstance(item, ValueError):
+                raise item
+            yield PageData(**item)
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=f"Page {index}: {e}")
+        index += 1
+
 @router.post("/generate-sitemap")
-async def generate_sitemap(pages: list[PageData]):
+async def generate_sitemap(
+    request: Request,
+    gzip: bool = False,
+    output_dir: Optional[str] = None,
+    base_url: str = "",
+    response_format: str = "json"
+):
     """
-    Generate sitemap.xml from list of pages
+    Generate sitemap.xml from a JSON array or NDJSON body of pages
+
+    Returns {"sitemap": xml}; response_format=xml streams the XML as the
+    response body instead (gzip-compressed with gzip). With output_dir it
+    writes to disk, splitting into a sitemap index past 50,000 URLs / 50 MB, which
+    requires an absolute base_url. Only an NDJSON body is written to disk
+    as it arrives; a JSON array is parsed in full first.
     """
     try:
-        from mcp.utils.seo_generator import generate_sitemap_xml
-        sitemap = generate_sitemap_xml(pages)
-        return {"sitemap": sitemap}
+        from mcp.utils.seo_generator import (
+            SITEMAP_MAX_URLS, SitemapWriter, generate_sitemap_xml, gzip_chunks, iter_sitemap_xml
+        )
+        if response_format not in ("xml", "json"):
+            raise HTTPException(status_code=400, detail="response_format must be xml or json")
+        if gzip and response_format == "json" and not output_dir:
+            raise HTTPException(status_code=400, detail="gzip requires response_format=xml or output_dir")
+
+        if output_dir:
+            try:
+                writer = SitemapWriter(output_dir, base_url=base_url, compress=gzip)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            try:
+                async for page in _sitemap_pages(request):
+                    writer.add(page)
+            except ValueError as e:
+                writer.discard()
+                raise HTTPException(status_code=400, detail=str(e))
+            except BaseException:
+                writer.discard()
+                raise
+            return writer.close()
+
+        # A single response is one sitemap, so at most SITEMAP_MAX_URLS pages are held
+        pages = []
+        async for page in _sitemap_pages(request):
+            if len(pages) == SITEMAP_MAX_URLS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"More than {SITEMAP_MAX_URLS} URLs; pass output_dir to write a sharded sitemap index"
+                )
+            pages.append(page)
+        if response_format == "json":
+            return {"sitemap": generate_sitemap_xml(pages)}
+        if gzip:
+            return StreamingResponse(
+                gzip_chunks(iter_sitemap_xml(pages)),
+                media_type="application/xml",
+                headers={"Content-Encoding": "gzip"}
+            )
+        return StreamingResponse(iter_sitemap_xml(pages), media_type="application/xml")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/audit-build")
+async def audit_build(build_dir: str = "dist", base_url: str = "", max_workers: Optional[int] = None):
+    """
+    Offline SEO audit of every HTML file in the build output: head tags are
+    extracted and validated in a process pool, cached per file hash.
+    Streams NDJSON: one line per page, then a site summary line.
+    """
+    try:
+        import os
+        from mcp.utils.head_crawler import iter_head_audit
+
+        if not os.path.isdir(build_dir):
+            raise HTTPException(status_code=404, detail=f"Build directory not found: {build_dir}")
+        lines = (json.dumps(result) + "\n" for result in iter_head_audit(build_dir, base_url, max_workers))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
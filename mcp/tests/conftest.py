@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the MCP server tests
+"""
+
+import os
+import tempfile
+
+# Persistent caches are created at import time, so point them at a scratch
+# directory before any mcp.utils module is imported
+os.environ.setdefault("MCP_CACHE_DIR", tempfile.mkdtemp(prefix="mcp-cache-"))
+
+import pytest
+
+@pytest.fixture
+def write_file(tmp_path):
+    """
+    Write a file under tmp_path, creating parent directories
+    """
+    def write(relative: str, content="") -> str:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        return str(path)
+    return write
+
+def hashed_name(stem: str, extension: str, content: str) -> str:
+    """
+    Vite-style file name whose 8-character token is a base64url sha256 prefix of the content
+    """
+    import base64
+    import hashlib
+    token = base64.urlsafe_b64encode(hashlib.sha256(content.encode("utf-8")).digest()).decode("ascii")[:8]
+    return f"{stem}-{token}{extension}"
+
+@pytest.fixture
+def vite_build(tmp_path):
+    """
+    Small Vite build with a manifest and a lazy-route AppRouter.tsx:
+    the entry statically imports a vendor chunk and a chart library that
+    only the /work route uses
+    """
+    import json
+
+    sources = {
+        "vendor": "export const React = {};\n" * 200,
+        "chart": "export function drawChart() { return 42; }\n" * 150,
+        "entry": "import './vendor.js';\nimport './chart.js';\nconsole.log('app');\n" * 20,
+        "about": "export default function About() { return 'about'; }\n" * 30,
+        "work": "import { drawChart } from './chart.js';\nexport default drawChart;\n" * 40,
+        "css": "body { margin: 0; font-family: Inter; }\n" * 60,
+        "font": "wOF2" + "f" * 4000
+    }
+    files = {
+        "vendor": hashed_name("assets/vendor", ".js", sources["vendor"]),
+        "chart": hashed_name("assets/chart", ".js", sources["chart"]),
+        "entry": hashed_name("assets/index", ".js", sources["entry"]),
+        "about": hashed_name("assets/About", ".js", sources["about"]),
+        "work": hashed_name("assets/Work", ".js", sources["work"]),
+        "css": hashed_name("assets/index", ".css", sources["css"]),
+        "font": hashed_name("assets/inter", ".woff2", sources["font"])
+    }
+    sources["css"] = f"@font-face {{ font-family: Inter; src: url(/{files['font']}) format('woff2'); }}\n" + sources["css"]
+    manifest = {
+        "index.html": {
+            "file": files["entry"], "src": "index.html", "isEntry": True,
+            "imports": ["_vendor.js", "_chart.js"],
+            "dynamicImports": ["src/pages/About.tsx", "src/pages/Work.tsx"],
+            "css": [files["css"]], "assets": [files["font"]]
+        },
+        "_vendor.js": {"file": files["vendor"]},
+        "_chart.js": {"file": files["chart"], "imports": ["_vendor.js"]},
+        "src/pages/About.tsx": {"file": files["about"], "src": "src/pages/About.tsx", "isDynamicEntry": True,
+                                "imports": ["_vendor.js"]},
+        "src/pages/Work.tsx": {"file": files["work"], "src": "src/pages/Work.tsx", "isDynamicEntry": True,
+                               "imports": ["_vendor.js", "_chart.js"]}
+    }
+    html = (
+        '<!doctype html><html lang="en"><head><meta charset="utf-8">'
+        f'<link rel="stylesheet" href="/{files["css"]}">'
+        f'<script type="module" crossorigin src="/{files["entry"]}"></script>'
+        '<link rel="preconnect" href="https://fonts.example.com">'
+        '</head><body><img src="/hero.webp" width="1200" height="600"><div id="root"></div></body></html>'
+    )
+
+    dist = tmp_path / "dist"
+    for key, name in files.items():
+        (dist / name).parent.mkdir(parents=True, exist_ok=True)
+        (dist / name).write_text(sources[key], encoding="utf-8")
+    (dist / ".vite").mkdir()
+    (dist / ".vite" / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    (dist / "index.html").write_text(html, encoding="utf-8")
+    (dist / "hero.webp").write_bytes(b"RIFF" + b"\0" * 30000)
+    (dist / "robots.txt").write_text("User-agent: *\n", encoding="utf-8")
+
+    router = tmp_path / "src" / "router" / "AppRouter.tsx"
+    router.parent.mkdir(parents=True)
+    router.write_text(
+        "const About = React.lazy(() => import('../pages/About'));\n"
+        "const Work = React.lazy(() => import('../pages/Work'));\n"
+        "<Routes>\n"
+        '  <Route path="/about" element={<About />} />\n'
+        '  <Route path="/work" element={<Work />} />\n'
+        "</Routes>\n",
+        encoding="utf-8"
+    )
+    return {"dir": str(dist), "router": str(router), "files": files, "manifest": manifest}
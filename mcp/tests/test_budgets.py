@@ -0,0 +1,74 @@
+"""
+Incremental performance budget evaluation
+"""
+
+import functools
+import json
+import os
+
+import pytest
+
+from mcp.utils import manifest_graph
+from mcp.utils.budgets import asset_type, evaluate_budgets
+
+@pytest.fixture
+def budgets(tmp_path, vite_build, monkeypatch):
+    monkeypatch.setattr(
+        manifest_graph, "analyze_critical_path",
+        functools.partial(manifest_graph.analyze_critical_path, router_path=vite_build["router"])
+    )
+    path = tmp_path / "budgets.json"
+    path.write_text(json.dumps({
+        "total": {"size_kb": 1000, "max_chunks": 10},
+        "asset_types": {"js": {"size_kb": 10}, "image": {"size_kb": 100}},
+        "routes": {"*": {"js_kb": 100}, "/work": {"js_kb": 5}}
+    }))
+    return str(path)
+
+def by_id(result):
+    return {check["id"]: check for check in result["budgets"]}
+
+def test_asset_types():
+    assert asset_type("assets/index-AbC12345.JS") == "js"
+    assert asset_type("inter.woff2") == "font"
+    assert asset_type("robots.txt") == "other"
+
+def test_failures_are_reported_with_overage(vite_build, budgets):
+    result = evaluate_budgets(vite_build["dir"], budgets)
+    checks = by_id(result)
+
+    assert not result["passed"]
+    assert checks["total.size_kb"]["passed"]
+    assert checks["total.max_chunks"]["actual"] == 6
+    assert not checks["type:js.size_kb"]["passed"]
+    assert checks["type:js.size_kb"]["overage"] > 0
+    assert checks["route:/about.js_kb"]["passed"]
+    assert not checks["route:/work.js_kb"]["passed"]
+    assert [check["id"] for check in result["failures"]] == ["route:/work.js_kb", "type:js.size_kb"]
+
+def test_unchanged_build_reuses_every_result(vite_build, budgets):
+    first = evaluate_budgets(vite_build["dir"], budgets)
+    second = evaluate_budgets(vite_build["dir"], budgets)
+    assert second["recomputed"] == 0
+    assert second["reused"] == first["checked"]
+    assert second["budgets"] == first["budgets"]
+
+def test_only_budgets_touching_changed_files_are_recomputed(vite_build, budgets):
+    evaluate_budgets(vite_build["dir"], budgets)
+    with open(os.path.join(vite_build["dir"], "hero.webp"), "ab") as f:
+        f.write(b"\0" * 4096)
+
+    result = evaluate_budgets(vite_build["dir"], budgets)
+    assert result["changed_files"] == ["hero.webp"]
+    # Totals and the image budget; js and route budgets are reused
+    assert result["recomputed"] == 3
+    assert by_id(result)["type:image.size_kb"]["actual"] > 29
+
+def test_route_budgets_recompute_when_their_chunk_changes(vite_build, budgets):
+    evaluate_budgets(vite_build["dir"], budgets)
+    with open(os.path.join(vite_build["dir"], vite_build["files"]["work"]), "a") as f:
+        f.write("export const extra = 1;\n" * 100)
+
+    result = evaluate_budgets(vite_build["dir"], budgets)
+    # Totals, the js budget and /work; /about does not load the Work chunk
+    assert result["recomputed"] == 4
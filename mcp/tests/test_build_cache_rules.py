@@ -0,0 +1,137 @@
+"""
+Exact per-file cache rules from the build output
+"""
+
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+
+from mcp.main import app
+from mcp.utils import build_cache_rules
+from mcp.utils.build_cache_rules import (
+    CLOUDFLARE_MAX_EXPRESSION, IMMUTABLE, REVALIDATE, SHORT_LIVED, build_platform_config, classify_file, generate_build_cache_rules,
+    is_vite_hash
+)
+
+def request(method: str, path: str, **kwargs):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(scenario())
+
+@pytest.fixture
+def build(vite_build, write_file):
+    """
+    The shared build plus a manifest chunk whose hash does not match its
+    bytes (as Rollup names JS chunks) and a hash-shaped stray file
+    """
+    write_file("dist/assets/legacy-Xy7Qz9Ab.js", "export const legacy = 1;\n")
+    write_file("dist/assets/stray-Q1w2E3r4.js", "export const stray = 1;\n")
+    manifest_path = os.path.join(vite_build["dir"], ".vite", "manifest.json")
+    manifest = dict(vite_build["manifest"], **{"_legacy.js": {"file": "assets/legacy-Xy7Qz9Ab.js"}})
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+    return vite_build
+
+def rules_by_path(result):
+    return {rule["pattern"]: rule for rule in result["rules"]}
+
+def test_hashes_are_checked_against_content_before_the_manifest(build):
+    files = build["files"]
+    emitted = {"/assets/legacy-Xy7Qz9Ab.js", f"/{files['font']}"}
+    font = classify_file(f"/{files['font']}", os.path.join(build["dir"], files["font"]), emitted)
+    assert font["verified_by"] == "content"
+    legacy = classify_file("/assets/legacy-Xy7Qz9Ab.js", os.path.join(build["dir"], "assets/legacy-Xy7Qz9Ab.js"), emitted)
+    assert legacy == {"fingerprinted": True, "verified_by": "manifest-attested", "token": "Xy7Qz9Ab"}
+    stray = classify_file("/assets/stray-Q1w2E3r4.js", os.path.join(build["dir"], "assets/stray-Q1w2E3r4.js"), emitted)
+    assert stray == {"fingerprinted": False, "verified_by": None, "token": "Q1w2E3r4"}
+
+def test_name_words_are_not_attested_by_the_manifest(build, write_file):
+    path = write_file("dist/assets/page-Settings.js", "export default {};\n")
+    emitted = {"/assets/page-Settings.js"}
+    assert classify_file("/assets/page-Settings.js", path, emitted) == {
+        "fingerprinted": False, "verified_by": None, "token": "Settings"
+    }
+    assert not is_vite_hash("Footer01")
+    assert not is_vite_hash("Settings")
+    assert is_vite_hash("Xy7Qz9Ab") and is_vite_hash("BwXk-3Zt") and is_vite_hash("4f9a2c1e7b")
+
+def test_every_file_gets_an_exact_rule(build):
+    files = build["files"]
+    result = generate_build_cache_rules(build["dir"])
+    rules = rules_by_path(result)
+    assert rules[f"/{files['entry']}"]["cache_control"] == IMMUTABLE
+    assert rules[f"/{files['entry']}"]["verified_by"] == "content"
+    assert rules["/assets/legacy-Xy7Qz9Ab.js"]["cache_control"] == IMMUTABLE
+    assert rules["/assets/stray-Q1w2E3r4.js"]["cache_control"] == SHORT_LIVED
+    assert rules["/hero.webp"]["cache_control"] == SHORT_LIVED
+    assert rules["/index.html"]["cache_control"] == rules["/"]["cache_control"] == REVALIDATE
+    assert rules["/robots.txt"]["cache_control"] == REVALIDATE
+    # The fixture CSS is named before its @font-face rule is prepended, and its
+    # token (jzaaKsRt) has no digit, "-" or "_", so the manifest cannot vouch for it
+    assert rules[f"/{files['css']}"]["verified_by"] is None
+    assert rules[f"/{files['css']}"]["cache_control"] == SHORT_LIVED
+    assert result["files"] == {
+        "fingerprinted": 7, "manifest_attested": 1, "unverified": 2, "plain": 1, "revalidate": 2
+    }
+
+def test_rules_are_cached_per_build_id(build, write_file):
+    assert build_cache_rules._cache.max_entries == build_cache_rules.MAX_CACHED_BUILDS
+    first = generate_build_cache_rules(build["dir"])
+    second = generate_build_cache_rules(build["dir"])
+    assert second["cached"] is True and second["build_id"] == first["build_id"]
+
+    write_file("dist/new-page.html", "<html></html>")
+    third = generate_build_cache_rules(build["dir"])
+    assert third["cached"] is False and third["build_id"] != first["build_id"]
+
+def test_platform_configs_use_exact_paths():
+    rules = [
+        {"pattern": "/a-Xy7Qz9Ab.js", "cache_control": IMMUTABLE},
+        {"pattern": "/index.html", "cache_control": REVALIDATE}
+    ]
+    assert build_platform_config("vercel", rules)["headers"][0]["source"] == "/a-Xy7Qz9Ab.js"
+    assert "/index.html\n  Cache-Control: " + REVALIDATE in build_platform_config("netlify", rules)["_headers"]
+    cloudflare = build_platform_config("cloudflare", rules)["cache_rules"]
+    assert cloudflare[0] == {"expression": 'http.request.uri.path in {"/a-Xy7Qz9Ab.js"}', "cache_ttl": 31536000}
+
+def test_cloudflare_rules_use_directory_prefixes_and_stay_under_the_length_limit():
+    rules = [{"pattern": f"/assets/chunk-{i:04d}Ab.js", "cache_control": IMMUTABLE} for i in range(2000)]
+    rules += [{"pattern": f"/media/photo-{i:04d}.jpg", "cache_control": SHORT_LIVED} for i in range(500)]
+    rules += [{"pattern": f"/media/banner-{i:04d}Ab.webp", "cache_control": IMMUTABLE} for i in range(500)]
+    rules += [
+        {"pattern": "/media/index.html", "cache_control": REVALIDATE},
+        {"pattern": "/index.html", "cache_control": REVALIDATE}
+    ]
+    cache_rules = build_platform_config("cloudflare", rules)["cache_rules"]
+    assert {"expression": 'starts_with(http.request.uri.path, "/assets/")', "cache_ttl": 31536000} in cache_rules
+    assert all(len(rule["expression"]) <= CLOUDFLARE_MAX_EXPRESSION for rule in cache_rules)
+
+    # Every path is matched by exactly one rule, with its own policy's TTL
+    listed = {}
+    for rule in cache_rules:
+        if rule["expression"].startswith("http.request.uri.path in {"):
+            for path in rule["expression"][len("http.request.uri.path in {"):-1].split(" "):
+                listed[path.strip('"')] = rule["cache_ttl"]
+    assert len(listed) == 1002
+    assert listed["/media/photo-0001.jpg"] == 3600
+    assert listed["/media/banner-0001Ab.webp"] == 31536000
+    assert listed["/index.html"] == 0
+
+def test_strategy_route_reports_how_hashes_were_checked(build):
+    response = request(
+        "POST", "/cache/generate-strategy",
+        json={"asset_types": ["js"], "platform": "vercel", "build_dir": build["dir"]}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    rules = rules_by_path(body)
+    assert rules["/assets/legacy-Xy7Qz9Ab.js"]["verified_by"] == "manifest-attested"
+    assert any("trusted from the Vite manifest" in line for line in body["recommendations"])
+    assert request(
+        "POST", "/cache/generate-strategy", json={"asset_types": ["js"], "build_dir": "/nonexistent"}
+    ).status_code == 404
@@ -0,0 +1,120 @@
+"""
+Build watcher incremental refresh and the watch loop
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from mcp.utils import build_watcher
+from mcp.utils.build_watcher import BuildWatcher
+
+@pytest.fixture
+def dist(tmp_path, write_file):
+    write_file("dist/assets/index-AbC12345.js", "console.log('app');\n" * 200)
+    write_file("dist/assets/index-AbC12345.js.map", "{}")
+    write_file("dist/index.html", "<!doctype html><title>App</title>")
+    return str(tmp_path / "dist")
+
+@pytest.fixture
+def polling(monkeypatch):
+    # Deterministic change detection without inotify
+    monkeypatch.setattr(build_watcher, "awatch", None)
+
+def bump(path: str, text: str = "// rebuilt\n"):
+    with open(path, "a") as f:
+        f.write(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+async def next_message(queue: asyncio.Queue, timeout: float = 5.0):
+    return await asyncio.wait_for(queue.get(), timeout)
+
+def test_first_refresh_adds_every_file_except_maps(dist):
+    diff = BuildWatcher(dist).refresh()
+    assert sorted(entry["name"] for entry in diff["added"]) == ["assets/index-AbC12345.js", "index.html"]
+    assert diff["totals"]["gzip_kb"] < diff["totals"]["size_kb"]
+
+def test_renamed_chunk_is_reported_as_changed(dist, write_file):
+    watcher = BuildWatcher(dist)
+    watcher.refresh()
+    os.remove(os.path.join(dist, "assets/index-AbC12345.js"))
+    write_file("dist/assets/index-XyZ98765.js", "console.log('app');\n" * 300)
+
+    diff = watcher.refresh()
+    assert diff["added"] == [] and diff["removed"] == []
+    assert diff["changed"][0]["previous_name"] == "assets/index-AbC12345.js"
+    assert diff["changed"][0]["size_delta_kb"] > 0
+
+def test_file_deleted_during_refresh_is_skipped(dist, write_file, monkeypatch):
+    watcher = BuildWatcher(dist)
+    watcher.refresh()
+    doomed = write_file("dist/assets/vendor-QwE45678.js", "export {};\n" * 100)
+    scan = watcher._scan
+
+    def scan_then_delete():
+        stats = scan()
+        os.remove(doomed)  # Vite emptying dist/ after the scan
+        return stats
+
+    monkeypatch.setattr(watcher, "_scan", scan_then_delete)
+    diff = watcher.refresh()
+    assert diff["added"] == []
+    assert "assets/vendor-QwE45678.js" not in watcher.files
+    assert "assets/vendor-QwE45678.js" not in watcher._stats
+
+def test_refresh_swaps_in_a_new_file_table(dist):
+    watcher = BuildWatcher(dist)
+    watcher.refresh()
+    before = watcher.files
+    snapshot = dict(before)
+    bump(os.path.join(dist, "index.html"), "<p>changed</p>" * 50)
+
+    watcher.refresh()
+    assert watcher.files is not before
+    assert before == snapshot
+
+def test_watch_loop_reports_errors_and_keeps_running(dist, polling, monkeypatch):
+    async def scenario():
+        watcher = BuildWatcher(dist, debounce_ms=20, poll_interval=0.02)
+        queue = await watcher.subscribe()
+        refresh = watcher.refresh
+        failures = [FileNotFoundError("assets/gone.js")]
+
+        def flaky_refresh():
+            if failures:
+                raise failures.pop()
+            return refresh()
+
+        monkeypatch.setattr(watcher, "refresh", flaky_refresh)
+        bump(os.path.join(dist, "index.html"))
+        error = await next_message(queue)
+        bump(os.path.join(dist, "index.html"))
+        diff = await next_message(queue)
+        task = watcher._task
+        await watcher.unsubscribe(queue)
+        await asyncio.wait_for(task, 5)
+        return error, diff
+
+    error, diff = asyncio.run(scenario())
+    assert error == {"type": "error", "build_dir": dist, "error": "assets/gone.js"}
+    assert diff["type"] == "diff"
+    assert [change["name"] for change in diff["changed"]] == ["index.html"]
+
+def test_resubscribe_waits_for_the_stopped_loop(dist, polling):
+    async def scenario():
+        watcher = BuildWatcher(dist, debounce_ms=20, poll_interval=0.02)
+        first = await watcher.subscribe()
+        first_task = watcher._task
+        await watcher.unsubscribe(first)
+        second = await watcher.subscribe()
+        second_task = watcher._task
+        stopped_first = first_task.done()
+        await watcher.unsubscribe(second)
+        await asyncio.wait_for(second_task, 5)
+        return stopped_first, first_task is second_task
+
+    stopped_first, same_task = asyncio.run(scenario())
+    assert stopped_first
+    assert not same_task
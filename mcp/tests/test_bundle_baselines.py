@@ -0,0 +1,59 @@
+"""
+Stored bundle baselines and build-to-build diffs
+"""
+
+import pytest
+
+from mcp.utils.bundle_baselines import (
+    content_hash_token, diff_summaries, load_baseline, resolve_sha, save_baseline,
+    stable_name, summarize_analysis
+)
+
+def analysis(chunks):
+    return {"chunks": [
+        {"name": name, "size_kb": size / 1024, "gzipped_kb": size / 4096, "modules": modules}
+        for name, size, modules in chunks
+    ]}
+
+def test_hash_tokens_are_recognised():
+    assert content_hash_token("index-BwXk3Zt1.js") == "BwXk3Zt1"
+    assert content_hash_token("vendor.4f9a2c1e7b.css") == "4f9a2c1e7b"
+    assert content_hash_token("use-settings.js") is None
+    assert content_hash_token("logo.svg") is None
+
+def test_stable_names_match_across_builds():
+    assert stable_name("assets/index-BwXk3Zt1.js") == "assets/index.js"
+    assert stable_name("assets/index-C9a0Pq7L.js") == "assets/index.js"
+    assert stable_name("assets/vendor.4f9a2c1e7b.js.map") == "assets/vendor.js.map"
+    assert stable_name("robots.txt") == "robots.txt"
+
+def test_diff_reports_added_removed_and_grown_chunks():
+    base = summarize_analysis(analysis([
+        ("index-AAAA1111.js", 10240, ["src/main.ts"]),
+        ("admin-BBBB2222.js", 4096, ["src/admin.ts"])
+    ]))
+    head = summarize_analysis(analysis([
+        ("index-CCCC3333.js", 12288, ["src/main.ts", "node_modules/zod/index.js"]),
+        ("chart-DDDD4444.js", 2048, ["src/chart.ts"])
+    ]))
+    diff = diff_summaries(base, head)
+
+    assert diff["totals"]["size"] == {"base": 14336, "head": 14336, "delta": 0}
+    chunks = diff["chunks"]
+    assert [entry["name"] for entry in chunks["added"]] == ["chart.js"]
+    assert [entry["name"] for entry in chunks["removed"]] == ["admin.js"]
+    assert chunks["grown"] == [{
+        "name": "index.js", "size": 12288, "size_delta": 2048,
+        "gzip": 3072, "gzip_delta": 512, "brotli": None, "brotli_delta": None
+    }]
+    assert {entry["name"] for entry in diff["modules"]["added"]} == {"node_modules/zod/index.js", "src/chart.ts"}
+
+def test_baselines_round_trip_and_resolve_abbreviated_shas():
+    summary = summarize_analysis(analysis([("index-AAAA1111.js", 1024, [])]))
+    sha = "3f1c0de2b6a94e7f8d1c2b3a4e5f60718293a4b5"
+    entry = save_baseline(sha, summary, source="test")
+    assert entry["totals"] == summary["totals"]
+    assert resolve_sha(sha[:7]) == sha
+    assert load_baseline(sha[:10]) == summary
+    with pytest.raises(KeyError):
+        resolve_sha("ffffffff")
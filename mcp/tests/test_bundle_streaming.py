@@ -0,0 +1,138 @@
+"""
+Streaming bundle stats parser and its parity with the eager path
+"""
+
+import io
+import json
+
+import pytest
+
+from mcp.routes.bundles import analyze_bundle_output
+from mcp.utils.bundle_analyzer import analyze_bundle, iter_bundle_chunks
+
+# webpack stats: "assets" comes before "chunks"
+WEBPACK_STATS = {
+    "version": "5.90.0",
+    "assets": [
+        {"name": "main.3f2a1b.js", "size": 180000, "chunks": [0]},
+        {"name": "admin.9c8d7e.js", "size": 60000, "chunks": [1]}
+    ],
+    "entrypoints": {"main": {"name": "main", "chunks": [0], "assets": [{"name": "main.3f2a1b.js"}]}},
+    "chunks": [
+        {
+            "id": 0,
+            "name": "main",
+            "size": 150000,
+            "modules": [
+                {"name": "./src/main.tsx", "size": 4000},
+                {"name": "./node_modules/react-dom/index.js", "size": 130000},
+                {"name": "./node_modules/lodash/lodash.js", "size": 16000}
+            ]
+        },
+        {
+            "id": 1,
+            "name": "admin-dialog",
+            "size": 50000,
+            "modules": [
+                {"name": "./src/admin/Dialog.tsx", "size": 34000},
+                {"name": "./node_modules/lodash/lodash.js", "size": 16000}
+            ]
+        }
+    ],
+    "modules": [{"name": "./src/main.tsx", "size": 4000}]
+}
+
+# Shape of Rollup's generateBundle `bundle` object, serialized to JSON
+ROLLUP_BUNDLE = {
+    "assets/index-4f3a2b1c.js": {
+        "type": "chunk",
+        "fileName": "assets/index-4f3a2b1c.js",
+        "name": "index",
+        "isEntry": True,
+        "imports": ["assets/vendor-8e7d6c5b.js"],
+        "dynamicImports": ["assets/chart-1a2b3c4d.js"],
+        "code": "import{r as e}from'./vendor-8e7d6c5b.js';" + "console.log(e);" * 400,
+        "modules": {
+            "/src/main.tsx": {"renderedLength": 2400, "originalLength": 3100, "removedExports": [], "renderedExports": []},
+            "/src/App.tsx": {"renderedLength": 3600, "originalLength": 5200, "removedExports": [], "renderedExports": ["default"]}
+        }
+    },
+    "assets/vendor-8e7d6c5b.js": {
+        "type": "chunk",
+        "fileName": "assets/vendor-8e7d6c5b.js",
+        "name": "vendor",
+        "isEntry": False,
+        "code": "export const r=1;" * 9000,
+        "modules": {
+            "/node_modules/react/index.js": {"renderedLength": 8000, "originalLength": 9000},
+            "/node_modules/react-dom/index.js": {"renderedLength": 140000, "originalLength": 400000},
+            "/src/App.tsx": {"renderedLength": 3600, "originalLength": 5200}
+        }
+    },
+    "assets/chart-1a2b3c4d.js": {
+        "type": "chunk",
+        "fileName": "assets/chart-1a2b3c4d.js",
+        "name": "chart",
+        "code": "export default 1;",
+        "modules": {"/src/Chart.tsx": {"renderedLength": 17, "originalLength": 900}}
+    },
+    "assets/index-77aa88bb.css": {
+        "type": "asset",
+        "fileName": "assets/index-77aa88bb.css",
+        "name": "index.css",
+        "source": "body{margin:0}"
+    }
+}
+
+def streamed(data, **json_options) -> dict:
+    return analyze_bundle(iter_bundle_chunks(io.StringIO(json.dumps(data, **json_options))), threshold_kb=100)
+
+def test_webpack_stats_prefer_chunks_when_streamed():
+    names = [chunk["name"] for chunk in iter_bundle_chunks(io.StringIO(json.dumps(WEBPACK_STATS)))]
+    assert names == ["main", "admin-dialog"]
+
+def test_webpack_stats_streaming_matches_eager():
+    assert streamed(WEBPACK_STATS) == analyze_bundle(WEBPACK_STATS, threshold_kb=100)
+
+def test_assets_used_when_there_is_no_chunks_array():
+    stats = {"assets": WEBPACK_STATS["assets"], "outputPath": "/dist"}
+    assert streamed(stats) == analyze_bundle(stats, threshold_kb=100)
+    assert [chunk["name"] for chunk in streamed(stats)["chunks"]] == ["main.3f2a1b.js", "admin.9c8d7e.js"]
+
+def test_path_and_inline_json_give_the_same_analysis(tmp_path):
+    path = tmp_path / "stats.json"
+    path.write_text(json.dumps(WEBPACK_STATS, indent=2))
+    assert analyze_bundle_output(str(path), 100) == analyze_bundle_output(json.dumps(WEBPACK_STATS), 100)
+
+def test_rollup_bundle_object_modules_dict():
+    analysis = analyze_bundle(ROLLUP_BUNDLE, threshold_kb=100)
+    by_name = {chunk["name"]: chunk for chunk in analysis["chunks"]}
+
+    assert set(by_name) == {"index", "vendor", "chart", "index.css"}
+    assert by_name["vendor"]["modules"] == [
+        "/node_modules/react/index.js", "/node_modules/react-dom/index.js", "/src/App.tsx"
+    ]
+    # Chunk sizes come from the emitted code
+    assert by_name["vendor"]["size_kb"] == pytest.approx(len("export const r=1;" * 9000) / 1024, abs=0.01)
+    assert by_name["vendor"]["can_split"] is True
+    # Module sizes come from renderedLength
+    assert by_name["vendor"]["split_recommendations"] == [
+        "Consider code splitting for: /node_modules/react-dom/index.js"
+    ]
+    duplicates = analysis["duplicate_modules"]
+    assert [dup["name"] for dup in duplicates] == ["/src/App.tsx"]
+    assert duplicates[0]["wasted_bytes"] == 3600
+    assert "chart" in analysis["lazy_load_candidates"]
+
+def test_rollup_bundle_streaming_matches_eager():
+    assert streamed(ROLLUP_BUNDLE, indent=1) == analyze_bundle(ROLLUP_BUNDLE, threshold_kb=100)
+
+def test_module_sizes_fall_back_when_chunk_has_no_code():
+    chunk = {"fileName": "a.js", "modules": {"/src/a.ts": {"renderedLength": 2048}, "/src/b.ts": {"renderedLength": 1024}}}
+    analysis = analyze_bundle({"a.js": chunk})
+    assert analysis["chunks"][0]["size_kb"] == 3.0
+
+def test_top_level_array_streams_each_chunk():
+    chunks = [{"name": f"chunk-{index}", "size": 1024 * index} for index in range(50)]
+    assert streamed(chunks) == analyze_bundle(chunks, threshold_kb=100)
+    assert streamed(chunks)["total_size_kb"] == sum(range(50))
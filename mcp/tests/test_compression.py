@@ -0,0 +1,79 @@
+"""
+Real gzip/brotli sizes with a persistent per-file cache
+"""
+
+import gzip
+import itertools
+import os
+
+from mcp.utils import compression
+from mcp.utils.bundle_analyzer import analyze_build_directory
+from mcp.utils.compression import DIGEST_PREFIX, compress_files, gzip_size
+
+def cached_paths():
+    return {key.rsplit("|", 2)[0] for key in compression._cache.keys() if not key.startswith(DIGEST_PREFIX)}
+
+def test_gzip_size_matches_gzip_module():
+    data = b"const answer = 42;\n" * 200
+    assert gzip_size(data) == len(gzip.compress(data, compresslevel=9, mtime=0))
+
+def test_precompressed_formats_are_not_measured(write_file):
+    path = write_file("dist/logo.png", b"\x89PNG" + os.urandom(64))
+    assert compress_files([path])[path] == {"gzip": None, "brotli": None}
+
+def test_identical_content_is_compressed_once(write_file, monkeypatch):
+    first = write_file("dist/a.js", "export const a = 1;\n" * 100)
+    second = write_file("dist/copy/a.js", "export const a = 1;\n" * 100)
+    calls = []
+    original = compression.compressed_sizes
+    monkeypatch.setattr(compression, "compressed_sizes", lambda data: calls.append(data) or original(data))
+
+    sizes = compress_files([first, second], max_workers=1)
+    assert sizes[first] == sizes[second]
+    assert len(calls) == 1
+
+def test_entries_for_deleted_and_changed_files_are_pruned(write_file):
+    kept = write_file("build/kept.js", "let kept = true;\n" * 50)
+    removed = write_file("build/removed.js", "let removed = true;\n" * 50)
+    changed = write_file("build/changed.css", "body { color: red; }\n" * 50)
+    compress_files([kept, removed, changed])
+    assert {os.path.abspath(path) for path in (kept, removed, changed)} <= cached_paths()
+
+    os.remove(removed)
+    with open(changed, "a") as f:
+        f.write("p { margin: 0; }\n")
+    stat = os.stat(changed)
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    compress_files([changed])
+    compression.prune_cache()
+
+    paths = cached_paths()
+    assert os.path.abspath(removed) not in paths
+    assert os.path.abspath(kept) in paths
+    stat_keys = [key for key in compression._cache.keys() if key.startswith(os.path.abspath(changed) + "|")]
+    assert len(stat_keys) == 1
+    # Sizes of the removed file and the old version of the changed one are gone too
+    digests = {compression._cache.get(key) for key in compression._cache.keys() if not key.startswith(DIGEST_PREFIX)}
+    assert {key for key in compression._cache.keys() if key.startswith(DIGEST_PREFIX)} == digests
+
+def test_pruning_runs_every_few_calls(write_file, monkeypatch):
+    path = write_file("dist/app.js", "export default 1;\n" * 50)
+    pruned = []
+    monkeypatch.setattr(compression, "_calls", itertools.count(1))
+    monkeypatch.setattr(compression, "prune_cache", lambda: pruned.append(1))
+    for _ in range(2 * compression.PRUNE_EVERY):
+        compress_files([path])
+    assert pruned == [1, 1]
+
+def test_saving_leaves_no_temp_files(write_file):
+    compress_files([write_file("dist/app.css", "body { margin: 0; }\n" * 50)])
+    assert not [name for name in os.listdir(compression._cache.path.parent) if name.endswith(".tmp")]
+
+def test_build_directory_reports_real_sizes(tmp_path, write_file):
+    code = "export function render() { return document.body; }\n" * 300
+    write_file("dist/assets/index.js", code)
+    write_file("dist/assets/index.js.map", "{}")
+    analysis = analyze_build_directory(str(tmp_path / "dist"))
+    assert [chunk["name"] for chunk in analysis["chunks"]] == ["index.js"]
+    assert analysis["chunks"][0]["gzip_kb"] == round(gzip_size(code.encode()) / 1024, 2)
+    assert analysis["assets"] == []
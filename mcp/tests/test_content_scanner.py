@@ -0,0 +1,43 @@
+"""
+Single-pass HTML-aware content scanner
+"""
+
+from mcp.utils.content_analyzer import BLOCK_BREAK, analyze_content, scan_content
+
+PAGE = """
+<h1>Design Systems</h1>
+<p>Tokens keep teams consistent. They scale well</p>
+<script>var ignored = "words inside scripts";</script>
+<style>.hidden { display: none }</style>
+<!-- a comment with words -->
+<h2>Why it matters</h2>
+<p>Read the <a href="/guide">guide</a> &amp; the <a name="anchor">notes</a>.</p>
+<img src="/hero.png" alt="hero image">
+"""
+
+def test_markup_is_tallied_not_counted_as_words():
+    scan = scan_content(PAGE)
+    assert scan["heading_structure"] == {"h1": 1, "h2": 1, "h3": 0, "h4": 0}
+    assert scan["image_count"] == 1
+    # Only anchors with an href are links
+    assert scan["link_count"] == 1
+    words = [token for token in scan["tokens"] if token != BLOCK_BREAK]
+    assert "ignored" not in words and "comment" not in words and "hero" not in words
+    assert words[:2] == ["design", "systems"]
+    assert scan["word_count"] == len(words) == 17
+
+def test_block_elements_end_sentences_without_punctuation():
+    scan = scan_content(PAGE)
+    # Heading, two sentences in the first paragraph, heading, last paragraph
+    assert scan["sentence_count"] == 5
+
+def test_entities_are_decoded():
+    scan = scan_content("<p>Caf&eacute; &amp; bar</p>")
+    assert [token for token in scan["tokens"] if token != BLOCK_BREAK] == ["café", "bar"]
+
+def test_analysis_uses_scanned_counts():
+    result = analyze_content(PAGE, "homepage", ["design systems", "tokens"])
+    metrics = result["metrics"]
+    assert metrics["word_count"] == 17
+    assert metrics["keyword_density"] == {"design systems": round(100 / 17, 2), "tokens": round(100 / 17, 2)}
+    assert "Homepage content is quite short. Consider adding more value proposition content." in result["recommendations"]
@@ -0,0 +1,46 @@
+"""
+Single-pass duplicate module index across chunks
+"""
+
+from collections import defaultdict
+
+from mcp.utils.bundle_analyzer import analyze_bundle, find_duplicate_modules, index_chunk_modules
+
+def build_index(chunks):
+    module_chunks = defaultdict(list)
+    module_sizes = {}
+    for chunk_index, modules in enumerate(chunks):
+        index_chunk_modules(modules, chunk_index, module_chunks, module_sizes)
+    return module_chunks, module_sizes
+
+def test_module_repeated_within_one_chunk_is_one_copy():
+    module_chunks, _ = build_index([["lodash", "lodash"], ["react"]])
+    assert module_chunks["lodash"] == [0]
+    assert find_duplicate_modules(module_chunks, {}, ["a", "b"]) == []
+
+def test_duplicates_sorted_by_wasted_bytes():
+    chunks = [
+        [{"name": "lodash", "size": 1000}, {"name": "date-fns", "size": 400}],
+        [{"name": "lodash", "size": 1000}, {"name": "date-fns", "size": 400}],
+        [{"name": "date-fns", "size": 400}, {"id": "tiny", "renderedLength": 10}]
+    ]
+    module_chunks, module_sizes = build_index(chunks)
+    duplicates = find_duplicate_modules(module_chunks, module_sizes, ["main", "admin", "chart"])
+    assert duplicates == [
+        {"name": "lodash", "chunks": ["main", "admin"], "size_bytes": 1000, "wasted_bytes": 1000},
+        {"name": "date-fns", "chunks": ["main", "admin", "chart"], "size_bytes": 400, "wasted_bytes": 800}
+    ]
+
+def test_largest_reported_size_wins():
+    module_chunks, module_sizes = build_index([[{"name": "x", "size": 10}], [{"name": "x", "size": 30}]])
+    assert module_sizes["x"] == 30
+    assert find_duplicate_modules(module_chunks, module_sizes, ["a", "b"])[0]["wasted_bytes"] == 30
+
+def test_analyze_bundle_reports_duplicated_bytes():
+    stats = {"chunks": [
+        {"name": "main", "size": 2048, "modules": [{"name": "shared", "size": 512}, {"name": "main", "size": 1536}]},
+        {"name": "route", "size": 1024, "modules": [{"name": "shared", "size": 512}, {"name": "route", "size": 512}]}
+    ]}
+    analysis = analyze_bundle(stats)
+    assert analysis["duplicated_bytes"] == 512
+    assert any("shipped in more than one chunk" in text for text in analysis["recommendations"])
@@ -0,0 +1,78 @@
+"""
+Offline head audit of built HTML
+"""
+
+import pytest
+
+from mcp.utils import head_crawler
+
+def html(title, description, canonical="", body="<p>Body</p>"):
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+  <title>{title}</title>
+  <meta name="description" content="{description}">
+  <meta name="viewport" content="width=device-width">
+  <meta property="og:title" content="{title}">
+  <link rel="canonical" href="{canonical}">
+  <script type="application/ld+json">{{"@type": "WebPage", "name": "{title}"}}</script>
+</head>
+<body>{body}<title>Not the title</title></body>
+</html>"""
+
+DESCRIPTION = "A thorough guide to building design systems that scale across many product teams."
+
+@pytest.fixture
+def build(write_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(head_crawler, "_cache", head_crawler.JsonFileCache(f"head-{tmp_path.name}.json", 100))
+    write_file("dist/index.html", html("Home | Studio", DESCRIPTION, "https://example.com/"))
+    write_file("dist/about/index.html", html("About | Studio", DESCRIPTION))
+    write_file("dist/work.html", html("Home | Studio", "Selected work from the studio, from branding to product design."))
+    return str(tmp_path / "dist")
+
+def test_head_is_parsed_without_reading_the_body(build):
+    head = head_crawler.extract_head(f"{build}/index.html")
+    assert head["title"] == "Home | Studio"
+    assert head["lang"] == "en"
+    assert head["canonical"] == "https://example.com/"
+    assert head["open_graph"] == {"og:title": "Home | Studio"}
+    assert head["structured_data"] == [{"@type": "WebPage", "name": "Home | Studio"}]
+
+def test_page_urls_follow_the_build_layout():
+    assert head_crawler.page_url("about/index.html", "https://example.com/") == "https://example.com/about/"
+    assert head_crawler.page_url("work.html") == "/work"
+
+def test_audit_streams_pages_then_duplicates_and_caches(build):
+    results = list(head_crawler.iter_head_audit(build, "https://example.com", max_workers=2))
+    pages = {result["path"]: result for result in results if result["type"] == "page"}
+    assert set(pages) == {"index.html", "about/index.html", "work.html"}
+    assert pages["about/index.html"]["url"] == "https://example.com/about/"
+    assert "Missing canonical link" in pages["about/index.html"]["warnings"]
+
+    summary = results[-1]
+    assert summary["pages"] == 3 and summary["audited"] == 3 and summary["failed"] == []
+    # Pages are summarized in completion order
+    [titles] = summary["duplicate_titles"]
+    assert titles["title"] == "Home | Studio" and sorted(titles["pages"]) == ["index.html", "work.html"]
+    [descriptions] = summary["duplicate_descriptions"]
+    assert sorted(descriptions["pages"]) == ["about/index.html", "index.html"]
+
+    rerun = list(head_crawler.iter_head_audit(build, "https://example.com"))
+    assert rerun[-1]["cached"] == 3
+    # The base URL is part of the cache key
+    assert list(head_crawler.iter_head_audit(build, "https://other.example"))[-1]["cached"] == 0
+
+def test_a_failing_page_yields_an_error_line(build, monkeypatch):
+    validate = head_crawler.validate_seo
+
+    def flaky(page):
+        if page.title.startswith("About"):
+            raise RuntimeError("validator crashed")
+        return validate(page)
+
+    monkeypatch.setattr(head_crawler, "validate_seo", flaky)
+    results = list(head_crawler.iter_head_audit(build, max_workers=2))
+    assert [result for result in results if result["type"] == "error"] == [
+        {"type": "error", "path": "about/index.html", "error": "RuntimeError: validator crashed"}
+    ]
+    assert results[-1]["pages"] == 2 and results[-1]["failed"] == ["about/index.html"]
@@ -0,0 +1,71 @@
+"""
+Precompiled <head> rendering for generated SEO meta
+"""
+
+import asyncio
+
+import httpx
+
+from mcp.main import app
+from mcp.utils.head_renderer import render_cache_info, render_head, render_head_bytes, serialize_json_ld
+
+META = {
+    "meta_tags": {
+        "title": "Tom & Jerry <Live>",
+        "description": 'Say "hi"',
+        "canonical": "https://example.com/?a=1&b=2",
+        "robots": ""
+    },
+    "open_graph": {"og:title": "Tom & Jerry", "article:tag:0": "cats", "article:tag:1": "mice"},
+    "twitter_card": {"twitter:card": "summary"},
+    "structured_data": {"@type": "Article", "name": "</script><!--  "}
+}
+
+def request(method: str, path: str, **kwargs):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(scenario())
+
+def test_values_are_escaped_and_empty_tags_skipped():
+    lines = render_head(META).split("\n")
+    assert lines[0] == "<title>Tom &amp; Jerry &lt;Live&gt;</title>"
+    assert '<meta name="description" content="Say &quot;hi&quot;">' in lines
+    assert '<link rel="canonical" href="https://example.com/?a=1&amp;b=2">' in lines
+    assert not any("robots" in line for line in lines)
+    assert lines.count('<meta property="article:tag" content="cats">') == 1
+    assert '<meta property="article:tag" content="mice">' in lines
+
+def test_json_ld_cannot_close_its_script_element():
+    serialized = serialize_json_ld(META["structured_data"])
+    assert "</script>" not in serialized and "<!--" not in serialized
+    assert "\\u2028" in serialized
+
+def test_bytes_match_text_and_repeats_hit_the_cache():
+    text = render_head(META)
+    before = render_cache_info()
+    assert render_head_bytes(META) == text.encode("utf-8")
+    after = render_cache_info()
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"]
+    assert after["size"] <= after["max_size"]
+
+def test_route_returns_html_bytes_and_reports_cache_stats():
+    body = {
+        "meta_tags": {"title": "About | Studio"},
+        "open_graph": {},
+        "twitter_card": {},
+        "structured_data": {},
+        "validation_errors": [],
+        "recommendations": []
+    }
+    before = request("GET", "/seo/render-head/cache-stats").json()
+    first = request("POST", "/seo/render-head", json=body)
+    second = request("POST", "/seo/render-head", json=body)
+    assert first.headers["content-type"] == "text/html; charset=utf-8"
+    assert first.content == second.content == b"<title>About | Studio</title>"
+
+    after = request("GET", "/seo/render-head/cache-stats").json()
+    assert after["hits"] >= before["hits"] + 1
+    assert set(after) == {"hits", "misses", "size", "max_size"}
@@ -0,0 +1,38 @@
+"""
+Aho-Corasick keyword density counting
+"""
+
+import random
+
+from mcp.utils.keyword_matcher import KeywordAutomaton, count_keywords, get_automaton
+
+def naive_counts(keywords, words):
+    counts = {}
+    for keyword in keywords:
+        phrase = keyword.lower().split()
+        counts[keyword] = sum(words[i:i + len(phrase)] == phrase for i in range(len(words) - len(phrase) + 1))
+    return counts
+
+def test_matches_whole_words_only():
+    words = "seo in seoul is not seo tooling".split()
+    assert count_keywords(["seo", "seo tooling"], words) == {"seo": 2, "seo tooling": 1}
+
+def test_overlapping_phrases_are_all_counted():
+    words = "web performance performance budget web performance budget".split()
+    keywords = ["web performance", "performance budget", "performance", "web performance budget"]
+    assert count_keywords(keywords, words) == naive_counts(keywords, words)
+
+def test_matches_naive_counting_on_random_text():
+    generator = random.Random(7)
+    vocabulary = ["a", "b", "c", "d"]
+    keywords = sorted({" ".join(generator.choices(vocabulary, k=generator.randint(1, 3))) for _ in range(30)})
+    for _ in range(20):
+        words = generator.choices(vocabulary, k=200)
+        assert count_keywords(keywords, words) == naive_counts(keywords, words)
+
+def test_hyphenated_and_apostrophe_words_stay_whole():
+    automaton = KeywordAutomaton(["real-time", "don't"])
+    assert automaton.count(["real-time", "real", "time", "don't"]) == [1, 1]
+
+def test_automaton_is_reused_for_the_same_keywords():
+    assert get_automaton(["react", "vite"]) is get_automaton(["react", "vite"])
@@ -0,0 +1,79 @@
+"""
+Resource hints as Link headers in platform configs
+"""
+
+import asyncio
+import functools
+import json
+
+import httpx
+import pytest
+
+from mcp.main import app
+from mcp.utils import manifest_graph, resource_hints
+from mcp.utils.cache_optimizer import get_platform_config, render_headers_file
+from mcp.utils.resource_hints import link_header, link_headers, page_link_headers
+
+LINKS = {"/": ["</app.css>; rel=preload; as=style", "<https://cdn.example.com>; rel=preconnect; crossorigin"]}
+
+def request(method: str, path: str, **kwargs):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(scenario())
+
+@pytest.fixture
+def build(vite_build, monkeypatch):
+    monkeypatch.setattr(
+        resource_hints, "analyze_critical_path",
+        functools.partial(manifest_graph.analyze_critical_path, router_path=vite_build["router"])
+    )
+    return vite_build
+
+def test_link_header_values():
+    assert link_header({"rel": "preload", "href": "/a.woff2", "as_": "font", "crossorigin": "anonymous",
+                        "type_": "font/woff2"}) == '</a.woff2>; rel=preload; as=font; crossorigin; type="font/woff2"'
+    assert link_header({"rel": "preconnect", "href": "https://x.com", "crossorigin": "use-credentials"}) == \
+        "<https://x.com>; rel=preconnect; crossorigin=use-credentials"
+    # Prefetch is not acted on from headers or Early Hints
+    assert link_headers([{"rel": "prefetch", "href": "/next"}, {"rel": "modulepreload", "href": "/a.js"}]) == [
+        "</a.js>; rel=modulepreload"
+    ]
+
+def test_vercel_headers_gain_a_link_rule():
+    config = get_platform_config("vercel", LINKS)
+    assert config["headers"][-1] == {"source": "/", "headers": [{"key": "Link", "value": ", ".join(LINKS["/"])}]}
+    assert json.loads(config["vercel.json"])["headers"] == config["headers"]
+
+def test_netlify_headers_file_lists_each_link_on_its_own_line():
+    config = get_platform_config("netlify", LINKS)
+    lines = config["_headers"].splitlines()
+    index = lines.index("/")
+    assert lines[index + 1:index + 3] == [f"  Link: {value}" for value in LINKS["/"]]
+    assert config["headers"][-1] == {"for": "/", "values": {"Link": ", ".join(LINKS["/"])}}
+
+def test_cloudflare_enables_early_hints():
+    config = get_platform_config("cloudflare", LINKS)
+    assert config["early_hints"]["zone_setting"] == {"id": "early_hints", "value": "on"}
+    rule = config["response_header_rules"][0]
+    assert rule["expression"] == 'http.request.uri.path eq "/"'
+    assert rule["action_parameters"]["headers"]["Link"]["value"] == ", ".join(LINKS["/"])
+    assert config["_headers"] == render_headers_file([], LINKS)
+
+def test_base_config_is_unchanged_without_hints():
+    assert get_platform_config("vercel") == get_platform_config("vercel", {})
+
+def test_headers_are_derived_per_page_from_the_build(build):
+    files = build["files"]
+    headers = page_link_headers(["/work", "/about/"], build["dir"])
+    assert set(headers) == {"/work", "/about"}
+    assert f"</{files['work']}>; rel=modulepreload" in headers["/work"]
+    assert f"</{files['work']}>; rel=modulepreload" not in headers["/about"]
+
+def test_platform_config_route_merges_build_hints(build):
+    response = request(
+        "GET", "/cache/platform-config/netlify", params={"build_dir": build["dir"], "pages": ["/work"]}
+    )
+    assert response.status_code == 200
+    assert f"  Link: </{build['files']['css']}>; rel=preload; as=style" in response.json()["_headers"]
@@ -0,0 +1,87 @@
+"""
+Adaptive sampling and in-flight load shedding
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mcp.main import app
+from mcp.utils.load_shedder import LoadShedder, shedder
+
+BEACON = b'{"lcp": 2500, "fid": 100, "cls": 0.1, "fcp": 1800, "ttfb": 800, "url": "https://example.com/"}'
+
+@pytest.fixture
+def small_queue():
+    depth = shedder.max_queue_depth
+    shedder.max_queue_depth = 4
+    yield shedder
+    shedder.max_queue_depth = depth
+
+def test_sampling_keeps_everything_below_half_load():
+    load_shedder = LoadShedder(max_queue_depth=10)
+    load_shedder.in_flight = 5
+    assert load_shedder.sample_rate("/a") == 1.0
+
+def test_sampling_keeps_rare_urls_under_load():
+    load_shedder = LoadShedder(max_queue_depth=10, min_samples_per_window=3)
+    load_shedder.in_flight = 20
+    rates = [load_shedder.admit("/rare")[1] for _ in range(5)]
+    assert rates[:3] == [1.0, 1.0, 1.0]
+    assert rates[3] == pytest.approx(0.25)
+
+def test_shedding_order_follows_priorities():
+    load_shedder = LoadShedder(max_queue_depth=100)
+    load_shedder.in_flight = 60
+    assert load_shedder.should_shed("trend")
+    assert not load_shedder.should_shed("report")
+    load_shedder.in_flight = 80
+    assert load_shedder.should_shed("report")
+
+def test_concurrent_requests_trigger_shedding(small_queue):
+    async def scenario():
+        release = asyncio.Event()
+
+        async def slow_body():
+            # Holds the request open while it is still being received
+            await release.wait()
+            yield BEACON
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = {"content-type": "application/json"}
+            held = [
+                asyncio.create_task(client.post("/analytics/performance-report", content=slow_body(), headers=headers))
+                for _ in range(4)
+            ]
+            for _ in range(200):
+                if shedder.in_flight >= 4:
+                    break
+                await asyncio.sleep(0.01)
+
+            shed = await client.post("/analytics/performance-report", content=BEACON, headers=headers)
+            status = (await client.get("/analytics/ingest-status")).json()
+
+            release.set()
+            finished = await asyncio.gather(*held)
+        return shed, status, finished
+
+    shed, status, finished = asyncio.run(scenario())
+    assert shed.status_code == 200
+    assert shed.json()["degraded"] is True
+    assert shed.json()["recommendations"] == []
+    assert status["in_flight"] == 5
+    assert status["shedding"] == ["trend", "report"]
+    assert all(response.status_code == 200 for response in finished)
+    assert shedder.in_flight == 0
+
+def test_in_flight_returns_to_zero_after_errors():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/analytics/performance-report", content=b"{", headers={"content-type": "application/json"})
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 422
+    assert shedder.in_flight == 0
@@ -0,0 +1,52 @@
+"""
+Route-level critical-path bytes from the Vite manifest
+"""
+
+import os
+
+from mcp.utils.bundle_analyzer import analyze_bundle
+from mcp.utils.manifest_graph import ManifestGraph, analyze_critical_path, parse_router_routes
+
+def size(build, key):
+    return os.path.getsize(os.path.join(build["dir"], build["files"][key]))
+
+def test_router_routes_map_to_page_modules(vite_build):
+    assert parse_router_routes(vite_build["router"]) == [
+        {"path": "/about", "component": "About", "module": "src/pages/About"},
+        {"path": "/work", "component": "Work", "module": "src/pages/Work"}
+    ]
+
+def test_static_closure_is_transitive_and_memoized(vite_build):
+    graph = ManifestGraph.load(vite_build["dir"])
+    closure = graph.static_closure("index.html")
+    assert closure == {"index.html", "_vendor.js", "_chart.js"}
+    assert graph.static_closure("index.html") is closure
+
+def test_route_costs_count_each_file_once(vite_build):
+    result = analyze_critical_path(vite_build["dir"], vite_build["router"])
+    routes = {route["path"]: route for route in result["routes"]}
+
+    startup_js = size(vite_build, "entry") + size(vite_build, "vendor") + size(vite_build, "chart")
+    assert result["entries"][0]["js_bytes"] == startup_js
+    assert result["entries"][0]["css_bytes"] == size(vite_build, "css")
+    assert routes["/work"]["js_bytes"] == startup_js + size(vite_build, "work")
+    assert routes["/about"]["chunk_count"] == 4
+    assert routes["/work"]["gzip_bytes"] < routes["/work"]["total_bytes"]
+
+def test_startup_chunk_needed_by_one_route_is_a_lazy_candidate(vite_build):
+    result = analyze_critical_path(vite_build["dir"], vite_build["router"])
+    assert result["lazy_load_candidates"] == [{
+        "chunk": "_chart.js",
+        "file": vite_build["files"]["chart"],
+        "bytes": size(vite_build, "chart"),
+        "route": "/work"
+    }]
+
+def test_analyze_bundle_uses_manifest_candidates(vite_build):
+    critical_path = analyze_critical_path(vite_build["dir"], vite_build["router"])
+    analysis = analyze_bundle([{"name": "admin-modal", "size": 1024}], critical_path=critical_path)
+    assert analysis["lazy_load_candidates"] == [vite_build["files"]["chart"]]
+    assert any("only route /work needs it" in text for text in analysis["recommendations"])
+
+def test_missing_manifest_is_reported(tmp_path):
+    assert "error" in analyze_critical_path(str(tmp_path))
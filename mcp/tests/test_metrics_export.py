@@ -0,0 +1,67 @@
+"""
+Time-indexed metrics store and Arrow/Parquet export
+"""
+
+import io
+from datetime import datetime, timedelta
+
+import pytest
+
+from mcp.utils.metrics_store import MetricsStore
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from mcp.utils.metrics_export import stream_export
+
+START = datetime(2026, 1, 1)
+
+def sample(url: str, lcp: float) -> dict:
+    return {"url": url, "lcp": lcp, "fid": 10.0, "cls": 0.01, "fcp": 900.0, "ttfb": 200.0}
+
+def filled_store(count: int = 10, capacity: int = 1000) -> MetricsStore:
+    store = MetricsStore(capacity=capacity)
+    for minute in range(count):
+        url = "https://example.com/blog/" if minute % 2 else "https://example.com/work/"
+        store.append(sample(url + str(minute), 1000.0 + minute), START + timedelta(minutes=minute))
+    return store
+
+def test_store_evicts_oldest_samples():
+    store = filled_store(count=25, capacity=10)
+    assert len(store) == 10
+    assert [row["lcp"] for row in store] == [1000.0 + minute for minute in range(15, 25)]
+
+def test_scan_filters_by_time_range_and_prefix():
+    store = filled_store()
+    rows = store.scan(
+        url_prefix="https://example.com/blog/",
+        since=START + timedelta(minutes=2),
+        until=START + timedelta(minutes=7)
+    )
+    assert [row["lcp"] for row in rows] == [1003.0, 1005.0, 1007.0]
+
+def test_scan_after_eviction_uses_live_window():
+    store = filled_store(count=15, capacity=10)
+    rows = store.scan(until=START + timedelta(minutes=6))
+    assert [row["lcp"] for row in rows] == [1005.0, 1006.0]
+
+def test_arrow_stream_round_trips_in_batches():
+    rows = filled_store().scan()
+    chunks = list(stream_export(rows, "arrow", batch_size=3))
+    table = pa.ipc.open_stream(io.BytesIO(b"".join(chunks))).read_all()
+    assert table.num_rows == 10
+    assert table.column("lcp").to_pylist() == [1000.0 + minute for minute in range(10)]
+    assert table.column("sample_rate").to_pylist() == [1.0] * 10
+    assert len(chunks) > 1
+
+def test_parquet_export_round_trips():
+    rows = filled_store().scan(url_prefix="https://example.com/work/")
+    data = b"".join(stream_export(rows, "parquet", batch_size=2))
+    table = pq.read_table(io.BytesIO(data))
+    assert table.num_rows == 5
+    assert table.column("url").to_pylist()[0] == "https://example.com/work/0"
+    assert table.schema.field("timestamp").type == pa.timestamp("us")
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        list(stream_export([], "csv"))
@@ -0,0 +1,82 @@
+"""
+Navigation model for prefetch predictions from weighted beacons
+"""
+
+import asyncio
+
+import pytest
+
+import mcp.main
+from mcp.utils.navigation_model import (
+    NavigationModel, effective_sample_size, normalize_page, same_site, wilson_lower_bound
+)
+
+@pytest.fixture
+def model(tmp_path):
+    return NavigationModel(f"navigation-{tmp_path.name}.json")
+
+def record(model, transitions, weight=1.0):
+    for source, target, times in transitions:
+        for _ in range(times):
+            assert model.record(f"https://example.com{source}", f"https://example.com{target}", weight)
+
+def test_urls_are_normalized_and_external_referrals_ignored(model):
+    assert normalize_page("https://example.com/about/?utm=1#team") == "/about"
+    assert same_site("/", "https://example.com/a")
+    assert not same_site("https://google.com/", "https://example.com/a")
+    assert not model.record("https://google.com/", "https://example.com/a")
+    assert not model.record("https://example.com/a/", "https://example.com/a")
+
+def test_kish_effective_sample_size():
+    assert effective_sample_size(5, 5) == 5
+    # One heavy beacon dominates: three unit weights and one of 10
+    assert effective_sample_size(13, 103) == pytest.approx(1.64, abs=0.01)
+    assert effective_sample_size(0, 0) == 0
+
+def test_weights_set_the_probability_but_not_the_confidence(model, tmp_path):
+    # Five beacons sampled at 1%, each standing for 100 navigations
+    record(model, [("/", "/work", 4), ("/", "/about", 1)], weight=100)
+    unweighted = NavigationModel(f"navigation-{tmp_path.name}-unweighted.json")
+    record(unweighted, [("/", "/work", 4), ("/", "/about", 1)])
+
+    prediction = model.predict("/", k=1, threshold=0.0)[0]
+    assert prediction["probability"] == 0.8
+    assert prediction["count"] == 400 and prediction["observations"] == 4
+    assert prediction["confidence"] == unweighted.predict("/", k=1, threshold=0.0)[0]["confidence"]
+    # Treating the 500 weighted navigations as trials would claim far more certainty
+    assert prediction["confidence"] < 0.5 < wilson_lower_bound(0.8, 500)
+    assert model.next_pages("/", threshold=0.5) == []
+
+def test_mixed_weights_use_the_weighted_probability(model):
+    record(model, [("/", "/work", 30)], weight=1)
+    record(model, [("/", "/about", 10)], weight=10)
+    top = model.predict("/", k=2, threshold=0.0)
+    assert [prediction["page"] for prediction in top] == ["/about", "/work"]
+    assert top[0]["probability"] == pytest.approx(100 / 130, abs=1e-4)
+    stats = model.stats()
+    assert stats["observations"] == 40 and stats["weighted_observations"] == 130
+
+def test_model_round_trips(model):
+    record(model, [("/", "/work", 6)], weight=2)
+    record(model, [("/", "/about", 2)], weight=1)
+    model.save()
+    reloaded = NavigationModel(model._store.path.name)
+    assert reloaded.predict("/", threshold=0.0) == model.predict("/", threshold=0.0)
+    assert reloaded.stats() == model.stats()
+
+def test_shutdown_flushes_unsaved_transitions(model, monkeypatch):
+    monkeypatch.setattr(mcp.main, "navigation_model", model)
+
+    async def serve():
+        async with mcp.main.app.router.lifespan_context(mcp.main.app):
+            record(model, [("/", "/work", 3)])
+
+    asyncio.run(serve())
+    assert NavigationModel(model._store.path.name).stats()["observations"] == 3
+
+def test_save_without_new_transitions_keeps_the_stored_model(model):
+    record(model, [("/", "/work", 2)])
+    model.save()
+    fresh = NavigationModel(model._store.path.name)
+    fresh.save()
+    assert NavigationModel(model._store.path.name).stats()["observations"] == 2
@@ -0,0 +1,69 @@
+"""
+MinHash/LSH near-duplicate index
+"""
+
+import pytest
+
+from mcp.utils import near_duplicates
+from mcp.utils.near_duplicates import NearDuplicateIndex, estimate_jaccard, minhash, shingles
+
+def page(vocabulary: int, length: int = 200):
+    return [f"w{vocabulary}x{i}" for i in range(length)]
+
+def variant(words, replaced):
+    """
+    Copy of the page with every `replaced` position reworded; each change
+    removes the five shingles that cover it
+    """
+    return [f"{word}-edited" if i in replaced else word for i, word in enumerate(words)]
+
+def jaccard(first, second):
+    a, b = shingles(first), shingles(second)
+    return len(a & b) / len(a | b)
+
+@pytest.fixture
+def index(tmp_path):
+    return NearDuplicateIndex(f"near-duplicates-{tmp_path.name}.json")
+
+def test_band_layout_puts_the_threshold_well_below_0_7():
+    assert near_duplicates.BANDS * near_duplicates.ROWS == near_duplicates.NUM_PERMUTATIONS
+    knee = (1 / near_duplicates.BANDS) ** (1 / near_duplicates.ROWS)
+    assert knee < 0.5
+    recall_at_0_7 = 1 - (1 - 0.7 ** near_duplicates.ROWS) ** near_duplicates.BANDS
+    assert recall_at_0_7 > 0.99
+
+def test_recall_on_pairs_between_0_7_and_0_8_jaccard(index):
+    pairs = []
+    for n in range(40):
+        original = page(n)
+        # 5 or 6 scattered edits give shingle Jaccard of roughly 0.73-0.77
+        edited = variant(original, set(range(15 + n % 7, 200, 35 + 5 * (n % 2))))
+        similarity = jaccard(original, edited)
+        assert 0.7 <= similarity <= 0.8
+        index.update(f"a{n}", f"ha{n}", original)
+        index.update(f"b{n}", f"hb{n}", edited)
+        pairs.append((f"a{n}", f"b{n}"))
+
+    found = sum(
+        any(match["path"] == partner for match in index.similar(path, threshold=0.0))
+        for path, partner in pairs
+    )
+    assert found / len(pairs) >= 0.95
+
+def test_estimates_track_true_jaccard():
+    original = page(1)
+    edited = variant(original, set(range(15, 200, 35)))
+    estimate = estimate_jaccard(minhash(shingles(original)), minhash(shingles(edited)))
+    assert abs(estimate - jaccard(original, edited)) < 0.12
+
+def test_unrelated_pages_do_not_cluster_and_updates_move_buckets(index):
+    index.update("a", "h1", page(1))
+    index.update("b", "h2", page(2))
+    index.update("c", "h3", variant(page(1), {100}))
+    assert index.update("a", "h1", page(1)) is False
+    clusters = index.clusters(0.7)
+    assert [cluster["pages"] for cluster in clusters] == [["a", "c"]]
+
+    # Rewording c entirely removes it from a's buckets
+    index.update("c", "h4", page(3))
+    assert index.similar("a", 0.0) == []
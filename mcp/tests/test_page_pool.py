@@ -0,0 +1,41 @@
+"""
+Per-page process pool results and the LRU-capped disk cache
+"""
+
+from mcp.utils.disk_cache import JsonFileCache
+from mcp.utils.page_pool import PageSummary, iter_pool_results
+
+def _square_or_fail(n):
+    if n < 0:
+        raise ValueError(f"negative: {n}")
+    return {"square": n * n}
+
+def test_pool_reports_failing_jobs_and_finishes_the_rest():
+    results = {job: (result, error) for job, result, error in iter_pool_results(_square_or_fail, [1, -2, 3], 2)}
+    assert results[1] == ({"square": 1}, None)
+    assert results[3] == ({"square": 9}, None)
+    assert results[-2] == (None, "ValueError: negative: -2")
+
+def test_single_job_runs_inline_with_the_same_contract():
+    assert list(iter_pool_results(_square_or_fail, [-1])) == [(-1, None, "ValueError: negative: -1")]
+    assert list(iter_pool_results(_square_or_fail, [])) == []
+
+def test_summary_counts_pages_and_failures():
+    summary = PageSummary()
+    summary.add({"cached": True})
+    summary.add({"cached": False})
+    summary.fail({"path": "broken.md"})
+    assert summary.result() == {"type": "summary", "pages": 2, "cached": 1, "failed": ["broken.md"]}
+
+def test_capped_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr("mcp.utils.disk_cache.CACHE_ROOT", tmp_path)
+    cache = JsonFileCache("lru.json", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.keys() == ["a", "c"]
+    cache.save()
+
+    reloaded = JsonFileCache("lru.json", max_entries=2)
+    assert reloaded.keys() == ["a", "c"]
@@ -0,0 +1,93 @@
+"""
+Byte-budgeted preload selection per connection profile
+"""
+
+import itertools
+import random
+
+from mcp.models.resource_hints import ResourceHintsRequest
+from mcp.utils import resource_hints
+from mcp.utils.resource_hints import (
+    KNAPSACK_UNIT, MAX_PRELOADS, PRELOAD_PRIORITY, detect_resource_type, generate_resource_hints,
+    optimize_preloads, preload_budget, resource_sizes
+)
+
+def sized(sizes):
+    return {href: {"bytes": size, "estimated": False} for href, size in sizes.items()}
+
+def value(resources, chosen):
+    order = list(dict.fromkeys(resources))
+    return sum(
+        PRELOAD_PRIORITY.get(detect_resource_type(href), 1) + 1e-3 / (order.index(href) + 1) for href in chosen
+    )
+
+def test_budgets_scale_with_the_connection():
+    assert preload_budget("4g") == 300000
+    assert preload_budget("slow-2g") < preload_budget("3g") < preload_budget("desktop")
+    assert preload_budget("unknown") == preload_budget("4g")
+
+def test_knapsack_beats_taking_resources_in_order():
+    resources = ["/hero.jpg", "/app.css", "/inter.woff2", "/app.js"]
+    sizes = sized({"/hero.jpg": 90 * 1024, "/app.css": 30 * 1024, "/inter.woff2": 25 * 1024, "/app.js": 40 * 1024})
+    result = optimize_preloads(resources, sizes, 100 * 1024)
+    # The large hero image alone would fill most of the budget
+    assert set(result["preloads"]) == {"/app.css", "/inter.woff2", "/app.js"}
+    assert result["expected_critical_bytes"] == 95 * 1024 <= result["budget_bytes"]
+    assert result["skipped"] == [{"href": "/hero.jpg", "bytes": 90 * 1024}]
+    # Ordered by priority per byte
+    assert result["preloads"] == ["/app.css", "/inter.woff2", "/app.js"]
+
+def test_choice_is_optimal_within_the_budget():
+    rng = random.Random(7)
+    extensions = [".css", ".woff2", ".png", ".js", ".json"]
+    # 13 candidates can exceed MAX_PRELOADS under the larger budgets
+    for trial in range(30):
+        candidates = 7 if trial < 20 else MAX_PRELOADS + 3
+        resources = [f"/r{i}{rng.choice(extensions)}" for i in range(candidates)]
+        sizes = sized({href: rng.randrange(1, 60) * KNAPSACK_UNIT for href in resources})
+        budget = rng.randrange(20, 150 if trial < 20 else 600) * KNAPSACK_UNIT
+        result = optimize_preloads(resources, sizes, budget)
+        assert result["expected_critical_bytes"] <= budget
+        assert len(result["preloads"]) <= MAX_PRELOADS
+
+        best = max(
+            value(resources, subset)
+            for count in range(min(len(resources), MAX_PRELOADS) + 1)
+            for subset in itertools.combinations(resources, count)
+            if sum(sizes[href]["bytes"] for href in subset) <= budget
+        )
+        assert abs(value(resources, result["preloads"]) - best) < 1e-9
+
+def test_preload_count_is_capped():
+    resources = [f"/font{i}.woff2" for i in range(15)]
+    result = optimize_preloads(resources, sized({href: 1024 for href in resources}), 1 << 20)
+    assert len(result["preloads"]) == MAX_PRELOADS
+
+def test_priority_outranks_position():
+    # A stylesheet listed last still beats a font listed first
+    resources = ["/inter.woff2", "/app.css"]
+    result = optimize_preloads(resources, sized({"/inter.woff2": 20 * 1024, "/app.css": 20 * 1024}), 30 * 1024)
+    assert result["preloads"] == ["/app.css"]
+
+def test_sizes_use_gzip_for_built_files_and_estimates_otherwise(write_file, tmp_path):
+    write_file("dist/app.js", "console.log('hello world');\n" * 500)
+    sizes = resource_sizes(["/app.js", "/missing.css"], str(tmp_path / "dist"))
+    assert sizes["/app.js"]["estimated"] is False
+    assert 0 < sizes["/app.js"]["bytes"] < 500 * 28
+    assert sizes["/missing.css"] == {"bytes": resource_hints.ESTIMATED_BYTES["style"], "estimated": True}
+
+def test_hints_report_a_choice_per_profile(write_file, tmp_path):
+    write_file("dist/app.css", "body { margin: 0 }\n" * 100)
+    request = ResourceHintsRequest(
+        page_url="/",
+        critical_resources=["/app.css", "/hero.jpg"],
+        next_pages=[],
+        build_dir=str(tmp_path / "dist"),
+        connection_type="slow-2g",
+        connection_profiles=["desktop"]
+    )
+    result = generate_resource_hints(request)
+    assert set(result["profiles"]) == {"slow-2g", "desktop"}
+    # 9.4 KB fits on slow-2g only without the estimated 100 KB hero image
+    assert result["priority_order"] == ["/app.css"]
+    assert set(result["profiles"]["desktop"]["preloads"]) == {"/app.css", "/hero.jpg"}
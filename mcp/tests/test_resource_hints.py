@@ -0,0 +1,117 @@
+"""
+Resource hints derived from the built page and the Vite manifest
+"""
+
+import functools
+import os
+import shutil
+
+import pytest
+
+from mcp.utils import manifest_graph, resource_hints
+from mcp.utils.resource_hints import analyze_page_resources, collect_page_resources
+
+@pytest.fixture
+def build(vite_build, monkeypatch):
+    monkeypatch.setattr(
+        resource_hints, "analyze_critical_path",
+        functools.partial(manifest_graph.analyze_critical_path, router_path=vite_build["router"])
+    )
+    return vite_build
+
+def tiers(result):
+    return {resource["href"]: resource["tier"] for resource in result["resources"]}
+
+def test_resources_follow_the_critical_path(build):
+    files = build["files"]
+    result = collect_page_resources("/work", build["dir"])
+    assert result["page"] == "index.html"
+    assert tiers(result) == {
+        f"/{files['css']}": resource_hints.TIER_BLOCKING_CSS,
+        f"/{files['font']}": resource_hints.TIER_FONT,
+        "/hero.webp": resource_hints.TIER_LCP_IMAGE,
+        f"/{files['entry']}": resource_hints.TIER_ENTRY_JS,
+        f"/{files['chart']}": resource_hints.TIER_STATIC_IMPORT,
+        f"/{files['vendor']}": resource_hints.TIER_STATIC_IMPORT,
+        f"/{files['work']}": resource_hints.TIER_ROUTE
+    }
+    # Ordered by tier, then larger files first within a tier
+    ordered = [(resource["tier"], -resource["bytes"]) for resource in result["resources"]]
+    assert ordered == sorted(ordered)
+
+def test_only_the_current_route_chunk_is_included(build):
+    files = build["files"]
+    about = tiers(collect_page_resources("/about", build["dir"]))
+    assert f"/{files['about']}" in about and f"/{files['work']}" not in about
+
+def test_hints_tags_and_link_headers(build):
+    files = build["files"]
+    analysis = analyze_page_resources("/work", build["dir"])
+    hints = {hint["href"]: hint for hint in analysis["hints"]}
+    assert hints[f"/{files['font']}"] == {
+        "rel": "preload", "href": f"/{files['font']}", "as_": "font", "crossorigin": "anonymous", "type_": "font/woff2"
+    }
+    assert hints[f"/{files['entry']}"] == {"rel": "modulepreload", "href": f"/{files['entry']}"}
+    assert '<link rel="preload" href="/hero.webp" as="image" fetchpriority="high">' in analysis["html_tags"]
+    assert "</hero.webp>; rel=preload; as=image; fetchpriority=high" in analysis["link_headers"]
+    assert analysis["priority_order"][0] == f"/{files['css']}"
+
+def test_lazy_images_are_not_lcp_candidates(build, write_file):
+    write_file(
+        "dist/gallery/index.html",
+        '<html><head></head><body><img src="/thumb.webp" loading="lazy">'
+        '<img src="/hero.webp" fetchpriority="high"></body></html>'
+    )
+    result = tiers(collect_page_resources("/gallery/", build["dir"]))
+    assert result == {"/hero.webp": resource_hints.TIER_LCP_IMAGE}
+
+def test_results_are_cached_until_the_page_changes(build, monkeypatch):
+    first = collect_page_resources("/about", build["dir"])
+    parse = resource_hints.PageResourceParser.feed
+    calls = []
+    monkeypatch.setattr(resource_hints.PageResourceParser, "feed", lambda self, data: calls.append(1) or parse(self, data))
+    assert collect_page_resources("/about", build["dir"]) == first
+    assert calls == []
+
+    index = os.path.join(build["dir"], "index.html")
+    with open(index, "a", encoding="utf-8") as f:
+        f.write("<!-- rebuilt -->")
+    collect_page_resources("/about", build["dir"])
+    assert calls == [1]
+
+def test_cache_follows_referenced_files_per_build_dir(build, monkeypatch):
+    def hero_bytes(build_dir):
+        result = collect_page_resources("/work", build_dir)
+        return next(resource["bytes"] for resource in result["resources"] if resource["href"] == "/hero.webp")
+
+    assert hero_bytes(build["dir"]) == 30004
+    with open(os.path.join(build["dir"], "hero.webp"), "ab") as f:
+        f.write(b"\0" * 996)
+    assert hero_bytes(build["dir"]) == 31000
+
+    # A second build serving the same route keeps its own entry
+    other = build["dir"] + "-next"
+    shutil.copytree(build["dir"], other)
+    with open(os.path.join(other, "hero.webp"), "wb") as f:
+        f.write(b"RIFF" + b"\0" * 100)
+    assert hero_bytes(other) == 104
+
+    parse = resource_hints.PageResourceParser.feed
+    calls = []
+    monkeypatch.setattr(resource_hints.PageResourceParser, "feed", lambda self, data: calls.append(1) or parse(self, data))
+    assert hero_bytes(build["dir"]) == 31000 and hero_bytes(other) == 104
+    assert calls == []
+
+def test_manifest_is_loaded_once_per_page(build, monkeypatch):
+    load = manifest_graph.ManifestGraph.load.__func__
+    calls = []
+    monkeypatch.setattr(
+        manifest_graph.ManifestGraph, "load",
+        classmethod(lambda cls, build_dir: calls.append(build_dir) or load(cls, build_dir))
+    )
+    result = collect_page_resources("/work", build["dir"])
+    assert f"/{build['files']['work']}" in tiers(result)
+    assert calls == [build["dir"]]
+
+def test_missing_build_reports_an_error(tmp_path):
+    assert "error" in analyze_page_resources("/", str(tmp_path))
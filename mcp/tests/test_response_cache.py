@@ -0,0 +1,93 @@
+"""
+Memoized responses for the pure analysis endpoints
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from mcp.main import app
+from mcp.models.seo import PageData
+from mcp.utils.response_cache import ResponseCache, canonical_key, memoize_response, response_cache
+
+PAGE = {
+    "title": "Design Systems Guide | Studio",
+    "description": "A practical guide to building design systems that scale across product teams and platforms.",
+    "url": "https://example.com/guide"
+}
+
+def request(method: str, path: str, **kwargs):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(scenario())
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+def test_equivalent_inputs_share_a_key():
+    reordered = {key: PAGE[key] for key in reversed(list(PAGE))}
+    assert canonical_key("/r", {"page": PageData(**PAGE)}) == canonical_key("/r", {"page": PageData(**reordered)})
+    assert canonical_key("/r", {"page": PageData(**PAGE)}) != canonical_key("/other", {"page": PageData(**PAGE)})
+
+def test_lru_eviction_and_counters():
+    cache = ResponseCache(max_entries=2)
+    cache.set("/a", "k1", 1, 60)
+    cache.set("/a", "k2", 2, 60)
+    assert cache.get("/a", "k1") == 1
+    cache.set("/b", "k3", 3, 60)
+    assert cache.get("/a", "k2") is None
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["routes"]["/a"] == {"hits": 1, "misses": 1, "expired": 0, "evictions": 1, "hit_rate": 0.5}
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mcp.utils.response_cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache()
+    cache.set("/a", "k", "value", 10)
+    assert cache.get("/a", "k") == "value"
+    now[0] += 11
+    assert cache.get("/a", "k") is None
+    assert cache.stats()["routes"]["/a"]["expired"] == 1
+
+def test_positional_and_keyword_calls_share_an_entry_and_errors_are_not_cached():
+    cache = ResponseCache()
+    calls = []
+
+    @memoize_response("/double", ttl_seconds=60, cache=cache)
+    async def double(value: int, fail: bool = False):
+        calls.append(value)
+        if fail:
+            raise HTTPException(status_code=500, detail="boom")
+        return value * 2
+
+    async def scenario():
+        first = await double(2)
+        second = await double(value=2)
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await double(3, fail=True)
+        return first, second
+
+    assert asyncio.run(scenario()) == (4, 4)
+    assert calls == [2, 3, 3]
+
+def test_repeated_requests_are_served_from_the_cache():
+    first = request("POST", "/seo/validate", json=PAGE)
+    second = request("POST", "/seo/validate", json={key: PAGE[key] for key in reversed(list(PAGE))})
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+
+    stats = request("GET", "/cache/memoization-stats").json()
+    assert stats["routes"]["/seo/validate"]["hits"] == 1
+    assert stats["routes"]["/seo/validate"]["misses"] == 1
+
+    assert request("DELETE", "/cache/memoization").json() == {"cleared": True}
+    assert request("GET", "/cache/memoization-stats").json()["entries"] == 0
@@ -0,0 +1,95 @@
+"""
+Bulk SEO validation with streamed NDJSON results
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from mcp.main import app
+from mcp.utils.seo_bulk import DuplicateIndex, iter_bulk_seo, iter_ndjson
+
+DESCRIPTION = (
+    "A practical guide to building design systems that scale across product teams, "
+    "with tokens, components and documentation."
+)
+
+def page(url: str, title: str = "Design Systems Guide for Product Teams | Studio", description: str = DESCRIPTION):
+    return {"title": title, "description": description, "url": url}
+
+def request(method: str, path: str, **kwargs):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(scenario())
+
+def ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+def test_duplicates_ignore_case_and_whitespace():
+    index = DuplicateIndex()
+    assert index.add("Home | Studio", "/a") == []
+    assert index.add("  home |   STUDIO ", "/b") == ["/a"]
+    assert index.add("", "/c") == []
+    assert index.duplicates() == [{"text": "Home | Studio", "urls": ["/a", "/b"]}]
+
+def test_results_flag_cross_page_duplicates_and_rejects():
+    results = list(iter_bulk_seo([
+        page("https://example.com/a"),
+        page("https://example.com/b"),
+        {"title": "Missing url"},
+        ValueError("Expecting value")
+    ]))
+    assert results[0]["valid"] is True
+    assert results[1]["valid"] is False
+    assert "Duplicate title (also used by https://example.com/a)" in results[1]["errors"]
+    assert any(warning.startswith("Duplicate description") for warning in results[1]["warnings"])
+    assert results[2]["type"] == results[3]["type"] == "error"
+    assert results[3]["error"] == "Invalid JSON: Expecting value"
+
+    summary = results[-1]
+    assert (summary["pages"], summary["valid"], summary["invalid"], summary["rejected"]) == (2, 1, 1, 2)
+    assert summary["duplicate_titles"][0]["urls"] == ["https://example.com/a", "https://example.com/b"]
+
+def test_ndjson_lines_may_span_chunks():
+    async def chunks():
+        yield b'{"a": 1}\n{"b"'
+        yield b': 2}\n\nnot json\n'
+        yield b'{"c": 3}'
+
+    async def collect():
+        return [item async for item in iter_ndjson(chunks())]
+
+    items = asyncio.run(collect())
+    assert items[:2] == [{"a": 1}, {"b": 2}]
+    assert isinstance(items[2], ValueError)
+    assert items[3] == {"c": 3}
+
+def test_ndjson_line_split_into_single_bytes():
+    line = json.dumps({"title": "x" * 500}).encode("utf-8")
+
+    async def chunks():
+        for byte in line + b"\n" + line:
+            yield bytes([byte])
+
+    async def collect():
+        return [item async for item in iter_ndjson(chunks())]
+
+    assert asyncio.run(collect()) == [{"title": "x" * 500}] * 2
+
+def test_bulk_routes_accept_arrays_and_ndjson():
+    pages = [page("https://example.com/a"), page("https://example.com/b", title="Selected Work and Case Studies | Studio")]
+    results = ndjson(request("POST", "/seo/validate-bulk", json=pages))
+    assert [result["type"] for result in results] == ["page", "page", "summary"]
+    assert "meta" not in results[0]
+
+    body = "".join(json.dumps(item) + "\n" for item in pages).encode("utf-8")
+    results = ndjson(request(
+        "POST", "/seo/generate-meta-bulk", content=body, headers={"content-type": "application/x-ndjson"}
+    ))
+    assert results[0]["meta"]["meta_tags"]["title"] == pages[0]["title"]
+    assert results[-1]["pages"] == 2
+
+    assert request("POST", "/seo/validate-bulk", json={"not": "a list"}).status_code == 400
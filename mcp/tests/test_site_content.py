@@ -0,0 +1,89 @@
+"""
+Site-wide content analysis streamed from a process pool
+"""
+
+import pytest
+
+from mcp.utils import site_content
+
+ARTICLE = """---
+title: "Design Tokens"
+---
+# Design Tokens
+
+Tokens keep spacing, colour and type consistent across every product team.
+
+![Token map](/tokens.png)
+
+Read the [guide](/guide) for details.
+"""
+
+PAGE = """
+export default function About() {
+  const year = 2024;
+  return (
+    <main>
+      <title>About us</title>
+      <h1>About the studio</h1>
+      <p>We design and build calm, fast interfaces.</p>
+      <img src="/team.jpg" alt="The team" />
+      {year}
+    </main>
+  );
+}
+"""
+
+@pytest.fixture
+def site(write_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(site_content, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(site_content, "_cache", site_content.JsonFileCache(f"content-{tmp_path.name}.json", 100))
+    write_file("content/tokens.md", ARTICLE)
+    write_file("src/pages/About.tsx", PAGE)
+    write_file("src/pages/About.test.tsx", "test('renders', () => {});")
+    return tmp_path
+
+def test_markdown_becomes_analyzable_html():
+    extracted = site_content.extract_markdown(ARTICLE)
+    assert extracted["title"] == "Design Tokens"
+    assert "<h1>Design Tokens</h1>" in extracted["html"]
+    assert '<img src="/tokens.png" alt="Token map">' in extracted["html"]
+    assert '<a href="/guide">guide</a>' in extracted["html"]
+
+def test_jsx_keeps_markup_and_text_but_not_code():
+    extracted = site_content.extract_jsx(PAGE)
+    assert extracted["title"] == "About us"
+    assert "<h1>" in extracted["html"] and "About the studio" in extracted["html"]
+    assert "<p>The team</p>" in extracted["html"]
+    assert "const" not in extracted["html"] and "year" not in extracted["html"]
+
+def test_pages_stream_then_summary_and_reruns_hit_the_cache(site):
+    results = list(site_content.iter_site_analysis(max_workers=2))
+    pages = {result["path"]: result for result in results if result["type"] == "page"}
+    assert set(pages) == {"content/tokens.md", "src/pages/About.tsx"}
+    assert pages["content/tokens.md"]["page_type"] == "blog-post"
+    assert not any(page["cached"] for page in pages.values())
+    assert results[-1]["type"] == "summary"
+    assert results[-1]["pages"] == 2 and results[-1]["analyzed"] == 2 and results[-1]["failed"] == []
+
+    rerun = list(site_content.iter_site_analysis())
+    assert all(result["cached"] for result in rerun if result["type"] == "page")
+    assert rerun[-1]["cached"] == 2
+
+def test_a_failing_page_yields_an_error_line(site, monkeypatch):
+    analyze = site_content.analyze_content
+
+    def flaky(html, kind, keywords):
+        if kind == "about":
+            raise RuntimeError("analyzer crashed")
+        return analyze(html, kind, keywords)
+
+    monkeypatch.setattr(site_content, "analyze_content", flaky)
+    results = list(site_content.iter_site_analysis(max_workers=2))
+    errors = [result for result in results if result["type"] == "error"]
+    assert errors == [{"type": "error", "path": "src/pages/About.tsx", "error": "RuntimeError: analyzer crashed"}]
+    assert results[-1]["pages"] == 1 and results[-1]["failed"] == ["src/pages/About.tsx"]
+
+    # Failures are not cached: the page is analyzed again once fixed
+    monkeypatch.setattr(site_content, "analyze_content", analyze)
+    rerun = {result["path"]: result for result in site_content.iter_site_analysis() if result["type"] == "page"}
+    assert rerun["src/pages/About.tsx"]["cached"] is False
@@ -0,0 +1,106 @@
+"""
+Sitemap XML streaming, sharding into an index and gzip output
+"""
+
+import asyncio
+import gzip
+import json
+import os
+
+import httpx
+import pytest
+
+from mcp.main import app
+from mcp.models.seo import PageData
+from mcp.utils import seo_generator
+from mcp.utils.seo_generator import SitemapWriter, iter_sitemap_xml, write_sitemaps
+
+def page_dicts(count: int):
+    return [
+        {"title": f"Page {i}", "description": "A page", "url": f"https://example.com/p/{i}?a=1&b=2"}
+        for i in range(count)
+    ]
+
+def pages(count: int):
+    return [PageData(**page) for page in page_dicts(count)]
+
+def request(method: str, path: str, **kwargs):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(scenario())
+
+def test_streamed_xml_is_escaped_and_lazily_consumed(monkeypatch):
+    monkeypatch.setattr(seo_generator, "SITEMAP_CHUNK_BYTES", 256)
+    consumed = []
+
+    def lazy():
+        for page in pages(10):
+            consumed.append(page.url)
+            yield page
+
+    chunks = iter_sitemap_xml(lazy(), lastmod="2026-01-01")
+    first = next(chunks)
+    assert len(consumed) < 10
+    document = first + "".join(chunks)
+    assert document.count("<url>") == 10
+    assert "<loc>https://example.com/p/0?a=1&amp;b=2</loc>" in document
+    assert document.endswith("</urlset>")
+
+def test_small_sitemap_is_a_single_file(tmp_path):
+    result = write_sitemaps(pages(3), str(tmp_path))
+    assert result["index"] is False and result["urls"] == 3
+    assert os.listdir(tmp_path) == ["sitemap.xml"]
+
+def test_sharding_writes_an_index_with_absolute_locations(tmp_path):
+    result = write_sitemaps(pages(5), str(tmp_path), base_url="https://example.com/", compress=True, max_urls=2)
+    assert result["index"] is True
+    assert [shard["urls"] for shard in result["files"]] == [2, 2, 1]
+    with gzip.open(tmp_path / "sitemap.xml.gz", "rt") as f:
+        index = f.read()
+    assert "<loc>https://example.com/sitemap-3.xml.gz</loc>" in index
+    with gzip.open(tmp_path / "sitemap-1.xml.gz", "rt") as f:
+        assert f.read().count("<url>") == 2
+
+def test_sharding_requires_an_absolute_base_url(tmp_path):
+    with pytest.raises(ValueError):
+        SitemapWriter(str(tmp_path), base_url="/sitemaps")
+    with pytest.raises(ValueError):
+        write_sitemaps(pages(3), str(tmp_path), max_urls=2)
+    # Partial shards are removed
+    assert os.listdir(tmp_path) == []
+
+def test_route_keeps_the_json_shape_and_streams_xml_on_request():
+    body = page_dicts(2)
+    wrapped = request("POST", "/seo/generate-sitemap", json=body)
+    assert wrapped.json()["sitemap"].count("<url>") == 2
+
+    response = request("POST", "/seo/generate-sitemap?response_format=xml", json=body)
+    assert response.headers["content-type"].startswith("application/xml")
+    assert response.text.count("<url>") == 2
+
+    compressed = request("POST", "/seo/generate-sitemap?response_format=xml&gzip=true", json=body)
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert request("POST", "/seo/generate-sitemap?gzip=true", json=body).status_code == 400
+
+def test_route_writes_ndjson_bodies_to_disk(tmp_path):
+    lines = "".join(json.dumps(page) + "\n" for page in page_dicts(3))
+    response = request(
+        "POST", f"/seo/generate-sitemap?output_dir={tmp_path}",
+        content=lines.encode("utf-8"), headers={"content-type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.json()["urls"] == 3
+
+    invalid = request(
+        "POST", f"/seo/generate-sitemap?output_dir={tmp_path / 'bad'}",
+        content=lines.encode("utf-8") + b'{"title": "no url"}\n', headers={"content-type": "application/x-ndjson"}
+    )
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"].startswith("Page 3:")
+    assert os.listdir(tmp_path / "bad") == []
+
+def test_route_rejects_relative_base_url(tmp_path):
+    response = request("POST", f"/seo/generate-sitemap?output_dir={tmp_path}&base_url=/sitemaps", json=[])
+    assert response.status_code == 400
@@ -0,0 +1,92 @@
+"""
+Source map byte attribution
+"""
+
+import json
+
+from mcp.utils.source_maps import (
+    attribute_build_directory, attribute_chunk, normalize_source, source_package
+)
+
+_BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+def vlq(value: int) -> str:
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    text = ""
+    while True:
+        digit = value & 31
+        value >>= 5
+        text += _BASE64[digit | (32 if value else 0)]
+        if not value:
+            return text
+
+def encode_mappings(lines):
+    """
+    lines: per generated line, a list of (column, source index or None)
+    """
+    encoded = []
+    source = 0
+    for segments in lines:
+        previous_column = 0
+        parts = []
+        for column, index in segments:
+            part = vlq(column - previous_column)
+            previous_column = column
+            if index is not None:
+                part += vlq(index - source) + vlq(0) + vlq(0)
+                source = index
+            parts.append(part)
+        encoded.append(",".join(parts))
+    return ";".join(encoded)
+
+def write_chunk(write_file, name, code_lines, mappings, sources, **extra):
+    chunk = write_file(f"dist/assets/{name}", "\n".join(code_lines) + "\n//# sourceMappingURL=" + name + ".map")
+    source_map = {"version": 3, "sources": sources, "sourcesContent": ["x" * 5000] * len(sources),
+                  "mappings": encode_mappings(mappings), **extra}
+    write_file(f"dist/assets/{name}.map", json.dumps(source_map))
+    return chunk
+
+def test_bytes_are_credited_between_segments(write_file):
+    code = ["import r from'react';", "console.log(r);"]
+    chunk = write_chunk(
+        write_file, "index.js", code,
+        [[(0, 0), (7, 1), (20, None)], [(0, 0)]],
+        ["../src/main.ts", "../node_modules/react/index.js"]
+    )
+    result = attribute_chunk(chunk, chunk + ".map")
+    # A line's newline belongs to its last segment
+    assert result["sources"] == {"src/main.ts": 7 + len(code[1]) + 1, "node_modules/react/index.js": 13}
+    # The unmapped ";\n" segment and the sourceMappingURL line
+    assert result["unmapped_bytes"] == 2 + len("//# sourceMappingURL=index.js.map")
+    assert sum(result["sources"].values()) + result["unmapped_bytes"] == result["total_bytes"]
+
+def test_multibyte_lines_are_measured_in_utf8_bytes(write_file):
+    chunk = write_chunk(write_file, "i18n.js", ['const s="héllo";'], [[(0, 0), (8, 1)]], ["a.ts", "b.ts"])
+    result = attribute_chunk(chunk, chunk + ".map")
+    assert result["sources"] == {"a.ts": 8, "b.ts": len('"héllo";\n'.encode("utf-8"))}
+
+def test_columns_count_utf16_code_units(write_file):
+    # The emoji is one code point but two UTF-16 units, so b.ts starts at column 13
+    chunk = write_chunk(write_file, "emoji.js", ['const s="😀";f();'], [[(0, 0), (13, 1)]], ["a.ts", "b.ts"])
+    result = attribute_chunk(chunk, chunk + ".map")
+    assert result["sources"] == {"a.ts": len('const s="😀";'.encode("utf-8")), "b.ts": len("f();\n")}
+
+def test_source_paths_and_packages():
+    assert normalize_source("webpack:///./src/App.tsx?abcd") == "src/App.tsx"
+    assert normalize_source("App.tsx", "../src/") == "src/App.tsx"
+    assert source_package("node_modules/@tanstack/react-query/build/index.js") == "@tanstack/react-query"
+    assert source_package("node_modules/.pnpm/lodash@4/node_modules/lodash/lodash.js") == "lodash"
+    assert source_package("src/main.ts") == "(app)"
+
+def test_build_directory_groups_by_package(tmp_path, write_file):
+    write_chunk(write_file, "a.js", ["aaaaabbbbb"], [[(0, 0), (5, 1)]],
+                ["../src/a.ts", "../node_modules/react/index.js"])
+    write_chunk(write_file, "b.js", ["cccccccccc"], [[(0, 0)]], ["../node_modules/react/cjs/react.js"])
+    write_file("dist/assets/broken.js", "x")
+    write_file("dist/assets/broken.js.map", '{"version": 3, "sections": []}')
+
+    result = attribute_build_directory(str(tmp_path / "dist"), max_workers=2)
+    assert result["chunks_analyzed"] == 2
+    assert result["packages"] == [{"name": "react", "bytes": 17}, {"name": "(app)", "bytes": 5}]
+    assert result["treemap"]["size"] == 22
+    assert [error["chunk"] for error in result["errors"]] == ["broken.js"]
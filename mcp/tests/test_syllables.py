@@ -0,0 +1,53 @@
+"""
+Memoized, dictionary-backed syllable counting
+"""
+
+import pytest
+
+from mcp import build_syllable_dict
+from mcp.utils import content_analyzer
+from mcp.utils.content_analyzer import count_syllables, heuristic_syllables, load_syllable_dict
+
+CMUDICT = """;;; comment line
+area  EH1 R IY0 AH0
+area(1)  AE1 R IY0 AH0
+cake  K EY1 K
+poem  P OW1 AH0 M
+idea  AY0 D IY1 AH0
+"""
+
+@pytest.fixture
+def syllable_dict(tmp_path, monkeypatch):
+    source = tmp_path / "cmudict.dict"
+    source.write_text(CMUDICT, encoding="latin-1")
+    output = tmp_path / "syllables.txt"
+    build_syllable_dict.main([str(source), "-o", str(output)])
+
+    monkeypatch.setattr(content_analyzer, "_syllable_dict", load_syllable_dict(output))
+    count_syllables.cache_clear()
+    yield output
+    count_syllables.cache_clear()
+
+def test_cmudict_counts_stressed_vowels_first_pronunciation_wins(tmp_path):
+    source = tmp_path / "cmudict.dict"
+    source.write_text(CMUDICT, encoding="latin-1")
+    assert build_syllable_dict.read_cmudict(str(source)) == {"area": 3, "cake": 1, "poem": 2, "idea": 3}
+
+def test_only_words_the_heuristic_gets_wrong_are_kept(syllable_dict):
+    assert heuristic_syllables("cake") == 1
+    lines = syllable_dict.read_text().splitlines()
+    assert lines == ["2 poem", "3 area idea"]
+
+def test_dictionary_overrides_heuristic(syllable_dict):
+    assert heuristic_syllables("poem") == 1
+    assert count_syllables("Poem") == 2
+    assert count_syllables("cake") == 1
+
+def test_results_are_memoized(syllable_dict):
+    count_syllables("area")
+    count_syllables("area")
+    info = count_syllables.cache_info()
+    assert info.hits >= 1 and info.misses == 1
+
+def test_missing_dictionary_falls_back_to_heuristic(tmp_path):
+    assert load_syllable_dict(tmp_path / "missing.txt") == {}
@@ -1,4 +1,5 @@
-# MCP Utils Package
+"""
+MCP Utils Package
 
 This package contains utility functions for the MCP Optimization Server.
-
+"""
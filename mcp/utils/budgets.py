@@ -0,0 +1,239 @@
+"""
+Performance Budgets Utility
+Evaluates a declarative budgets file against build output, recomputing
+only the budgets whose assets changed since the previous evaluation
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from mcp.utils.disk_cache import JsonFileCache
+
+BUDGETS_PATH = Path(__file__).parent.parent.parent / "performance-budgets.json"
+
+ASSET_TYPES = {
+    "js": (".js", ".mjs"),
+    "css": (".css",),
+    "image": (".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico"),
+    "font": (".woff", ".woff2", ".ttf", ".otf", ".eot"),
+    "html": (".html",)
+}
+
+TOTAL_METRICS = ("size_kb", "gzip_kb", "brotli_kb", "max_chunks")
+TYPE_METRICS = ("size_kb", "gzip_kb", "brotli_kb", "max_count")
+ROUTE_METRICS = ("js_kb", "css_kb", "total_kb", "gzip_kb")
+
+# Per build directory: file fingerprints and budget results from the last run
+_state = JsonFileCache("budgets.json")
+
+def asset_type(file_name: str) -> str:
+    lowered = file_name.lower()
+    for name, extensions in ASSET_TYPES.items():
+        if lowered.endswith(extensions):
+            return name
+    return "other"
+
+def load_budgets(path: Optional[str] = None) -> Dict:
+    """
+    Read a budgets file:
+
+        {
+          "total": {"gzip_kb": 500, "max_chunks": 40},
+          "asset_types": {"js": {"gzip_kb": 350}, "image": {"size_kb": 2000}},
+          "routes": {"*": {"js_kb": 250}, "/": {"gzip_kb": 150}}
+        }
+
+    Route "*" applies to every route without its own entry.
+    """
+    with open(path or BUDGETS_PATH, "r") as f:
+        return json.load(f)
+
+def _spec_hash(limit, extra=None) -> str:
+    return hashlib.sha1(json.dumps([limit, extra], sort_keys=True).encode()).hexdigest()
+
+def _fingerprints(analysis: Dict, build_dir: str) -> Dict[str, list]:
+    fingerprints = {}
+    for entry in analysis.get("chunks", []) + analysis.get("assets", []):
+        name = os.path.relpath(entry["path"], build_dir).replace(os.sep, "/")
+        fingerprints[name] = [entry["size_kb"], entry["gzip_kb"], entry["brotli_kb"]]
+    return fingerprints
+
+def _changed_files(previous: Dict[str, list], current: Dict[str, list]) -> set:
+    changed = {name for name, fingerprint in current.items() if previous.get(name) != fingerprint}
+    changed.update(name for name in previous if name not in current)
+    return changed
+
+def _check(budget_id: str, scope: str, metric: str, limit: float, actual: float) -> Dict:
+    actual = round(actual, 2)
+    overage = round(actual - limit, 2) if actual > limit else 0
+    return {
+        "id": budget_id,
+        "scope": scope,
+        "metric": metric,
+        "limit": limit,
+        "actual": actual,
+        "passed": overage == 0,
+        "overage": overage,
+        "overage_percent": round(overage / limit * 100, 1) if limit else None
+    }
+
+def _type_totals(fingerprints: Dict[str, list], type_name: Optional[str]) -> Dict[str, float]:
+    totals = {"size_kb": 0.0, "gzip_kb": 0.0, "brotli_kb": 0.0, "count": 0, "chunks": 0}
+    for name, (size_kb, gzip_kb, brotli_kb) in fingerprints.items():
+        file_type = asset_type(name)
+        if type_name is not None and file_type != type_name:
+            continue
+        totals["size_kb"] += size_kb
+        totals["gzip_kb"] += gzip_kb
+        totals["brotli_kb"] += brotli_kb
+        totals["count"] += 1
+        if file_type in ("js", "css"):
+            totals["chunks"] += 1
+    return totals
+
+class BudgetEvaluator:
+    """
+    Incremental budget checks for one build directory.
+
+    Each result remembers the files it depends on (all files for totals,
+    one asset type, or a route's manifest closure). On re-evaluation only
+    budgets whose limit changed or whose dependencies intersect the changed
+    files are recomputed; the rest are reused from the previous run.
+    """
+
+    def __init__(self, build_dir: str):
+        self.build_dir = build_dir
+        self.key = os.path.abspath(build_dir)
+
+    def evaluate(self, analysis: Dict, budgets: Dict) -> Dict:
+        state = _state.get(self.key) or {"files": {}, "results": {}}
+        fingerprints = _fingerprints(analysis, self.build_dir)
+        changed = _changed_files(state["files"], fingerprints)
+        previous = state["results"]
+
+        results: Dict[str, Dict] = {}
+        recomputed = 0
+
+        def reusable(budget_id: str, spec: str, depends) -> bool:
+            entry = previous.get(budget_id)
+            return entry is not None and entry["spec"] == spec and not depends(entry)
+
+        # Total and per-asset-type budgets: sums over fingerprints
+        scopes: List[Tuple[str, Optional[str], Dict, Tuple]] = [("total", None, budgets.get("total", {}), TOTAL_METRICS)]
+        for type_name, limits in budgets.get("asset_types", {}).items():
+            scopes.append((f"type:{type_name}", type_name, limits, TYPE_METRICS))
+
+        for scope, type_name, limits, metrics in scopes:
+            if type_name is None:
+                depends = lambda entry: bool(changed)
+            else:
+                depends = lambda entry, t=type_name: any(asset_type(name) == t for name in changed)
+
+            totals = None
+            for metric in metrics:
+                if metric not in limits:
+                    continue
+                budget_id = f"{scope}.{metric}"
+                spec = _spec_hash(limits[metric])
+                if reusable(budget_id, spec, depends):
+                    results[budget_id] = previous[budget_id]
+                    continue
+                if totals is None:
+                    totals = _type_totals(fingerprints, type_name)
+                actual = totals["chunks"] if metric == "max_chunks" else totals["count"] if metric == "max_count" else totals[metric]
+                results[budget_id] = {"spec": spec, "result": _check(budget_id, scope, metric, limits[metric], actual)}
+                recomputed += 1
+
+        # Route budgets: depend on the route's chunks and the manifest itself
+        route_limits = budgets.get("routes", {})
+        if route_limits:
+            recomputed += self._evaluate_routes(route_limits, previous, changed, results)
+
+        _state.set(self.key, {"files": fingerprints, "results": results})
+        _state.save()
+
+        checks = [entry["result"] for entry in results.values() if entry["result"] is not None]
+        failures = [check for check in checks if not check["passed"]]
+        failures.sort(key=lambda check: -(check["overage_percent"] or 0))
+        return {
+            "passed": not failures,
+            "checked": len(checks),
+            "recomputed": recomputed,
+            "reused": len(checks) - recomputed,
+            "changed_files": sorted(changed),
+            "failures": failures,
+            "budgets": checks
+        }
+
+    def _evaluate_routes(self, route_limits: Dict, previous: Dict, changed: set, results: Dict) -> int:
+        route_entries = {
+            budget_id: entry for budget_id, entry in previous.items() if budget_id.startswith("route:")
+        }
+        manifest_changed = any(name.endswith("manifest.json") for name in changed)
+        stale = manifest_changed or not route_entries or previous.get("routes", {}).get("spec") != _spec_hash(route_limits) \
+            or any(changed.intersection(entry["files"]) for entry in route_entries.values())
+        if not stale:
+            results.update(route_entries)
+            results["routes"] = previous["routes"]
+            return 0
+
+        from mcp.utils.manifest_graph import analyze_critical_path
+
+        critical_path = analyze_critical_path(self.build_dir)
+        results["routes"] = {"spec": _spec_hash(route_limits), "result": None}
+        if "error" in critical_path:
+            results["route:*"] = {
+                "spec": None,
+                "route": "*",
+                "files": [],
+                "result": {
+                    "id": "route:*", "scope": "routes", "metric": None, "limit": None,
+                    "actual": None, "passed": False, "overage": None, "overage_percent": None,
+                    "error": critical_path["error"]
+                }
+            }
+            return 1
+
+        recomputed = 0
+        for route in critical_path["routes"]:
+            limits = route_limits.get(route["path"], route_limits.get("*"))
+            if not limits or "error" in route:
+                continue
+            spec = _spec_hash(limits)
+            actuals = {
+                "js_kb": route["js_bytes"] / 1024,
+                "css_kb": route["css_bytes"] / 1024,
+                "total_kb": route["total_bytes"] / 1024,
+                "gzip_kb": route["gzip_bytes"] / 1024
+            }
+            for metric in ROUTE_METRICS:
+                if metric not in limits:
+                    continue
+                budget_id = f"route:{route['path']}.{metric}"
+                entry = previous.get(budget_id)
+                if entry is not None and entry["spec"] == spec and entry["files"] == route["files"] \
+                        and not changed.intersection(route["files"]):
+                    results[budget_id] = entry
+                    continue
+                results[budget_id] = {
+                    "spec": spec,
+                    "route": route["path"],
+                    "files": route["files"],
+                    "result": _check(budget_id, f"route:{route['path']}", metric, limits[metric], actuals[metric])
+                }
+                recomputed += 1
+        return recomputed
+
+def evaluate_budgets(build_dir: str = "dist", budgets_path: Optional[str] = None) -> Dict:
+    """
+    Analyze a build directory and check it against the budgets file
+    """
+    from mcp.utils.bundle_analyzer import analyze_build_directory
+
+    analysis = analyze_build_directory(build_dir)
+    if "error" in analysis:
+        return analysis
+    return BudgetEvaluator(build_dir).evaluate(analysis, load_budgets(budgets_path))
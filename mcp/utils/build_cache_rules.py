@@ -0,0 +1,240 @@
+"""
+Build Cache Rules Utility
+Classifies every file in a build as fingerprinted or not and emits exact
+per-path cache rules, cached per build ID
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from mcp.utils.bundle_baselines import content_hash_token
+from mcp.utils.cache_optimizer import render_headers_file
+from mcp.utils.disk_cache import JsonFileCache
+from mcp.utils.manifest_graph import find_manifest
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, max-age=0, must-revalidate"
+# Hash-like names that could not be verified, and plain static files
+SHORT_LIVED = "public, max-age=3600, must-revalidate"
+
+# Files whose content must be revalidated on every request regardless of name
+REVALIDATE_EXTENSIONS = (".html", ".json", ".webmanifest", ".xml", ".txt")
+SERVICE_WORKERS = ("sw.js", "service-worker.js", "registerSW.js")
+
+# Hash shapes the manifest can vouch for: Vite's 8-character base64url token
+# with at least one digit, "-" or "_", or a hex digest
+_VITE_HASH = re.compile(r"^(?:[0-9a-f]{10,64}|(?=[A-Za-z0-9_-]*[0-9_-])[A-Za-z0-9_-]{8})$")
+# A word with an optional number (Settings, Footer01) is a name, not a hash
+_WORD_LIKE = re.compile(r"^[A-Za-z][a-z]*[0-9]*$")
+
+RULES_VERSION = 3
+MAX_CACHED_BUILDS = 5
+# Cloudflare rejects rule expressions longer than this many characters
+CLOUDFLARE_MAX_EXPRESSION = 4096
+
+# build ID -> rules, least recently used builds evicted
+_cache = JsonFileCache("cache-rules.json", max_entries=MAX_CACHED_BUILDS)
+
+def _build_files(build_dir: str) -> List[Tuple[str, str]]:
+    files = []
+    for directory, dirs, names in os.walk(build_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(names):
+            path = os.path.join(directory, name)
+            files.append(("/" + os.path.relpath(path, build_dir).replace(os.sep, "/"), path))
+    return files
+
+def build_id(build_dir: str, files: Optional[List[Tuple[str, str]]] = None) -> str:
+    """
+    Identifier of a build's exact file set: paths, sizes and mtimes plus
+    the manifest, without reading file contents
+    """
+    digest = hashlib.sha1(f"{RULES_VERSION}".encode("utf-8"))
+    entries = list(files if files is not None else _build_files(build_dir))
+    manifest = find_manifest(build_dir)
+    if manifest:
+        entries.append(("manifest", manifest))
+    for public, path in entries:
+        stat = os.stat(path)
+        digest.update(f"{public}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+def manifest_files(build_dir: str) -> set:
+    """
+    Public paths of every file Vite emitted with a content hash
+    """
+    path = find_manifest(build_dir)
+    if path is None:
+        return set()
+    with open(path, "r") as f:
+        manifest = json.load(f)
+    files = set()
+    for chunk in manifest.values():
+        files.add("/" + chunk["file"])
+        files.update("/" + file for file in chunk.get("css", []) + chunk.get("assets", []))
+    return files
+
+def _content_digests(path: str) -> List[str]:
+    with open(path, "rb") as f:
+        data = f.read()
+    digests = []
+    for algorithm in ("sha256", "sha1", "md5"):
+        raw = hashlib.new(algorithm, data).digest()
+        digests.append(raw.hex())
+        digests.append(base64.urlsafe_b64encode(raw).decode("ascii").rstrip("="))
+    return digests
+
+def is_vite_hash(token: str) -> bool:
+    """
+    Whether a name token looks like a hash Vite generated rather than part
+    of an ordinary name such as page-Settings.js
+    """
+    return bool(_VITE_HASH.match(token)) and not _WORD_LIKE.match(token)
+
+def classify_file(public_path: str, path: str, emitted: set) -> Dict:
+    """
+    Whether a file name carries a content hash, and how that was checked.
+
+    "content": the token is a prefix of a digest of the file's bytes (Vite
+    names CSS and other assets this way). "manifest-attested": the digest
+    does not match but Vite lists the file in its manifest and the token has
+    Vite's hash shape; JS chunk hashes are computed by Rollup before final
+    rendering, so they cannot be checked against the emitted bytes and the
+    manifest is trusted instead. Anything else is left unverified.
+    """
+    name = os.path.basename(public_path)
+    token = content_hash_token(name)
+    if token is None:
+        return {"fingerprinted": False, "verified_by": None, "token": None}
+    if any(digest.startswith(token) for digest in _content_digests(path)):
+        return {"fingerprinted": True, "verified_by": "content", "token": token}
+    if public_path in emitted and is_vite_hash(token):
+        return {"fingerprinted": True, "verified_by": "manifest-attested", "token": token}
+    return {"fingerprinted": False, "verified_by": None, "token": token}
+
+def cache_control_for(public_path: str, classification: Dict) -> str:
+    name = os.path.basename(public_path)
+    if name in SERVICE_WORKERS or public_path.endswith(REVALIDATE_EXTENSIONS):
+        return REVALIDATE
+    if classification["fingerprinted"]:
+        return IMMUTABLE
+    return SHORT_LIVED
+
+def generate_build_cache_rules(build_dir: str = "dist") -> Dict:
+    """
+    Exact per-path cache rules for a build directory. Results are stored
+    per build ID, so an unchanged build is answered without reading files.
+    """
+    if not os.path.isdir(build_dir):
+        return {"error": f"Build directory not found: {build_dir}"}
+    files = _build_files(build_dir)
+    current = build_id(build_dir, files)
+    cached = _cache.get(current)
+    if cached is not None:
+        return {**cached, "cached": True}
+
+    emitted = manifest_files(build_dir)
+    rules = []
+    counts = {"fingerprinted": 0, "manifest_attested": 0, "unverified": 0, "plain": 0, "revalidate": 0}
+    for public_path, path in files:
+        classification = classify_file(public_path, path, emitted)
+        cache_control = cache_control_for(public_path, classification)
+        if cache_control == REVALIDATE:
+            counts["revalidate"] += 1
+        elif classification["fingerprinted"]:
+            counts["fingerprinted"] += 1
+            counts["manifest_attested"] += classification["verified_by"] == "manifest-attested"
+        elif classification["token"]:
+            counts["unverified"] += 1
+        else:
+            counts["plain"] += 1
+        rule = {
+            "pattern": public_path,
+            "cache_control": cache_control,
+            "etag": True,
+            "last_modified": True,
+            "fingerprinted": classification["fingerprinted"],
+            "verified_by": classification["verified_by"]
+        }
+        rules.append(rule)
+        # Pretty URLs serve the same document as their index.html
+        if public_path.endswith("/index.html"):
+            rules.append({**rule, "pattern": public_path[:-len("index.html")]})
+
+    result = {"build_id": current, "rules": rules, "files": counts}
+    _cache.set(current, result)
+    _cache.save()
+    return {**result, "cached": False}
+
+def build_platform_config(platform: str, rules: List[Dict]) -> Dict:
+    """
+    Exact-path rules in a platform's native config format
+    """
+    if platform == "vercel":
+        return {
+            "headers": [
+                {"source": rule["pattern"], "headers": [{"key": "Cache-Control", "value": rule["cache_control"]}]}
+                for rule in rules
+            ]
+        }
+    if platform == "netlify":
+        headers = [{"for": rule["pattern"], "values": {"Cache-Control": rule["cache_control"]}} for rule in rules]
+        return {"headers": headers, "_headers": render_headers_file(headers, {})}
+    if platform == "cloudflare":
+        cache_rules = []
+        for cache_control, expressions in _cloudflare_expressions(rules).items():
+            max_age = next(
+                (int(part.split("=")[1]) for part in cache_control.split(", ") if part.startswith("max-age=")), 0
+            )
+            cache_rules.extend({"expression": expression, "cache_ttl": max_age} for expression in expressions)
+        return {"cache_rules": cache_rules}
+    return {"headers": {rule["pattern"]: {"Cache-Control": rule["cache_control"]} for rule in rules}}
+
+def _uniform_prefixes(rules: List[Dict]) -> Dict[str, str]:
+    """
+    Directories (other than the root) whose every file shares one policy,
+    outermost first, mapped to that policy
+    """
+    policies: Dict[str, set] = {}
+    for rule in rules:
+        parts = rule["pattern"].strip("/").split("/")[:-1]
+        for depth in range(1, len(parts) + 1):
+            policies.setdefault("/" + "/".join(parts[:depth]) + "/", set()).add(rule["cache_control"])
+    prefixes: Dict[str, str] = {}
+    for prefix in sorted(policies, key=lambda prefix: (prefix.count("/"), prefix)):
+        if len(policies[prefix]) == 1 and not any(prefix.startswith(outer) for outer in prefixes):
+            prefixes[prefix] = next(iter(policies[prefix]))
+    return prefixes
+
+def _cloudflare_expressions(rules: List[Dict], limit: int = CLOUDFLARE_MAX_EXPRESSION) -> Dict[str, List[str]]:
+    """
+    Rule expressions per policy: a starts_with() test for each directory
+    whose files all share the policy, and the remaining exact paths in
+    `in {...}` sets split to stay under Cloudflare's expression length limit
+    """
+    prefixes = _uniform_prefixes(rules)
+    expressions: Dict[str, List[str]] = {}
+    for prefix, cache_control in prefixes.items():
+        expressions.setdefault(cache_control, []).append(f'starts_with(http.request.uri.path, "{prefix}")')
+
+    opening, closing = "http.request.uri.path in {", "}"
+    paths: Dict[str, List[str]] = {}
+    for rule in rules:
+        if not any(rule["pattern"].startswith(prefix) for prefix in prefixes):
+            paths.setdefault(rule["cache_control"], []).append(f'"{rule["pattern"]}"')
+    for cache_control, quoted in paths.items():
+        chunk: List[str] = []
+        length = len(opening) + len(closing)
+        for path in quoted:
+            if chunk and length + 1 + len(path) > limit:
+                expressions.setdefault(cache_control, []).append(opening + " ".join(chunk) + closing)
+                chunk, length = [], len(opening) + len(closing)
+            length += len(path) + (1 if chunk else 0)
+            chunk.append(path)
+        if chunk:
+            expressions.setdefault(cache_control, []).append(opening + " ".join(chunk) + closing)
+    return expressions
@@ -0,0 +1,264 @@
+"""
+Build Watcher Utility
+Watches a build directory and pushes incremental bundle analysis diffs
+to subscribers after each rebuild
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from mcp.utils.bundle_baselines import stable_name
+from mcp.utils.compression import compress_files
+
+try:
+    from watchfiles import awatch
+except ImportError:  # Optional dependency (installed with uvicorn[standard]), falls back to polling
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+def _kb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / 1024, 2)
+
+def _totals(files: Dict[str, Dict]) -> Dict[str, float]:
+    return {
+        field: round(sum(entry[field] for entry in files.values()), 2)
+        for field in ("size_kb", "gzip_kb", "brotli_kb")
+    }
+
+class BuildWatcher:
+    """
+    Incremental analyzer for one build directory.
+
+    Keeps per-file results keyed by (size, mtime). After a rebuild only
+    files whose stat changed are recompressed, and subscribers receive the
+    added/removed/changed files plus new totals. Change events come from
+    inotify (via watchfiles) when available, otherwise from polling, and
+    are debounced so one Vite rebuild produces one diff.
+    """
+
+    def __init__(self, build_dir: str, debounce_ms: int = 200, poll_interval: float = 0.25):
+        self.build_dir = build_dir
+        self.debounce_ms = debounce_ms
+        self.poll_interval = poll_interval
+        self.files: Dict[str, Dict] = {}
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._lock = asyncio.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        for root, dirs, files in os.walk(self.build_dir):
+            for file in files:
+                if file.endswith('.map'):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:  # Removed mid-scan by the bundler
+                    continue
+                stats[os.path.relpath(path, self.build_dir).replace(os.sep, "/")] = (stat.st_size, stat.st_mtime_ns)
+        return stats
+
+    def _analyze(self, names: List[str], stats: Dict[str, Tuple[int, int]]) -> Dict[str, Dict]:
+        """
+        Results for the named files; files the bundler deleted since the
+        scan are left out
+        """
+        paths = {name: os.path.join(self.build_dir, name) for name in names}
+        sizes = compress_files(paths.values(), skip_missing=True)
+        results = {}
+        for name, path in paths.items():
+            if path not in sizes:
+                continue
+            size = stats[name][0]
+            # Precompressed formats (images, fonts) are transferred as-is
+            gzip_size = sizes[path]["gzip"] or size
+            brotli_size = sizes[path]["brotli"] or gzip_size
+            results[name] = {
+                "name": name,
+                "size_kb": _kb(size),
+                "gzip_kb": _kb(gzip_size),
+                "brotli_kb": _kb(brotli_size)
+            }
+        return results
+
+    def refresh(self) -> Dict:
+        """
+        Rescan the directory, re-analyze changed files and return the diff
+
+        Runs in worker threads. Refreshes are serialized, and the new file
+        table is built aside and swapped in whole, so snapshot() on the
+        event loop never sees it half-updated.
+        """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh(self) -> Dict:
+        started = time.perf_counter()
+        stats = self._scan()
+        previous_stats = self._stats
+        previous_files = self.files
+        files = dict(previous_files)
+
+        changed = [name for name, stat in stats.items() if previous_stats.get(name) != stat]
+        results = self._analyze(changed, stats)
+        # Deleted between the scan and compression (Vite empties dist/ first)
+        for name in changed:
+            if name not in results:
+                del stats[name]
+        removed_names = [name for name in previous_stats if name not in stats]
+
+        removed = {name: files.pop(name) for name in removed_names if name in files}
+        added = {name: entry for name, entry in results.items() if name not in files}
+        modified = []
+        for name, entry in results.items():
+            old = files.get(name)
+            files[name] = entry
+            if old is not None:
+                modified.append(self._change(entry, old))
+
+        # A rebuild renames fingerprinted files; pair them up by hash-free name
+        removed_by_stable = defaultdict(list)
+        for name in removed:
+            removed_by_stable[stable_name(name)].append(name)
+        added_by_stable = defaultdict(list)
+        for name in added:
+            added_by_stable[stable_name(name)].append(name)
+        for stable, new_names in added_by_stable.items():
+            old_names = removed_by_stable.get(stable, [])
+            if len(new_names) == 1 and len(old_names) == 1:
+                change = self._change(added.pop(new_names[0]), removed.pop(old_names[0]))
+                change["previous_name"] = old_names[0]
+                modified.append(change)
+
+        self.files = files
+        self._stats = stats
+
+        totals = _totals(files)
+        previous_totals = _totals(previous_files)
+        modified = [change for change in modified if change["size_delta_kb"] or change["gzip_delta_kb"]]
+        modified.sort(key=lambda change: -abs(change["size_delta_kb"]))
+        return {
+            "type": "diff",
+            "build_dir": self.build_dir,
+            "reanalyzed": len(changed),
+            "added": sorted(added.values(), key=lambda entry: -entry["size_kb"]),
+            "removed": sorted(removed.values(), key=lambda entry: -entry["size_kb"]),
+            "changed": modified,
+            "totals": totals,
+            "totals_delta": {field: round(totals[field] - previous_totals[field], 2) for field in totals},
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    @staticmethod
+    def _change(entry: Dict, old: Dict) -> Dict:
+        return {
+            **entry,
+            "size_delta_kb": round(entry["size_kb"] - old["size_kb"], 2),
+            "gzip_delta_kb": round(entry["gzip_kb"] - old["gzip_kb"], 2)
+        }
+
+    def snapshot(self) -> Dict:
+        files = self.files
+        return {
+            "type": "snapshot",
+            "build_dir": self.build_dir,
+            "files": sorted(files.values(), key=lambda entry: -entry["size_kb"]),
+            "totals": _totals(files)
+        }
+
+    async def subscribe(self) -> asyncio.Queue:
+        """
+        Register a subscriber; starts watching on the first one
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        async with self._lock:
+            if self._stop is None or self._stop.is_set():
+                if self._task is not None:
+                    # A loop stopped by the last unsubscribe finishes before a new one starts
+                    await self._task
+                await asyncio.to_thread(self.refresh)
+                self._stop = asyncio.Event()
+                self._task = asyncio.create_task(self._watch(self._stop))
+            self._subscribers.add(queue)
+        return queue
+
+    async def unsubscribe(self, queue: asyncio.Queue):
+        async with self._lock:
+            self._subscribers.discard(queue)
+            if not self._subscribers and self._stop is not None:
+                # The watch loop exits at its next step; awatch is never torn down mid-call
+                self._stop.set()
+
+    def _broadcast(self, message: Dict):
+        for queue in list(self._subscribers):
+            queue.put_nowait(message)
+
+    def _error(self, error: Exception) -> Dict:
+        logger.exception("Watching %s failed", self.build_dir)
+        return {"type": "error", "build_dir": self.build_dir, "error": str(error)}
+
+    async def _publish(self):
+        try:
+            diff = await asyncio.to_thread(self.refresh)
+        except Exception as e:
+            self._broadcast(self._error(e))
+            return
+        if diff["reanalyzed"] or diff["removed"]:
+            self._broadcast(diff)
+
+    async def _watch(self, stop: asyncio.Event):
+        """
+        Publish a diff after every debounced change until stopped; failures
+        are logged and sent to subscribers, then watching resumes
+        """
+        while not stop.is_set():
+            try:
+                await self._watch_changes(stop)
+            except Exception as e:
+                self._broadcast(self._error(e))
+                await asyncio.sleep(self.poll_interval)
+
+    async def _watch_changes(self, stop: asyncio.Event):
+        while not os.path.isdir(self.build_dir):
+            if stop.is_set():
+                return
+            await asyncio.sleep(self.poll_interval)
+
+        if awatch is not None:
+            async for _ in awatch(self.build_dir, debounce=self.debounce_ms, step=50, stop_event=stop):
+                await self._publish()
+            return
+
+        # Polling fallback: publish once the tree has been quiet for the debounce window
+        last_stats = self._stats
+        quiet_since = None
+        while not stop.is_set():
+            await asyncio.sleep(self.poll_interval)
+            stats = await asyncio.to_thread(self._scan)
+            if stats != last_stats:
+                last_stats = stats
+                quiet_since = time.monotonic()
+            elif quiet_since is not None and (time.monotonic() - quiet_since) * 1000 >= self.debounce_ms:
+                quiet_since = None
+                await self._publish()
+
+_watchers: Dict[str, BuildWatcher] = {}
+
+def get_watcher(build_dir: str) -> BuildWatcher:
+    """
+    Shared watcher per build directory, so subscribers reuse cached results
+    """
+    key = os.path.abspath(build_dir)
+    if key not in _watchers:
+        _watchers[key] = BuildWatcher(build_dir)
+    return _watchers[key]
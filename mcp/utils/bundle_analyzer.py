@@ -3,14 +3,23 @@ Bundle Analyzer Utility
 Analyzes JavaScript bundles and suggests optimizations
 """
 
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional
+from collections import defaultdict
 import os
 import json
 
-def analyze_bundle(bundle_data: Dict, threshold_kb: int = 100) -> Dict:
+from mcp.utils.compression import gzip_size, compress_files
+from mcp.utils.json_stream import JsonStreamReader
+
+def analyze_bundle(bundle_data: Dict, threshold_kb: int = 100, critical_path: Optional[Dict] = None) -> Dict:
     """
     Analyze bundle data and provide recommendations
+
+    When a critical-path analysis from the Vite manifest is given (see
+    manifest_graph.analyze_critical_path), lazy load candidates are the
+    startup chunks only one route needs instead of name keyword matches.
     """
+    use_manifest = bool(critical_path) and "error" not in critical_path
     chunks = []
     large_chunks = []
     total_size = 0
@@ -18,26 +27,36 @@ def analyze_bundle(bundle_data: Dict, threshold_kb: int = 100) -> Dict:
     recommendations = []
     lazy_load_candidates = []
 
-    # Parse bundle data (assuming Rollup/Vite format)
+    # module name -> indexes of the chunks that ship it, plus its size
+    module_chunks = defaultdict(list)
+    module_sizes = {}
+
+    # Parse bundle data (assuming Rollup/Vite format); a list or iterator
+    # of chunks (see iter_bundle_chunks) is consumed one chunk at a time
     if isinstance(bundle_data, dict):
         if "chunks" in bundle_data:
             chunks_data = bundle_data["chunks"]
         elif "assets" in bundle_data:
             chunks_data = bundle_data["assets"]
         else:
-            chunks_data = bundle_data
+            # Rollup bundle object keyed by fileName
+            chunks_data = [
+                {"fileName": file_name, **chunk}
+                for file_name, chunk in bundle_data.items() if is_bundle_chunk(chunk)
+            ]
     else:
-        chunks_data = []
+        chunks_data = bundle_data
 
-    for chunk_info in chunks_data:
+    for chunk_index, chunk_info in enumerate(chunks_data):
         name = chunk_info.get("name", chunk_info.get("fileName", "unknown"))
-        size = chunk_info.get("size", 0) / 1024  # Convert to KB
-        gzipped = chunk_info.get("gzippedSize", size * 0.3) / 1024  # Estimate if not provided
+        modules = chunk_modules(chunk_info)
+        size = chunk_size_bytes(chunk_info, modules) / 1024  # Convert to KB
+        gzipped = chunk_gzipped_kb(chunk_info, size)
 
         total_size += size
         total_gzipped += gzipped
 
-        modules = chunk_info.get("modules", [])
+        index_chunk_modules(modules, chunk_index, module_chunks, module_sizes)
         can_split = size > threshold_kb and len(modules) > 1
 
         split_recommendations = []
@@ -62,9 +81,19 @@ def analyze_bundle(bundle_data: Dict, threshold_kb: int = 100) -> Dict:
             large_chunks.append(chunk_analysis)
 
         # Identify lazy load candidates
-        if any(keyword in name.lower() for keyword in ["modal", "dialog", "popup", "chart", "analytics", "admin"]):
+        if not use_manifest and any(keyword in name.lower() for keyword in ["modal", "dialog", "popup", "chart", "analytics", "admin"]):
             lazy_load_candidates.append(name)
 
+    route_costs = []
+    if use_manifest:
+        lazy_load_candidates = [candidate["file"] for candidate in critical_path["lazy_load_candidates"]]
+        route_costs = [route for route in critical_path["routes"] if "error" not in route]
+        for candidate in critical_path["lazy_load_candidates"][:5]:
+            recommendations.append(
+                f"{candidate['file']} ({candidate['bytes'] / 1024:.2f}KB) is loaded at startup "
+                f"but only route {candidate['route']} needs it. Move its import behind that route."
+            )
+
     # Generate recommendations
     if total_gzipped > 500:
         recommendations.append(f"Total bundle size is {total_gzipped:.2f}KB. Consider code splitting and lazy loading.")
@@ -72,17 +101,19 @@ def analyze_bundle(bundle_data: Dict, threshold_kb: int = 100) -> Dict:
     if len(large_chunks) > 0:
         recommendations.append(f"{len(large_chunks)} chunks exceed {threshold_kb}KB threshold. Consider splitting.")
 
-    if len(lazy_load_candidates) > 0:
+    if len(lazy_load_candidates) > 0 and not use_manifest:
         recommendations.append(f"Consider lazy loading these components: {', '.join(lazy_load_candidates[:5])}")
 
     # Check for duplicate dependencies
-    all_modules = []
-    for chunk in chunks:
-        all_modules.extend(chunk["modules"])
-
-    duplicates = [m for m in all_modules if all_modules.count(m) > 1]
-    if duplicates:
-        recommendations.append(f"Potential duplicate dependencies detected: {', '.join(set(duplicates)[:5])}")
+    chunk_names = [chunk["name"] for chunk in chunks]
+    duplicate_modules = find_duplicate_modules(module_chunks, module_sizes, chunk_names)
+    duplicated_bytes = sum(dup["wasted_bytes"] for dup in duplicate_modules)
+    if duplicate_modules:
+        recommendations.append(
+            f"{len(duplicate_modules)} modules are shipped in more than one chunk "
+            f"({duplicated_bytes / 1024:.2f}KB duplicated): "
+            f"{', '.join(dup['name'] for dup in duplicate_modules[:5])}"
+        )
 
     return {
         "total_size_kb": round(total_size, 2),
@@ -90,42 +121,201 @@ def analyze_bundle(bundle_data: Dict, threshold_kb: int = 100) -> Dict:
         "chunks": chunks,
         "large_chunks": large_chunks,
         "recommendations": recommendations,
-        "lazy_load_candidates": lazy_load_candidates
+        "lazy_load_candidates": lazy_load_candidates,
+        "duplicate_modules": duplicate_modules,
+        "duplicated_bytes": duplicated_bytes,
+        "route_costs": route_costs
     }
 
+def iter_bundle_chunks(f) -> Iterator[Dict]:
+    """
+    Stream chunks out of a bundle stats file one at a time
+
+    Accepts the same layouts as analyze_bundle, with the same precedence: a
+    top-level array, an object's "chunks" array, else its "assets" array,
+    else a Rollup bundle object keyed by fileName. Chunks are yielded as
+    they are parsed; an "assets" array is held until the rest of the object
+    shows there is no "chunks" array (webpack stats put assets first).
+    """
+    reader = JsonStreamReader(f)
+    if reader.peek() == '[':
+        for _ in reader.iter_array():
+            yield reader.read_value()
+        return
+
+    assets = None
+    streamed_chunks = False
+    streamed_bundle = False
+    for key in reader.iter_object():
+        is_array = reader.peek() == '['
+        if key == "chunks" and is_array and not streamed_chunks and not streamed_bundle:
+            streamed_chunks = True
+            for _ in reader.iter_array():
+                yield reader.read_value()
+        elif key == "assets" and is_array and assets is None and not streamed_bundle:
+            assets = reader.read_value()
+        elif reader.peek() == '{' and not streamed_chunks and assets is None:
+            # Bundle objects are keyed by file name and have no chunks/assets arrays
+            value = reader.read_value()
+            if is_bundle_chunk(value):
+                streamed_bundle = True
+                yield {"fileName": key, **value}
+        else:
+            reader.skip_value()
+
+    if assets is not None and not streamed_chunks:
+        yield from assets
+
+def is_bundle_chunk(value) -> bool:
+    """
+    Whether a value of a Rollup bundle object looks like an output chunk or asset
+    """
+    return isinstance(value, dict) and ("fileName" in value or "size" in value or "code" in value)
+
+def chunk_modules(chunk_info: Dict) -> List:
+    """
+    Modules of a stats chunk as a list
+
+    Rollup's OutputChunk.modules is a dict keyed by module id whose values
+    carry renderedLength; those become {"name", "size"} entries.
+    """
+    modules = chunk_info.get("modules") or []
+    if isinstance(modules, dict):
+        return [
+            {"name": module_id, "size": info.get("renderedLength", 0) if isinstance(info, dict) else 0}
+            for module_id, info in modules.items()
+        ]
+    return modules
+
+def chunk_size_bytes(chunk_info: Dict, modules: List) -> int:
+    """
+    Size of a stats chunk: its own size field, else the length of the
+    emitted code (Rollup output), else the sum of its rendered modules
+    """
+    if "size" in chunk_info:
+        return chunk_info["size"] or 0
+    code = chunk_info.get("code", chunk_info.get("source"))
+    if isinstance(code, str):
+        return len(code.encode("utf-8"))
+    return sum(int(module.get("size", 0) or 0) for module in modules if isinstance(module, dict))
+
+def chunk_gzipped_kb(chunk_info: Dict, size_kb: float) -> float:
+    """
+    Gzipped size of a stats chunk in KB
+
+    Uses the stats' own gzippedSize, else compresses the emitted code when
+    the stats include it, else falls back to a 30% estimate.
+    """
+    if "gzippedSize" in chunk_info:
+        return chunk_info["gzippedSize"] / 1024
+
+    code = chunk_info.get("code", chunk_info.get("source"))
+    if isinstance(code, str):
+        code = code.encode("utf-8")
+    if isinstance(code, bytes):
+        return gzip_size(code) / 1024
+
+    return size_kb * 0.3
+
+def index_chunk_modules(modules: List, chunk_index: int, module_chunks: Dict, module_sizes: Dict):
+    """
+    Record every module of one chunk in the module -> chunks index
+    """
+    for module in modules:
+        if isinstance(module, dict):
+            module_name = module.get("name", module.get("id", "unknown"))
+            module_size = int(module.get("size", module.get("renderedLength", 0)) or 0)
+        else:
+            module_name = str(module)
+            module_size = 0
+
+        shipped_in = module_chunks[module_name]
+        # A module listed twice within one chunk is still one copy
+        if not shipped_in or shipped_in[-1] != chunk_index:
+            shipped_in.append(chunk_index)
+        if module_size > module_sizes.get(module_name, 0):
+            module_sizes[module_name] = module_size
+
+def find_duplicate_modules(module_chunks: Dict, module_sizes: Dict, chunk_names: List[str]) -> List[Dict]:
+    """
+    List modules shipped in more than one chunk, largest waste first
+    """
+    duplicates = []
+    for module_name, chunk_indexes in module_chunks.items():
+        copies = len(chunk_indexes)
+        if copies < 2:
+            continue
+        size = module_sizes.get(module_name, 0)
+        duplicates.append({
+            "name": module_name,
+            "chunks": [chunk_names[i] for i in chunk_indexes],
+            "size_bytes": size,
+            "wasted_bytes": size * (copies - 1)
+        })
+
+    duplicates.sort(key=lambda dup: (-dup["wasted_bytes"], dup["name"]))
+    return duplicates
+
 def analyze_build_directory(build_dir: str) -> Dict:
     """
     Analyze actual build output directory
+
+    Every file gets its raw size plus real gzip -9 / brotli -q 11 sizes
+    (cached per file, see mcp.utils.compression). Source maps are skipped.
     """
     if not os.path.exists(build_dir):
         return {"error": f"Build directory {build_dir} not found"}
 
+    file_paths = []
+    for root, dirs, files in os.walk(build_dir):
+        for file in files:
+            if not file.endswith('.map'):
+                file_paths.append(os.path.join(root, file))
+
+    sizes = compress_files(file_paths)
+
     chunks = []
+    assets = []
     total_size = 0
+    total_gzip = 0
+    total_brotli = 0
 
-    for root, dirs, files in os.walk(build_dir):
-        for file in files:
-            if file.endswith(('.js', '.css')):
-                file_path = os.path.join(root, file)
-                size = os.path.getsize(file_path) / 1024  # KB
-                total_size += size
+    for file_path in file_paths:
+        size = os.path.getsize(file_path) / 1024  # KB
+        # Precompressed formats (images, fonts) are transferred as-is
+        gzip_kb = (sizes[file_path]["gzip"] or size * 1024) / 1024
+        brotli_size = sizes[file_path]["brotli"]
+        brotli_kb = (brotli_size / 1024) if brotli_size is not None else gzip_kb
 
-                chunks.append({
-                    "name": file,
-                    "path": file_path,
-                    "size_kb": round(size, 2)
-                })
+        total_size += size
+        total_gzip += gzip_kb
+        total_brotli += brotli_kb
+
+        entry = {
+            "name": os.path.basename(file_path),
+            "path": file_path,
+            "size_kb": round(size, 2),
+            "gzip_kb": round(gzip_kb, 2),
+            "brotli_kb": round(brotli_kb, 2)
+        }
+        if file_path.endswith(('.js', '.mjs', '.css')):
+            chunks.append(entry)
+        else:
+            assets.append(entry)
 
     # Sort by size
     chunks.sort(key=lambda x: x["size_kb"], reverse=True)
+    assets.sort(key=lambda x: x["size_kb"], reverse=True)
 
     return {
         "total_size_kb": round(total_size, 2),
-        "chunks": chunks[:20],  # Top 20 largest files
+        "total_gzip_kb": round(total_gzip, 2),
+        "total_brotli_kb": round(total_brotli, 2),
+        "chunks": chunks,
+        "assets": assets,
         "recommendations": [
             "Consider code splitting for large JavaScript files",
             "Enable gzip/brotli compression",
             "Use tree-shaking to remove unused code"
         ]
     }
-
@@ -0,0 +1,189 @@
+"""
+Bundle Baselines Utility
+Stores bundle analysis summaries per git SHA and diffs them build-to-build
+"""
+
+import json
+import os
+import re
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from mcp.utils.disk_cache import JsonFileCache, cache_path
+
+BASELINE_DIR = "bundle-baselines"
+
+# Content hash before the extension: Vite/Rollup base64url (index-BwXk3Zt1.js)
+# or webpack-style hex (vendor.4f9a2c1e7b.css)
+_HASHED_NAME = re.compile(
+    r"^(?P<stem>.+)[-.](?P<hash>[0-9a-f]{10,64}|[A-Za-z0-9_-]{8})(?P<ext>\.[a-z0-9]+(?:\.map)?)$"
+)
+
+_index = JsonFileCache(f"{BASELINE_DIR}/index.json")
+
+def content_hash_token(file_name: str) -> Optional[str]:
+    """
+    The content-hash segment of a fingerprinted file name, if it has one
+    """
+    match = _HASHED_NAME.match(file_name)
+    if not match:
+        return None
+    token = match.group("hash")
+    # Real hashes nearly always mix in digits or capitals; plain words don't
+    if token.islower() and token.isalpha():
+        return None
+    return token
+
+def stable_name(file_name: str) -> str:
+    """
+    File name with its content hash removed, so chunks match across builds
+    """
+    if content_hash_token(os.path.basename(file_name)) is None:
+        return file_name
+    directory, base = os.path.split(file_name)
+    match = _HASHED_NAME.match(base)
+    stable = f"{match.group('stem')}{match.group('ext')}"
+    return f"{directory}/{stable}" if directory else stable
+
+def _bytes(kb: Optional[float]) -> Optional[int]:
+    return None if kb is None else int(round(kb * 1024))
+
+def summarize_analysis(analysis: Dict, build_dir: Optional[str] = None, attribution: Optional[Dict] = None) -> Dict:
+    """
+    Reduce an analyze_bundle / analyze_build_directory result (plus optional
+    source map attribution) to the sizes a diff needs, keyed by stable name
+    """
+    chunks = {}
+    for entry in analysis.get("chunks", []) + analysis.get("assets", []):
+        name = entry["name"]
+        if build_dir and entry.get("path"):
+            name = os.path.relpath(entry["path"], build_dir).replace(os.sep, "/")
+        chunks[stable_name(name)] = {
+            "file": name,
+            "size": _bytes(entry.get("size_kb")),
+            "gzip": _bytes(entry.get("gzip_kb", entry.get("gzipped_kb"))),
+            "brotli": _bytes(entry.get("brotli_kb"))
+        }
+
+    modules = {}
+    if attribution and attribution.get("chunks_analyzed"):
+        for entry in attribution.get("files", []):
+            modules[entry["name"]] = {"size": entry["bytes"]}
+    else:
+        sizes = {dup["name"]: dup["size_bytes"] for dup in analysis.get("duplicate_modules", [])}
+        for chunk in analysis.get("chunks", []):
+            for module in chunk.get("modules", []):
+                modules.setdefault(module, {"size": sizes.get(module, 0)})
+
+    return {
+        "totals": {
+            "size": sum(chunk["size"] or 0 for chunk in chunks.values()),
+            "gzip": sum(chunk["gzip"] or 0 for chunk in chunks.values()),
+            "brotli": sum((chunk["brotli"] or chunk["gzip"] or 0) for chunk in chunks.values())
+        },
+        "chunks": chunks,
+        "modules": modules
+    }
+
+def current_git_sha(cwd: Optional[str] = None) -> str:
+    """
+    SHA of the checked-out commit
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        capture_output=True,
+        text=True,
+        cwd=cwd or Path(__file__).parent.parent.parent
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Could not determine git SHA: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+def save_baseline(sha: str, summary: Dict, source: str = "") -> Dict:
+    """
+    Persist a summary under its git SHA and record it in the index
+    """
+    path = cache_path(f"{BASELINE_DIR}/{sha}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(summary, f, separators=(",", ":"))
+
+    entry = {
+        "sha": sha,
+        "source": source,
+        "created": datetime.now().isoformat(),
+        "totals": summary["totals"]
+    }
+    _index.set(sha, entry)
+    _index.save()
+    return entry
+
+def resolve_sha(ref: str) -> str:
+    """
+    Full SHA of a stored baseline from a full or abbreviated SHA
+    """
+    if _index.get(ref) is not None:
+        return ref
+    matches = [sha for sha in _index.keys() if sha.startswith(ref)]
+    if len(matches) != 1:
+        raise KeyError(f"No unique baseline for '{ref}'" if matches else f"No baseline stored for '{ref}'")
+    return matches[0]
+
+def load_baseline(ref: str) -> Dict:
+    with open(cache_path(f"{BASELINE_DIR}/{resolve_sha(ref)}.json"), "r") as f:
+        return json.load(f)
+
+def list_baselines() -> List[Dict]:
+    entries = [_index.get(sha) for sha in _index.keys()]
+    return sorted(entries, key=lambda entry: entry["created"], reverse=True)
+
+def _delta(base: Optional[int], head: Optional[int]) -> Optional[int]:
+    if base is None or head is None:
+        return None
+    return head - base
+
+def _diff_entries(base: Dict, head: Dict, fields: List[str]) -> Dict:
+    added, removed, grown, shrunk = [], [], [], []
+
+    for name, entry in head.items():
+        if name not in base:
+            added.append({"name": name, **entry})
+    for name, entry in base.items():
+        if name not in head:
+            removed.append({"name": name, **entry})
+
+    for name in base.keys() & head.keys():
+        old, new = base[name], head[name]
+        change = {"name": name}
+        for field in fields:
+            change[field] = new.get(field)
+            change[f"{field}_delta"] = _delta(old.get(field), new.get(field))
+        if change["size_delta"]:
+            (grown if change["size_delta"] > 0 else shrunk).append(change)
+
+    added.sort(key=lambda entry: -(entry.get("size") or 0))
+    removed.sort(key=lambda entry: -(entry.get("size") or 0))
+    grown.sort(key=lambda entry: -entry["size_delta"])
+    shrunk.sort(key=lambda entry: entry["size_delta"])
+    return {"added": added, "removed": removed, "grown": grown, "shrunk": shrunk}
+
+def diff_summaries(base: Dict, head: Dict) -> Dict:
+    """
+    Added/removed/grown/shrunk chunks and modules between two summaries,
+    with absolute and compressed byte deltas
+    """
+    totals = {
+        field: {
+            "base": base["totals"][field],
+            "head": head["totals"][field],
+            "delta": head["totals"][field] - base["totals"][field]
+        }
+        for field in ("size", "gzip", "brotli")
+    }
+    return {
+        "totals": totals,
+        "chunks": _diff_entries(base["chunks"], head["chunks"], ["size", "gzip", "brotli"]),
+        "modules": _diff_entries(base["modules"], head["modules"], ["size"])
+    }
@@ -3,12 +3,19 @@ Cache Optimizer Utility
 Generates optimal cache headers and platform-specific configurations
 """
 
-from typing import Dict, List, Any
+import json
+from typing import Dict, List, Any, Optional
 
-def generate_cache_strategy(asset_types: List[str], platform: str = "vercel") -> Dict:
+def generate_cache_strategy(asset_types: List[str], platform: str = "vercel", build_dir: Optional[str] = None) -> Dict:
     """
     Generate optimal cache headers for different asset types
+
+    With a build_dir, rules are exact paths from the build instead of
+    globs: only files whose content hash is verified are marked immutable.
     """
+    if build_dir:
+        return generate_build_cache_strategy(build_dir, platform)
+
     rules = []
 
     # Define cache rules for each asset type
@@ -86,10 +93,104 @@ def generate_cache_strategy(asset_types: List[str], platform: str = "vercel") ->
         "recommendations": recommendations
     }
 
-def get_platform_config(platform: str) -> Dict[str, Any]:
+def generate_build_cache_strategy(build_dir: str, platform: str = "vercel") -> Dict:
+    from mcp.utils.build_cache_rules import build_platform_config, generate_build_cache_rules
+
+    result = generate_build_cache_rules(build_dir)
+    if "error" in result:
+        return result
+    counts = result["files"]
+    recommendations = []
+    if counts["unverified"]:
+        recommendations.append(
+            f"{counts['unverified']} file(s) look fingerprinted but their hash could not be verified; "
+            "they get a short max-age instead of immutable"
+        )
+    if counts["plain"]:
+        recommendations.append(
+            f"{counts['plain']} file(s) have no content hash; emit them with hashed names to make them immutable"
+        )
+    if counts["manifest_attested"]:
+        recommendations.append(
+            f"{counts['manifest_attested']} fingerprinted file(s) are trusted from the Vite manifest because "
+            "their hash is not a digest of the emitted bytes (usually JS chunks)"
+        )
+    return {
+        "rules": [
+            {
+                key: rule[key]
+                for key in ("pattern", "cache_control", "etag", "last_modified", "fingerprinted", "verified_by")
+            }
+            for rule in result["rules"]
+        ],
+        "config": build_platform_config(platform, result["rules"]),
+        "recommendations": recommendations,
+        "build_id": result["build_id"]
+    }
+
+def get_platform_config(platform: str, link_headers: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
     """
     Get platform-specific cache configuration
+
+    link_headers (page path -> Link header values) are merged in so hints
+    reach the browser with the response headers, or as 103 Early Hints
+    """
+    config = _base_platform_config(platform)
+    if link_headers:
+        merge_link_headers(platform, config, link_headers)
+    return config
+
+def merge_link_headers(platform: str, config: Dict[str, Any], link_headers: Dict[str, List[str]]):
+    """
+    Add per-page Link headers to a platform config in its native format
     """
+    if platform == "vercel":
+        for path, values in link_headers.items():
+            config["headers"].append({
+                "source": path,
+                "headers": [{"key": "Link", "value": ", ".join(values)}]
+            })
+        config["vercel.json"] = json.dumps({"headers": config["headers"]}, indent=2)
+    elif platform == "netlify":
+        config["_headers"] = render_headers_file(config["headers"], link_headers)
+        for path, values in link_headers.items():
+            config["headers"].append({"for": path, "values": {"Link": ", ".join(values)}})
+    elif platform == "cloudflare":
+        # Cloudflare sends 103 Early Hints from preload/preconnect Link
+        # headers once the zone setting is on; Pages reads them from _headers
+        config["early_hints"] = {"zone_setting": {"id": "early_hints", "value": "on"}}
+        config["response_header_rules"] = [
+            {
+                "expression": f'http.request.uri.path eq "{path}"',
+                "action": "rewrite",
+                "action_parameters": {
+                    "headers": {"Link": {"operation": "set", "value": ", ".join(values)}}
+                }
+            }
+            for path, values in link_headers.items()
+        ]
+        config["_headers"] = render_headers_file([], link_headers)
+    else:
+        config["link_headers"] = {path: ", ".join(values) for path, values in link_headers.items()}
+
+def render_headers_file(rules: List[Dict], link_headers: Dict[str, List[str]]) -> str:
+    """
+    Netlify / Cloudflare Pages _headers file; each Link value goes on its
+    own line, which both platforms combine into one header
+    """
+    blocks: Dict[str, List[str]] = {}
+    for rule in rules:
+        blocks.setdefault(rule["for"], []).extend(f"{name}: {value}" for name, value in rule["values"].items())
+    for path, values in link_headers.items():
+        blocks.setdefault(path, []).extend(f"Link: {value}" for value in values)
+
+    lines = []
+    for path, headers in blocks.items():
+        lines.append(path)
+        lines.extend(f"  {header}" for header in headers)
+    return "\n".join(lines) + "\n"
+
+def _base_platform_config(platform: str) -> Dict[str, Any]:
     if platform == "vercel":
         return {
             "headers": [
@@ -0,0 +1,132 @@
+"""
+Compression Utility
+Measures real gzip/brotli transfer sizes for build output
+"""
+
+import gzip
+import hashlib
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from mcp.utils.disk_cache import JsonFileCache
+
+try:
+    import brotli
+except ImportError:  # Optional dependency, brotli sizes are reported as None
+    brotli = None
+
+# Formats that are already compressed and are served as-is by CDNs
+PRECOMPRESSED_EXTENSIONS = (
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".ico",
+    ".woff", ".woff2", ".mp4", ".webm", ".mp3", ".ogg", ".zip", ".gz", ".br"
+)
+
+# Keyed by "path|size|mtime_ns" -> content digest and digest -> sizes, so
+# unchanged files are never re-read and renamed/copied ones never recompressed
+_cache = JsonFileCache("compression.json")
+DIGEST_PREFIX = "sha1:"
+# prune_cache() stats every cached path, so compress_files() runs it only
+# on every PRUNE_EVERY-th call
+PRUNE_EVERY = 20
+_calls = itertools.count(1)
+
+def gzip_size(data: bytes) -> int:
+    """
+    Byte count of data compressed with gzip -9
+    """
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+def compressed_sizes(data: bytes) -> Dict[str, Optional[int]]:
+    """
+    Compress with gzip -9 and brotli -q 11 and return the byte counts
+    """
+    return {
+        "gzip": gzip_size(data),
+        "brotli": len(brotli.compress(data, quality=11)) if brotli else None
+    }
+
+def _stat_key(path: str) -> str:
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+def file_compressed_sizes(path: str) -> Dict[str, Optional[int]]:
+    """
+    Cached gzip/brotli sizes for one file
+    """
+    if path.lower().endswith(PRECOMPRESSED_EXTENSIONS):
+        return {"gzip": None, "brotli": None}
+
+    stat_key = _stat_key(path)
+    digest = _cache.get(stat_key)
+    if digest is not None:
+        sizes = _cache.get(digest)
+        if sizes is not None and (sizes["brotli"] is not None or brotli is None):
+            return sizes
+
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = DIGEST_PREFIX + hashlib.sha1(data).hexdigest()
+    _cache.set(stat_key, digest)
+
+    sizes = _cache.get(digest)
+    if sizes is None or (sizes["brotli"] is None and brotli is not None):
+        sizes = compressed_sizes(data)
+        _cache.set(digest, sizes)
+    return sizes
+
+def _current_stat_key(key: str) -> bool:
+    path = key.rsplit("|", 2)[0]
+    try:
+        return _stat_key(path) == key
+    except OSError:
+        return False
+
+def prune_cache() -> int:
+    """
+    Forget files that were deleted or have changed since they were cached,
+    then the sizes no remaining file refers to, so entries from past builds
+    don't accumulate
+    """
+    referenced = set()
+
+    def keep_file(key: str, digest: str) -> bool:
+        if key.startswith(DIGEST_PREFIX):
+            return True
+        if _current_stat_key(key):
+            referenced.add(digest)
+            return True
+        return False
+
+    removed = _cache.prune(keep_file)
+    removed += _cache.prune(lambda key, sizes: not key.startswith(DIGEST_PREFIX) or key in referenced)
+    return removed
+
+def _sizes_if_present(path: str) -> Optional[Dict[str, Optional[int]]]:
+    try:
+        return file_compressed_sizes(path)
+    except FileNotFoundError:
+        return None
+
+def compress_files(
+    paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    skip_missing: bool = False
+) -> Dict[str, Dict[str, Optional[int]]]:
+    """
+    Compressed sizes for many files, computed in a thread pool
+
+    zlib and brotli release the GIL while compressing, so threads scale
+    across cores without pickling file contents to worker processes. With
+    skip_missing, files deleted meanwhile are left out of the result
+    instead of raising FileNotFoundError.
+    """
+    paths = list(paths)
+    measure = _sizes_if_present if skip_missing else file_compressed_sizes
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = {path: sizes for path, sizes in zip(paths, pool.map(measure, paths)) if sizes is not None}
+    if next(_calls) % PRUNE_EVERY == 0:
+        prune_cache()
+    _cache.save()
+    return results
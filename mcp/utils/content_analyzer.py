@@ -3,36 +3,118 @@ Content Analyzer Utility
 Analyzes content for readability, SEO, and engagement
 """
 
-from typing import Dict, List
+from collections import Counter
+from functools import lru_cache
+from html import unescape
+from pathlib import Path
+from typing import Dict, List, Optional
+import os
 import re
 
+from mcp.utils.keyword_matcher import WORD_PATTERN, count_keywords
+
+# Optional pronunciation-derived syllable counts (see mcp.build_syllable_dict)
+SYLLABLE_DICT_PATH = Path(os.environ.get(
+    "MCP_SYLLABLE_DICT",
+    Path(__file__).parent.parent / "data" / "syllables.txt"
+))
+SYLLABLE_CACHE_SIZE = 65536
+
+_syllable_dict: Optional[Dict[str, int]] = None
+
+# Markup: comments, script/style elements (contents are not prose) and tags
+_MARKUP = re.compile(
+    r'<(?:!--.*?-->|(script|style)\b[^>]*>.*?</\1\s*>|(/?)([a-zA-Z][\w-]*)([^>]*)>)',
+    re.IGNORECASE | re.DOTALL
+)
+# A sentence: from its first word character up to ., !, ? or a block boundary
+BLOCK_BREAK = "\u2029"
+# Words in reading order, with block boundaries kept so phrases never span them
+_TOKEN = re.compile(WORD_PATTERN + "|" + BLOCK_BREAK)
+_SENTENCE = re.compile(r'[^\W_][^.!?\u2029]*')
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4")
+
+# Elements whose boundaries end a sentence even without punctuation
+BLOCK_TAGS = {
+    "p", "div", "section", "article", "header", "footer", "li", "ul", "ol", "br",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "td", "th", "tr", "figcaption"
+}
+
+def scan_content(content: str) -> Dict:
+    """
+    Separate markup from text in one left-to-right pass over the content
+
+    Tags are tallied (headings, images, links) as they are met and never
+    counted as words; the text between them is collected, with block
+    elements marked as sentence boundaries, and tokenized once.
+    """
+    text_parts = []
+    headings = dict.fromkeys(HEADING_TAGS, 0)
+    image_count = 0
+    link_count = 0
+
+    append = text_parts.append
+    position = 0
+    for match in _MARKUP.finditer(content):
+        start, end = match.span()
+        append(content[position:start])
+        position = end
+
+        _, closing, tag, attributes = match.groups()
+        if tag is None:  # Comment or script/style block
+            continue
+        if not tag.islower():
+            tag = tag.lower()
+        if tag in BLOCK_TAGS:
+            append(BLOCK_BREAK)
+        if closing:
+            continue
+        if tag in headings:
+            headings[tag] += 1
+        elif tag == "img":
+            image_count += 1
+        elif tag == "a" and "href" in attributes.lower():
+            link_count += 1
+    append(content[position:])
+
+    text = "".join(text_parts).lower()
+    if "&" in text:
+        text = unescape(text)
+    tokens = _TOKEN.findall(text)
+    word_counts = Counter(tokens)
+    word_counts.pop(BLOCK_BREAK, None)
+
+    return {
+        "tokens": tokens,
+        "word_counts": word_counts,
+        "word_count": sum(word_counts.values()),
+        "sentence_count": len(_SENTENCE.findall(text)),
+        "text": text,
+        "heading_structure": headings,
+        "image_count": image_count,
+        "link_count": link_count
+    }
+
 def analyze_content(content: str, page_type: str, target_keywords: List[str]) -> Dict:
     """
     Analyze content for readability, SEO, and engagement
     """
+    scan = scan_content(content)
+
     # Basic metrics
-    words = content.split()
-    word_count = len(words)
+    word_count = scan["word_count"]
     reading_time_minutes = word_count / 200  # Average reading speed
 
-    # Count headings
-    heading_structure = {
-        "h1": len(re.findall(r'<h1[^>]*>', content, re.IGNORECASE)),
-        "h2": len(re.findall(r'<h2[^>]*>', content, re.IGNORECASE)),
-        "h3": len(re.findall(r'<h3[^>]*>', content, re.IGNORECASE)),
-        "h4": len(re.findall(r'<h4[^>]*>', content, re.IGNORECASE))
-    }
-
-    # Count images and links
-    image_count = len(re.findall(r'<img[^>]*>', content, re.IGNORECASE))
-    link_count = len(re.findall(r'<a[^>]*href', content, re.IGNORECASE))
+    heading_structure = scan["heading_structure"]
+    image_count = scan["image_count"]
+    link_count = scan["link_count"]
 
     # Calculate readability (simplified Flesch Reading Ease)
-    sentences = re.split(r'[.!?]+', content)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    sentence_count = len(sentences)
+    sentence_count = scan["sentence_count"]
 
-    syllables = sum(count_syllables(word) for word in words)
+    # Each distinct word is syllable-counted once
+    syllables = sum(count_syllables(word) * count for word, count in scan["word_counts"].items())
 
     if sentence_count > 0 and word_count > 0:
         avg_sentence_length = word_count / sentence_count
@@ -44,14 +126,13 @@ def analyze_content(content: str, page_type: str, target_keywords: List[str]) ->
     else:
         readability_score = 50
 
-    # Keyword density
-    content_lower = content.lower()
+    # Keyword density: whole-word matches of every keyword in one pass
     keyword_density = {}
-    for keyword in target_keywords:
-        keyword_lower = keyword.lower()
-        count = content_lower.count(keyword_lower)
-        density = (count / word_count * 100) if word_count > 0 else 0
-        keyword_density[keyword] = round(density, 2)
+    if target_keywords:
+        keyword_counts = count_keywords(target_keywords, scan["tokens"])
+        for keyword, count in keyword_counts.items():
+            density = (count / word_count * 100) if word_count > 0 else 0
+            keyword_density[keyword] = round(density, 2)
 
     # Generate recommendations
     recommendations = []
@@ -117,9 +198,30 @@ def analyze_content(content: str, page_type: str, target_keywords: List[str]) ->
         "engagement_suggestions": engagement_suggestions
     }
 
-def count_syllables(word: str) -> int:
+def load_syllable_dict(path: Path = SYLLABLE_DICT_PATH) -> Dict[str, int]:
+    """
+    Read a syllable dictionary file: one line per syllable count, the count
+    followed by the space-separated words that have it. Missing file -> {}
+    """
+    syllables = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                count, *words = line.split()
+                syllables.update(dict.fromkeys(words, int(count)))
+    except OSError:
+        pass
+    return syllables
+
+def _dictionary_syllables(word: str) -> Optional[int]:
+    global _syllable_dict
+    if _syllable_dict is None:
+        _syllable_dict = load_syllable_dict()
+    return _syllable_dict.get(word)
+
+def heuristic_syllables(word: str) -> int:
     """
-    Count syllables in a word (simplified)
+    Count syllables in a word (simplified vowel-group heuristic)
     """
     word = word.lower().strip()
     if not word:
@@ -141,6 +243,20 @@ def count_syllables(word: str) -> int:
 
     return max(1, syllable_count)
 
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(word: str) -> int:
+    """
+    Count syllables in a word
+
+    Uses the pronunciation dictionary when one is installed (loaded on first
+    use) and the heuristic otherwise; results are memoized per word.
+    """
+    word = word.lower().strip()
+    if not word:
+        return 0
+    known = _dictionary_syllables(word)
+    return known if known is not None else heuristic_syllables(word)
+
 def calculate_content_score(
     word_count: int,
     readability: float,
@@ -0,0 +1,114 @@
+"""
+Disk Cache Utility
+Small persistent JSON caches shared by the build analyzers
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# Repository-local cache directory (git-ignored)
+CACHE_ROOT = Path(os.environ.get(
+    "MCP_CACHE_DIR",
+    Path(__file__).parent.parent.parent / ".mcp-cache"
+))
+
+def cache_path(name: str) -> Path:
+    """
+    Path of a named cache file inside the cache directory
+    """
+    return CACHE_ROOT / name
+
+class JsonFileCache:
+    """
+    Dictionary persisted as one JSON file.
+
+    Loaded lazily on first access and written back atomically by save(),
+    so concurrent readers never see a half-written file. With max_entries
+    set, entries are kept in least-recently-used order and the oldest are
+    evicted on set().
+    """
+
+    def __init__(self, name: str, max_entries: Optional[int] = None):
+        self.path = cache_path(name)
+        self.max_entries = max_entries
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                with open(self.path, "r") as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            data = self._load()
+            if self.max_entries and key in data:
+                # Mark as recently used; the order is persisted with the next change
+                data[key] = data.pop(key)
+            return data.get(key, default)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            data = self._load()
+            data.pop(key, None)
+            data[key] = value
+            if self.max_entries:
+                for stale in list(data)[:-self.max_entries]:
+                    del data[stale]
+            self._dirty = True
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            data = self._load()
+            if key in data:
+                self._dirty = True
+            return data.pop(key, default)
+
+    def keys(self):
+        with self._lock:
+            return list(self._load().keys())
+
+    def prune(self, keep: Callable[[str, Any], bool]) -> int:
+        """
+        Drop every entry for which keep(key, value) is false; returns the
+        number of entries removed
+        """
+        with self._lock:
+            data = self._load()
+            stale = [key for key, value in data.items() if not keep(key, value)]
+            for key in stale:
+                del data[key]
+            if stale:
+                self._dirty = True
+            return len(stale)
+
+    def save(self):
+        """
+        Write the cache back to disk if anything changed
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A temp file of our own, so processes saving the same cache never
+            # write into or replace each other's half-written file
+            tmp = tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp", delete=False
+            )
+            try:
+                with tmp:
+                    json.dump(self._data, tmp, separators=(",", ":"))
+                os.replace(tmp.name, self.path)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+            self._dirty = False
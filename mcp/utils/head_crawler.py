@@ -0,0 +1,266 @@
+"""
+Head Crawler Utility
+Extracts title, meta, Open Graph, Twitter and JSON-LD tags from built HTML
+files and validates every page offline, caching results per file hash
+"""
+
+import hashlib
+import json
+import os
+from html.parser import HTMLParser
+from typing import Dict, Iterator, List, Optional
+
+from mcp.models.seo import PageData
+from mcp.utils.disk_cache import JsonFileCache
+from mcp.utils.page_pool import PageSummary, error_entry, iter_pool_results
+from mcp.utils.seo_bulk import DuplicateIndex
+from mcp.utils.seo_generator import validate_seo
+
+# Bump when extraction or checks change, to invalidate cached results
+AUDIT_VERSION = 1
+READ_CHUNK = 16 * 1024
+# Least recently used results beyond this are evicted
+MAX_CACHED_PAGES = 5000
+
+# file key (path, base URL and content hash) -> audit result
+_cache = JsonFileCache("head-audit.json", max_entries=MAX_CACHED_PAGES)
+
+class HeadParser(HTMLParser):
+    """
+    Streaming parser for the document <head>; callers stop feeding once
+    `done` is set, so page bodies are never parsed
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self.lang = ""
+        self.title = ""
+        self.meta: Dict[str, str] = {}
+        self.links: Dict[str, str] = {}
+        self.json_ld: List[str] = []
+        self._capture: Optional[str] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "html":
+            self.lang = attributes.get("lang", "")
+        elif tag == "title":
+            self._capture, self._text = "title", []
+        elif tag == "script" and attributes.get("type") == "application/ld+json":
+            self._capture, self._text = "json_ld", []
+        elif tag == "meta":
+            name = attributes.get("name") or attributes.get("property")
+            if name and "content" in attributes:
+                self.meta.setdefault(name.lower(), attributes["content"].strip())
+        elif tag == "link":
+            for rel in attributes.get("rel", "").lower().split():
+                if rel in ("canonical", "alternate", "icon", "manifest"):
+                    self.links.setdefault(rel, attributes.get("href", ""))
+        elif tag == "body":
+            self.done = True
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+        elif self._capture and tag in ("title", "script"):
+            text = "".join(self._text).strip()
+            if self._capture == "title":
+                self.title = self.title or " ".join(text.split())
+            else:
+                self.json_ld.append(text)
+            self._capture = None
+
+    def handle_data(self, data):
+        if self._capture:
+            self._text.append(data)
+
+def extract_head(path: str) -> Dict:
+    """
+    Head tags of one HTML file, read in chunks until </head>
+    """
+    parser = HeadParser()
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        while not parser.done:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    parser.close()
+
+    json_ld = []
+    for block in parser.json_ld:
+        try:
+            json_ld.append(json.loads(block))
+        except ValueError as e:
+            json_ld.append({"error": f"Invalid JSON-LD: {e}"})
+
+    meta = parser.meta
+    return {
+        "lang": parser.lang,
+        "title": parser.title,
+        "description": meta.get("description", ""),
+        "canonical": parser.links.get("canonical", ""),
+        "meta": {name: value for name, value in meta.items() if not name.startswith(("og:", "twitter:"))},
+        "open_graph": {name: value for name, value in meta.items() if name.startswith("og:")},
+        "twitter_card": {name: value for name, value in meta.items() if name.startswith("twitter:")},
+        "structured_data": json_ld
+    }
+
+def page_url(relative: str, base_url: str = "") -> str:
+    """
+    Public URL of a built file: about/index.html -> /about/
+    """
+    route = "/" + relative.replace(os.sep, "/")
+    if route.endswith("/index.html"):
+        route = route[:-len("index.html")]
+    elif route.endswith(".html"):
+        route = route[:-len(".html")]
+    return base_url.rstrip("/") + route
+
+def head_checks(head: Dict) -> List[str]:
+    """
+    Warnings for tags validate_seo does not cover
+    """
+    warnings = []
+    if not head["canonical"]:
+        warnings.append("Missing canonical link")
+    if not head["lang"]:
+        warnings.append("Missing lang attribute on <html>")
+    for tag in ("og:title", "og:description", "og:image", "og:url"):
+        if tag not in head["open_graph"]:
+            warnings.append(f"Missing {tag}")
+    if "twitter:card" not in head["twitter_card"]:
+        warnings.append("Missing twitter:card")
+    if "viewport" not in head["meta"]:
+        warnings.append("Missing viewport meta tag")
+    for block in head["structured_data"]:
+        if isinstance(block, dict) and "error" in block:
+            warnings.append(block["error"])
+    return warnings
+
+def _audit_file(job) -> Dict:
+    relative, path, _, base_url = job
+    head = extract_head(path)
+    url = head["canonical"] or page_url(relative, base_url)
+    keywords = head["meta"].get("keywords", "")
+    page = PageData(
+        title=head["title"],
+        description=head["description"],
+        url=url,
+        image=head["open_graph"].get("og:image"),
+        type=head["open_graph"].get("og:type", "website"),
+        author=head["meta"].get("author"),
+        keywords=[keyword.strip() for keyword in keywords.split(",") if keyword.strip()] or None
+    )
+    validation = validate_seo(page)
+    return {
+        "url": url,
+        "head": head,
+        "valid": validation["valid"],
+        "errors": validation["errors"],
+        "warnings": validation["warnings"] + head_checks(head)
+    }
+
+def find_html_files(build_dir: str) -> List[str]:
+    files = []
+    for directory, dirs, names in os.walk(build_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        files.extend(os.path.join(directory, name) for name in sorted(names) if name.endswith(".html"))
+    return files
+
+def _file_key(path: str, relative: str, base_url: str) -> str:
+    digest = hashlib.sha1(f"{AUDIT_VERSION}\0{relative}\0{base_url}\0".encode("utf-8"))
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return "sha1:" + digest.hexdigest()
+
+def iter_head_audit(
+    build_dir: str = "dist",
+    base_url: str = "",
+    max_workers: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Yield one audit result per HTML file (cached files first, then the rest
+    as workers finish) followed by a site-level summary. A file that cannot
+    be read or audited yields an error line instead.
+    """
+    summary = HeadAuditSummary()
+    jobs = []
+
+    for path in find_html_files(build_dir):
+        relative = os.path.relpath(path, build_dir).replace(os.sep, "/")
+        try:
+            key = _file_key(path, relative, base_url)
+        except OSError as e:
+            entry = error_entry(relative, str(e))
+            summary.fail(entry)
+            yield entry
+            continue
+        cached = _cache.get(key)
+        if cached is not None:
+            page = {"type": "page", "path": relative, "cached": True, **cached}
+            summary.add(page)
+            yield page
+            continue
+        jobs.append((relative, path, key, base_url))
+
+    for (relative, _, key, _), result, error in iter_pool_results(_audit_file, jobs, max_workers):
+        if error is not None:
+            entry = error_entry(relative, error)
+            summary.fail(entry)
+            yield entry
+            continue
+        _cache.set(key, result)
+        page = {"type": "page", "path": relative, "cached": False, **result}
+        summary.add(page)
+        yield page
+
+    _cache.save()
+    yield summary.result()
+
+class HeadAuditSummary(PageSummary):
+    """
+    Running site-level aggregates, including duplicate titles and
+    descriptions across pages
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.valid = 0
+        self.titles = DuplicateIndex()
+        self.descriptions = DuplicateIndex()
+        self.missing_title: List[str] = []
+        self.missing_description: List[str] = []
+
+    def add(self, page: Dict):
+        super().add(page)
+        head = page["head"]
+        self.valid += page["valid"]
+        if not head["title"]:
+            self.missing_title.append(page["path"])
+        if not head["description"]:
+            self.missing_description.append(page["path"])
+        self.titles.add(head["title"], page["path"])
+        self.descriptions.add(head["description"], page["path"])
+
+    def result(self) -> Dict:
+        return {
+            **super().result(),
+            "audited": self.pages - self.cached,
+            "valid": self.valid,
+            "invalid": self.pages - self.valid,
+            "missing_title": self.missing_title,
+            "missing_description": self.missing_description,
+            "duplicate_titles": [
+                {"title": entry["text"], "pages": entry["urls"]} for entry in self.titles.duplicates()
+            ],
+            "duplicate_descriptions": [
+                {"description": entry["text"], "pages": entry["urls"]} for entry in self.descriptions.duplicates()
+            ]
+        }
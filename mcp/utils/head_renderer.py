@@ -0,0 +1,89 @@
+"""
+Head Renderer Utility
+Renders generated SEO meta into a ready-to-inline <head> fragment
+"""
+
+import json
+from functools import lru_cache
+from html import escape
+from typing import Dict, Union
+
+from mcp.models.seo import SEOMetaResponse
+
+RENDER_CACHE_SIZE = 4096
+
+# Precompiled templates; every interpolated value is escaped first
+_TITLE = "<title>{}</title>".format
+_META_NAME = '<meta name="{}" content="{}">'.format
+_META_PROPERTY = '<meta property="{}" content="{}">'.format
+_CANONICAL = '<link rel="canonical" href="{}">'.format
+_JSON_LD = '<script type="application/ld+json">{}</script>'.format
+
+# Meta keys rendered as something other than <meta name>
+_SPECIAL_META = {"title", "canonical"}
+
+def _attr(value) -> str:
+    return escape(str(value), quote=True)
+
+def serialize_json_ld(data: Dict) -> str:
+    """
+    JSON for an inline <script>: "</" and "<!--" cannot end or confuse the
+    script element, and U+2028/U+2029 are escaped for older JS parsers
+    """
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return (
+        text.replace("</", "<\\/")
+        .replace("<!--", "<\\u0021--")
+        .replace("\u2028", "\\u2028")
+        .replace("\u2029", "\\u2029")
+    )
+
+def _render(meta: Dict, separator: str) -> str:
+    tags = []
+    meta_tags = meta.get("meta_tags") or {}
+    if meta_tags.get("title"):
+        tags.append(_TITLE(escape(meta_tags["title"], quote=False)))
+    for name, content in meta_tags.items():
+        if name not in _SPECIAL_META and content:
+            tags.append(_META_NAME(_attr(name), _attr(content)))
+    if meta_tags.get("canonical"):
+        tags.append(_CANONICAL(_attr(meta_tags["canonical"])))
+
+    for name, content in (meta.get("open_graph") or {}).items():
+        if content:
+            # article:tag:0, article:tag:1 ... are repeated article:tag properties
+            if name.startswith("article:tag:"):
+                name = "article:tag"
+            tags.append(_META_PROPERTY(_attr(name), _attr(content)))
+    for name, content in (meta.get("twitter_card") or {}).items():
+        if content:
+            tags.append(_META_NAME(_attr(name), _attr(content)))
+
+    if meta.get("structured_data"):
+        tags.append(_JSON_LD(serialize_json_ld(meta["structured_data"])))
+    return separator.join(tags)
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_cached(payload: str, separator: str) -> str:
+    return _render(json.loads(payload), separator)
+
+def render_head(meta: Union[SEOMetaResponse, Dict], separator: str = "\n") -> str:
+    """
+    <head> fragment for a generate_seo_meta result; identical inputs are
+    rendered once and served from an LRU cache keyed on their JSON. Tags keep
+    the order of the input dictionaries.
+    """
+    if isinstance(meta, SEOMetaResponse):
+        meta = meta.dict()
+    payload = json.dumps(meta, separators=(",", ":"))
+    return _render_cached(payload, separator)
+
+def render_head_bytes(meta: Union[SEOMetaResponse, Dict], separator: str = "\n") -> bytes:
+    """
+    UTF-8 encoded render_head() output, ready to use as a response body
+    """
+    return render_head(meta, separator).encode("utf-8")
+
+def render_cache_info() -> Dict:
+    info = _render_cached.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
@@ -0,0 +1,240 @@
+"""
+JSON Stream Utility
+Pull-style incremental JSON reader for large build artifacts
+"""
+
+import json
+import re
+from typing import Iterator
+
+READ_CHUNK_SIZE = 64 * 1024
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_DECODER = json.JSONDecoder()
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_CONTAINER_SPECIAL = re.compile(r'["\[\]{}]')
+_DELIMITER = re.compile(r'[,\]}\s]')
+_LITERAL = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null')
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+class JsonStreamReader:
+    """
+    Pull reader over a JSON text file.
+
+    Keeps only an unconsumed window of the file in memory, so large values
+    (such as sourcesContent) can be skipped and long strings (such as
+    mappings) consumed piecewise without loading the whole document.
+    """
+
+    def __init__(self, f, chunk_size: int = READ_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._mark = None
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        # Drop consumed text, except a value read_value is still collecting
+        keep = self.pos if self._mark is None else self._mark
+        self.buf = self.buf[keep:] + data
+        self.pos -= keep
+        if self._mark is not None:
+            self._mark = 0
+        return True
+
+    def _ensure(self, count: int):
+        while len(self.buf) - self.pos < count:
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def peek(self) -> str:
+        """
+        Next non-whitespace character, without consuming it
+        """
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos}")
+        self.pos += 1
+
+    def iter_string(self) -> Iterator[str]:
+        """
+        Yield the decoded contents of the next string value in pieces
+        """
+        self.expect('"')
+        while True:
+            match = _STRING_SPECIAL.search(self.buf, self.pos)
+            if match is None:
+                if self.pos < len(self.buf):
+                    yield self.buf[self.pos:]
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("Unterminated JSON string")
+                continue
+
+            end = match.start()
+            if end > self.pos:
+                yield self.buf[self.pos:end]
+            self.pos = end
+            if match.group() == '"':
+                self.pos += 1
+                return
+
+            self._ensure(2)
+            escape = self.buf[self.pos + 1]
+            if escape == 'u':
+                self._ensure(6)
+                yield chr(int(self.buf[self.pos + 2:self.pos + 6], 16))
+                self.pos += 6
+            else:
+                yield _ESCAPES.get(escape, escape)
+                self.pos += 2
+
+    def read_string(self) -> str:
+        return "".join(self.iter_string())
+
+    def skip_string(self):
+        """
+        Consume the next string value without decoding its escapes
+        """
+        self.expect('"')
+        while True:
+            quote = self.buf.find('"', self.pos)
+            if quote < 0:
+                # Keep a trailing backslash run so an escaped quote split
+                # across reads is still recognized
+                keep = len(self.buf) - len(self.buf.rstrip('\\'))
+                self.pos = len(self.buf) - keep
+                if not self._fill():
+                    raise ValueError("Unterminated JSON string")
+                continue
+
+            backslashes = 0
+            index = quote - 1
+            while index >= self.pos and self.buf[index] == '\\':
+                backslashes += 1
+                index -= 1
+            self.pos = quote + 1
+            if backslashes % 2 == 0:
+                return
+
+    def read_value(self):
+        """
+        Parse the next value into Python objects
+
+        Containers and strings are decoded with json's C decoder straight
+        from the read window, which grows geometrically until the value is
+        complete, so only that one value is held in memory at a time.
+        """
+        if self.peek() not in '[{"':
+            self._mark = self.pos
+            try:
+                self._skip_literal()
+                return json.loads(self.buf[self._mark:self.pos])
+            finally:
+                self._mark = None
+
+        while True:
+            try:
+                value, self.pos = _DECODER.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise ValueError(f"Invalid JSON value: {e.msg}")
+            # Value continues past the window: at least double it and retry
+            self._mark = self.pos
+            target = 2 * (len(self.buf) - self.pos)
+            try:
+                while self._fill() and len(self.buf) - self._mark < target:
+                    pass
+            finally:
+                self._mark = None
+
+    def _skip_literal(self):
+        # Literals may straddle a read boundary, so read up to a delimiter
+        while not _DELIMITER.search(self.buf, self.pos) and self._fill():
+            pass
+        match = _LITERAL.match(self.buf, self.pos)
+        if match is None:
+            raise ValueError(f"Invalid JSON value at offset {self.pos}")
+        self.pos = match.end()
+
+    def skip_value(self):
+        """
+        Consume the next value without materializing it
+        """
+        char = self.peek()
+        if char == '"':
+            self.skip_string()
+            return
+        if char not in "[{":
+            self._skip_literal()
+            return
+
+        self.pos += 1
+        depth = 1
+        while depth:
+            match = _CONTAINER_SPECIAL.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("Unexpected end of JSON input")
+                continue
+            self.pos = match.start()
+            token = match.group()
+            if token == '"':
+                # Fast path for strings that fit in the current window
+                string = _STRING.match(self.buf, self.pos)
+                if string:
+                    self.pos = string.end()
+                else:
+                    self.skip_string()
+                continue
+            self.pos += 1
+            depth += 1 if token in "[{" else -1
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yield the keys of the next object; the caller must consume each value
+        """
+        self.expect('{')
+        while True:
+            char = self.peek()
+            if char == '}':
+                self.pos += 1
+                return
+            if char == ',':
+                self.pos += 1
+                continue
+            key = self.read_string()
+            self.expect(':')
+            yield key
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Step through the next array; the caller must consume each item
+        """
+        self.expect('[')
+        while True:
+            char = self.peek()
+            if char == ']':
+                self.pos += 1
+                return
+            if char == ',':
+                self.pos += 1
+                continue
+            yield
@@ -0,0 +1,94 @@
+"""
+Keyword Matcher Utility
+Counts many target keywords in one pass with an Aho-Corasick automaton
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Letters/digits, allowing inner apostrophes and hyphens (don't, real-time)
+WORD_PATTERN = r"[^\W_]+(?:['\u2019-][^\W_]+)*"
+_WORD = re.compile(WORD_PATTERN)
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over word tokens.
+
+    Keywords are split into words and matched against the page's word
+    sequence, so a match always starts and ends on a word boundary
+    ("seo" never matches inside "seoul"). All keywords are counted in a
+    single pass over the words, whatever the size of the keyword list.
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords = list(keywords)
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            tokens = _WORD.findall(keyword.lower())
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                next_state = self.goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][token] = next_state
+                state = next_state
+            self.output[state].append(index)
+
+        # Breadth-first failure links; outputs include those of the fallback state
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(token, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def count(self, words: Iterable[str]) -> List[int]:
+        """
+        Occurrences of each keyword in a lowercase word sequence
+        """
+        counts = [0] * len(self.keywords)
+        goto, fail, output = self.goto, self.fail, self.output
+        root = goto[0]
+        state = 0
+        for word in words:
+            if state == 0:
+                # Most words start no keyword; skip the failure walk for them
+                state = root.get(word, 0)
+            else:
+                while state and word not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(word, 0)
+            for index in output[state]:
+                counts[index] += 1
+        return counts
+
+@lru_cache(maxsize=128)
+def _automaton(keywords: Tuple[str, ...]) -> KeywordAutomaton:
+    return KeywordAutomaton(keywords)
+
+def get_automaton(keywords: Sequence[str]) -> KeywordAutomaton:
+    """
+    Automaton for a keyword set, built once and reused for later pages
+    """
+    return _automaton(tuple(keywords))
+
+def count_keywords(keywords: Sequence[str], words: Iterable[str]) -> Dict[str, int]:
+    """
+    Whole-word occurrences of each keyword (single words or phrases)
+    """
+    automaton = get_automaton(keywords)
+    return dict(zip(automaton.keywords, automaton.count(words)))
@@ -0,0 +1,160 @@
+"""
+Load Shedder Utility
+Adaptive sampling and priority-based load shedding for ingest routes
+"""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from typing import Dict, Tuple
+
+# Work that can be skipped under load, lowest priority first
+SHED_PRIORITIES = {
+    "trend": 0.5,   # historical trend lookup
+    "report": 0.75  # score + recommendations
+}
+
+class LoadShedder:
+    """
+    Tracks ingest queue depth and event-loop lag and turns them into a load
+    factor (1.0 == at capacity). Beacons are sampled per URL once the load
+    passes 0.5, and optional work is shed in SHED_PRIORITIES order.
+    """
+
+    def __init__(
+        self,
+        max_queue_depth: int = 64,
+        max_loop_lag_ms: float = 100.0,
+        min_sample_rate: float = 0.05,
+        min_samples_per_window: int = 5,
+        window_seconds: float = 10.0,
+        lag_interval_seconds: float = 0.1
+    ):
+        self.max_queue_depth = max_queue_depth
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self.min_sample_rate = min_sample_rate
+        self.min_samples_per_window = min_samples_per_window
+        self.window_seconds = window_seconds
+        self.lag_interval_seconds = lag_interval_seconds
+
+        self.in_flight = 0
+        self.loop_lag_ms = 0.0
+        self.seen = 0
+        self.admitted = 0
+
+        self._window_start = time.monotonic()
+        self._window_counts: Dict[str, int] = {}
+        self._monitor_loop = None
+
+    def ensure_lag_monitor(self):
+        """
+        Start measuring event-loop lag on the running loop (idempotent)
+        """
+        loop = asyncio.get_running_loop()
+        if self._monitor_loop is loop:
+            return
+        self._monitor_loop = loop
+        self._schedule_lag_probe(loop)
+
+    def _schedule_lag_probe(self, loop):
+        expected = loop.time() + self.lag_interval_seconds
+        loop.call_later(self.lag_interval_seconds, self._lag_probe, loop, expected)
+
+    def _lag_probe(self, loop, expected: float):
+        lag_ms = max(0.0, (loop.time() - expected) * 1000)
+        # Exponentially weighted so a single slow tick doesn't trigger shedding
+        self.loop_lag_ms = 0.8 * self.loop_lag_ms + 0.2 * lag_ms
+        if self._monitor_loop is loop and not loop.is_closed():
+            self._schedule_lag_probe(loop)
+
+    @contextmanager
+    def track(self):
+        """
+        Count a request as queued/in flight for the duration of the block
+        """
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def load(self) -> float:
+        """
+        Current load factor, the worse of queue depth and loop lag
+        """
+        queue_load = self.in_flight / self.max_queue_depth
+        lag_load = self.loop_lag_ms / self.max_loop_lag_ms
+        return max(queue_load, lag_load)
+
+    def sample_rate(self, url: str) -> float:
+        """
+        Probability that a beacon for this URL is kept at the current load
+        """
+        load = self.load()
+        if load <= 0.5:
+            return 1.0
+        # Rarely reported URLs are always kept so they don't vanish from trends
+        if self._window_counts.get(url, 0) < self.min_samples_per_window:
+            return 1.0
+        return max(self.min_sample_rate, 0.5 / load)
+
+    def admit(self, url: str) -> Tuple[bool, float]:
+        """
+        Decide whether to keep a beacon; returns (admitted, sample_rate)
+        """
+        now = time.monotonic()
+        if now - self._window_start >= self.window_seconds:
+            self._window_start = now
+            self._window_counts.clear()
+
+        rate = self.sample_rate(url)
+        self._window_counts[url] = self._window_counts.get(url, 0) + 1
+        self.seen += 1
+
+        admitted = rate >= 1.0 or random.random() < rate
+        if admitted:
+            self.admitted += 1
+        return admitted, rate
+
+    def should_shed(self, work: str) -> bool:
+        """
+        True if optional work of the given kind should be skipped right now
+        """
+        return self.load() >= SHED_PRIORITIES[work]
+
+    def status(self) -> Dict:
+        """
+        Snapshot of the shedder state for monitoring
+        """
+        load = self.load()
+        return {
+            "load": round(load, 3),
+            "in_flight": self.in_flight,
+            "loop_lag_ms": round(self.loop_lag_ms, 2),
+            "seen": self.seen,
+            "admitted": self.admitted,
+            "shedding": [work for work, threshold in SHED_PRIORITIES.items() if load >= threshold]
+        }
+
+class InFlightMiddleware:
+    """
+    ASGI middleware counting every HTTP request as in flight from the first
+    byte received to the last byte sent, so a shedder's queue depth sees
+    requests still reading their body or streaming their response
+    """
+
+    def __init__(self, app, shedder: LoadShedder):
+        self.app = app
+        self.shedder = shedder
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        self.shedder.ensure_lag_monitor()
+        with self.shedder.track():
+            await self.app(scope, receive, send)
+
+# Shared by the ingest routes and the app-wide in-flight middleware
+shedder = LoadShedder()
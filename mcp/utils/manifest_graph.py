@@ -0,0 +1,252 @@
+"""
+Manifest Graph Utility
+Builds the import graph from Vite's build manifest and computes the
+critical-path bytes each entry and route needs
+"""
+
+import json
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from mcp.utils.compression import compress_files
+
+ROUTER_PATH = Path(__file__).parent.parent.parent / "src" / "router" / "AppRouter.tsx"
+
+MANIFEST_LOCATIONS = (".vite/manifest.json", "manifest.json")
+
+_LAZY_IMPORT = re.compile(
+    r"const\s+(\w+)\s*=\s*(?:React\.)?lazy\(\s*\(\)\s*=>\s*import\(\s*['\"]([^'\"]+)['\"]\s*\)\s*\)"
+)
+_ROUTE = re.compile(r"<Route\b(.*?)(?=<Route\b|</Routes>)", re.S)
+_ROUTE_PATH = re.compile(r"\bpath=[\"']([^\"']+)[\"']")
+_JSX_TAG = re.compile(r"<([A-Z]\w*)")
+_SOURCE_EXTENSIONS = ("", ".tsx", ".ts", ".jsx", ".js", "/index.tsx", "/index.ts", "/index.jsx", "/index.js")
+
+def find_manifest(build_dir: str) -> Optional[str]:
+    for location in MANIFEST_LOCATIONS:
+        path = os.path.join(build_dir, location)
+        if os.path.exists(path):
+            return path
+    return None
+
+class ManifestGraph:
+    """
+    Static/dynamic import graph over Vite manifest chunks.
+
+    Static closures are memoized per chunk, so every per-entry and per-route
+    query after the first is a set union over cached results.
+    """
+
+    def __init__(self, manifest: Dict, build_dir: str):
+        self.manifest = manifest
+        self.build_dir = build_dir
+        self._closures: Dict[str, FrozenSet[str]] = {}
+
+        files = set()
+        for chunk in manifest.values():
+            files.add(chunk["file"])
+            files.update(chunk.get("css", []))
+        paths = {file: os.path.join(build_dir, file) for file in files}
+        existing = {file: path for file, path in paths.items() if os.path.exists(path)}
+        compressed = compress_files(existing.values())
+        self.sizes = {
+            file: {
+                "bytes": os.path.getsize(path),
+                "gzip": compressed[path]["gzip"] or os.path.getsize(path)
+            }
+            for file, path in existing.items()
+        }
+
+    @classmethod
+    def load(cls, build_dir: str) -> Optional["ManifestGraph"]:
+        path = find_manifest(build_dir)
+        if path is None:
+            return None
+        with open(path, "r") as f:
+            return cls(json.load(f), build_dir)
+
+    def entries(self) -> List[str]:
+        return [key for key, chunk in self.manifest.items() if chunk.get("isEntry")]
+
+    def static_closure(self, key: str) -> FrozenSet[str]:
+        """
+        Chunks loaded when `key` loads: itself plus its static imports, transitively
+        """
+        cached = self._closures.get(key)
+        if cached is not None:
+            return cached
+
+        seen = {key}
+        stack = [key]
+        while stack:
+            node = stack.pop()
+            for child in self.manifest.get(node, {}).get("imports", []):
+                if child in seen:
+                    continue
+                child_closure = self._closures.get(child)
+                if child_closure is not None:
+                    seen |= child_closure
+                else:
+                    seen.add(child)
+                    stack.append(child)
+
+        closure = frozenset(seen)
+        self._closures[key] = closure
+        return closure
+
+    def dynamic_path(self, start: str, target: str) -> Optional[List[str]]:
+        """
+        Shortest chain of imports from start to target (static or dynamic edges)
+        """
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                return path[::-1]
+            chunk = self.manifest.get(node, {})
+            for child in chunk.get("imports", []) + chunk.get("dynamicImports", []):
+                if child not in parents:
+                    parents[child] = node
+                    queue.append(child)
+        return None
+
+    def required_chunks(self, key: str, entry: Optional[str] = None) -> FrozenSet[str]:
+        """
+        Chunks needed to render `key`, including every dynamic hop from the entry
+        """
+        if entry is None or key == entry:
+            return self.static_closure(key)
+        path = self.dynamic_path(entry, key) or [entry, key]
+        required = frozenset()
+        for node in path:
+            required |= self.static_closure(node)
+        return required
+
+    def files(self, chunks: FrozenSet[str]) -> Tuple[set, set]:
+        """
+        Output JS and CSS file names of a set of chunks
+        """
+        js_files = {self.manifest[key]["file"] for key in chunks if key in self.manifest}
+        css_files = set()
+        for key in chunks:
+            css_files.update(self.manifest.get(key, {}).get("css", []))
+        return js_files, css_files
+
+    def cost(self, chunks: FrozenSet[str]) -> Dict:
+        """
+        JS/CSS bytes (raw and gzip) of a set of chunks, counting each file once
+        """
+        js_files, css_files = self.files(chunks)
+
+        def total(files, field):
+            return sum(self.sizes.get(file, {}).get(field, 0) for file in files)
+
+        js_bytes = total(js_files, "bytes")
+        css_bytes = total(css_files, "bytes")
+        return {
+            "js_bytes": js_bytes,
+            "css_bytes": css_bytes,
+            "total_bytes": js_bytes + css_bytes,
+            "gzip_bytes": total(js_files, "gzip") + total(css_files, "gzip"),
+            "chunk_count": len(chunks)
+        }
+
+def parse_router_routes(router_path: str = str(ROUTER_PATH)) -> List[Dict]:
+    """
+    Route path -> lazily imported page module, read from AppRouter.tsx
+    """
+    if not os.path.exists(router_path):
+        return []
+    with open(router_path, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    router_dir = os.path.dirname(router_path)
+    repo_root = os.path.dirname(os.path.dirname(router_dir))
+    lazy_modules = {
+        name: os.path.relpath(os.path.normpath(os.path.join(router_dir, module)), repo_root).replace(os.sep, "/")
+        for name, module in _LAZY_IMPORT.findall(source)
+    }
+
+    routes = []
+    for block in _ROUTE.findall(source):
+        path_match = _ROUTE_PATH.search(block)
+        if not path_match:
+            continue
+        component = next((tag for tag in _JSX_TAG.findall(block) if tag in lazy_modules), None)
+        if component:
+            routes.append({"path": path_match.group(1), "component": component, "module": lazy_modules[component]})
+    return routes
+
+def _manifest_key(graph: ManifestGraph, module: str) -> Optional[str]:
+    for extension in _SOURCE_EXTENSIONS:
+        if module + extension in graph.manifest:
+            return module + extension
+    return None
+
+def analyze_critical_path(
+    build_dir: str,
+    router_path: str = str(ROUTER_PATH),
+    graph: Optional[ManifestGraph] = None
+) -> Dict:
+    """
+    Transitively required JS/CSS bytes per entry and per route, plus chunks
+    loaded at startup that only a single route needs (lazy-load candidates).
+    Pass an already loaded graph to skip reading and compressing the build again.
+    """
+    if graph is None:
+        graph = ManifestGraph.load(build_dir)
+    if graph is None:
+        return {"error": f"No Vite manifest found in {build_dir} (enable build.manifest)"}
+
+    entries = graph.entries()
+    main_entry = next((key for key in entries if key.endswith(".html")), entries[0] if entries else None)
+
+    entry_costs = [
+        {"name": key, "file": graph.manifest[key]["file"], **graph.cost(graph.static_closure(key))}
+        for key in entries
+    ]
+
+    routes = []
+    route_only: Dict[str, FrozenSet[str]] = {}
+    for route in parse_router_routes(router_path):
+        key = _manifest_key(graph, route["module"])
+        if key is None:
+            routes.append({**route, "error": "Module not found in manifest"})
+            continue
+        required = graph.required_chunks(key, main_entry)
+        js_files, css_files = graph.files(required)
+        routes.append({**route, "chunk": key, **graph.cost(required), "files": sorted(js_files | css_files)})
+        route_only[route["path"]] = graph.static_closure(key)
+
+    # Startup chunks (beyond the entry itself) that exactly one route pulls in
+    lazy_load_candidates = []
+    if main_entry is not None:
+        startup = graph.static_closure(main_entry) - {main_entry}
+        users: Dict[str, List[str]] = {key: [] for key in startup}
+        for path, chunks in route_only.items():
+            for key in chunks & startup:
+                users[key].append(path)
+        for key, paths in users.items():
+            if len(paths) == 1:
+                file = graph.manifest[key]["file"]
+                lazy_load_candidates.append({
+                    "chunk": key,
+                    "file": file,
+                    "bytes": graph.sizes.get(file, {}).get("bytes", 0),
+                    "route": paths[0]
+                })
+        lazy_load_candidates.sort(key=lambda candidate: -candidate["bytes"])
+
+    return {
+        "entries": entry_costs,
+        "routes": sorted(routes, key=lambda route: -route.get("total_bytes", 0)),
+        "lazy_load_candidates": lazy_load_candidates
+    }
@@ -0,0 +1,114 @@
+"""
+Metrics Export Utility
+Streams collected performance samples as Arrow IPC or Parquet
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency, export endpoints report 501 without it
+    pa = None
+    pq = None
+
+EXPORT_FORMATS = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet"
+}
+
+METRIC_COLUMNS = ["lcp", "fid", "cls", "fcp", "ttfb"]
+TEXT_COLUMNS = ["url", "user_agent", "connection_type", "referrer"]
+
+def export_schema():
+    """
+    Column layout shared by both export formats
+    """
+    return pa.schema(
+        [("url", pa.string()), ("timestamp", pa.timestamp("us"))]
+        + [(column, pa.float64()) for column in METRIC_COLUMNS]
+        + [("user_agent", pa.string()), ("connection_type", pa.string()), ("referrer", pa.string())]
+        + [("sample_rate", pa.float64())]
+    )
+
+def rows_to_batch(rows: List[Dict], schema) -> "pa.RecordBatch":
+    """
+    Convert a slice of stored sample dicts into one columnar record batch
+    """
+    columns = {
+        "timestamp": [datetime.fromisoformat(row["timestamp"]) for row in rows],
+        "sample_rate": [row.get("sample_rate", 1.0) for row in rows]
+    }
+    for column in METRIC_COLUMNS + TEXT_COLUMNS:
+        columns[column] = [row.get(column) for row in rows]
+
+    return pa.RecordBatch.from_arrays(
+        [pa.array(columns[field.name], type=field.type) for field in schema],
+        schema=schema
+    )
+
+def _batches(rows: List[Dict], schema, batch_size: int) -> Iterator["pa.RecordBatch"]:
+    for offset in range(0, len(rows), batch_size):
+        yield rows_to_batch(rows[offset:offset + batch_size], schema)
+
+class _ChunkSink:
+    """
+    Write-only file object whose contents are drained after every batch,
+    so the writers never hold more than one encoded batch in memory
+    """
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+def stream_export(rows: List[Dict], export_format: str = "arrow", batch_size: int = 65536) -> Iterator[bytes]:
+    """
+    Yield the encoded export one record batch (Parquet row group) at a time
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow is required for metrics export: pip install pyarrow")
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    schema = export_schema()
+    sink = _ChunkSink()
+
+    if export_format == "arrow":
+        writer = pa.ipc.new_stream(sink, schema)
+        write = writer.write_batch
+    else:
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        write = lambda batch: writer.write_table(pa.Table.from_batches([batch]))
+
+    for batch in _batches(rows, schema, batch_size):
+        write(batch)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+
+    writer.close()
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
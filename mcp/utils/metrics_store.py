@@ -0,0 +1,67 @@
+"""
+Metrics Store Utility
+Bounded, time-ordered in-memory storage for collected performance samples
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+class MetricsStore:
+    """
+    Append-only store that keeps the newest `capacity` samples.
+
+    Samples arrive in time order, so a parallel list of epoch timestamps lets
+    time-range scans bisect straight to the matching window instead of
+    filtering every row.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._rows: List[Dict] = []
+        self._times: List[float] = []
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self._rows) - self._start
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self._rows[self._start:])
+
+    def append(self, row: Dict, recorded_at: Optional[datetime] = None):
+        """
+        Add a sample, evicting the oldest one once capacity is reached
+        """
+        recorded_at = recorded_at or datetime.now()
+        row['timestamp'] = recorded_at.isoformat()
+        self._rows.append(row)
+        self._times.append(recorded_at.timestamp())
+
+        if len(self) > self.capacity:
+            self._start += 1
+            # Compact lazily so eviction stays amortized O(1)
+            if self._start >= self.capacity:
+                del self._rows[:self._start]
+                del self._times[:self._start]
+                self._start = 0
+
+    def scan(
+        self,
+        url_prefix: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[Dict]:
+        """
+        Return samples matching a URL prefix and [since, until] time range
+        """
+        lo = self._start
+        hi = len(self._rows)
+        if since is not None:
+            lo = bisect_left(self._times, since.timestamp(), lo, hi)
+        if until is not None:
+            hi = bisect_right(self._times, until.timestamp(), lo, hi)
+
+        rows = self._rows[lo:hi]
+        if url_prefix:
+            rows = [row for row in rows if row.get('url', '').startswith(url_prefix)]
+        return rows
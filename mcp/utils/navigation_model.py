@@ -0,0 +1,227 @@
+"""
+Navigation Model Utility
+First-order Markov model of page-to-page navigation, built incrementally
+from analytics beacons, for choosing which pages to prefetch
+"""
+
+import math
+import threading
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
+from mcp.utils.disk_cache import JsonFileCache
+
+# Successors kept per page for top-k lookup
+TOP_K = 8
+# Minimum Wilson lower bound on P(next page) before it is prefetched
+PREFETCH_THRESHOLD = 0.2
+# z for a 95% confidence interval
+CONFIDENCE_Z = 1.96
+# Persist after this many recorded transitions (and on shutdown)
+SAVE_EVERY = 100
+
+def normalize_page(url: str) -> str:
+    """
+    Path of a page URL without query, fragment or trailing slash
+    """
+    path = urlparse(url).path or "/"
+    return path.rstrip("/") or "/"
+
+def same_site(referrer: str, url: str) -> bool:
+    """
+    True unless both URLs are absolute and on different hosts
+    """
+    referrer_host = urlparse(referrer).netloc
+    url_host = urlparse(url).netloc
+    return not (referrer_host and url_host) or referrer_host == url_host
+
+def wilson_lower_bound(p: float, n: float, z: float = CONFIDENCE_Z) -> float:
+    """
+    Lower bound of the Wilson score interval for a proportion p observed
+    over n trials
+    """
+    if n <= 0:
+        return 0.0
+    denominator = 1 + z * z / n
+    center = p + z * z / (2 * n)
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+    return max(0.0, (center - margin) / denominator)
+
+def effective_sample_size(weight_sum: float, squared_weight_sum: float) -> float:
+    """
+    Kish effective sample size of weighted observations: equal to the raw
+    count for unit weights, and never more than it
+    """
+    return weight_sum * weight_sum / squared_weight_sum if squared_weight_sum > 0 else 0.0
+
+class NavigationModel:
+    """
+    Sparse transition counts between pages.
+
+    Pages are interned to integer ids; each page keeps a dict of weighted
+    successor counts, its total outgoing weight and its top-k successors
+    sorted by weighted count. Counts only ever grow, so the top-k list is
+    updated in O(k) per transition and lookups read it directly.
+
+    Weights (1 / sample_rate for sampled beacons) estimate the true traffic
+    and give the point probability. Raw observation counts and the sum of
+    squared weights are kept alongside, so confidence is computed from the
+    Kish effective sample size rather than from the inflated weighted total.
+    """
+
+    def __init__(self, name: str = "navigation-model.json"):
+        self._store = JsonFileCache(name)
+        self._lock = threading.Lock()
+        self._pages: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._edges: Dict[int, Dict[int, float]] = {}
+        self._totals: Dict[int, float] = {}
+        self._observations: Dict[int, Dict[int, int]] = {}
+        self._squares: Dict[int, float] = {}
+        self._top: Dict[int, List[Tuple[float, int]]] = {}
+        self._pending = 0
+        self._loaded = False
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        data = self._store.get("model")
+        if not data:
+            return
+        self._pages = data["pages"]
+        self._ids = {page: index for index, page in enumerate(self._pages)}
+        for source, successors in data["edges"].items():
+            source = int(source)
+            counts, observations = {}, {}
+            for target, (weight, raw) in successors.items():
+                counts[int(target)], observations[int(target)] = weight, int(raw)
+            self._edges[source] = counts
+            self._observations[source] = observations
+            self._totals[source] = sum(counts.values())
+            self._squares[source] = data["squares"][str(source)]
+            self._top[source] = sorted(
+                ((count, target) for target, count in counts.items()), reverse=True
+            )[:TOP_K]
+
+    def _intern(self, page: str) -> int:
+        page_id = self._ids.get(page)
+        if page_id is None:
+            page_id = self._ids[page] = len(self._pages)
+            self._pages.append(page)
+        return page_id
+
+    def record(self, referrer: str, url: str, weight: float = 1.0) -> bool:
+        """
+        Count one navigation from referrer to url (weighted, e.g. by
+        1 / sample_rate); returns False for external or self referrals
+        """
+        if not referrer or not same_site(referrer, url):
+            return False
+        source_page, target_page = normalize_page(referrer), normalize_page(url)
+        if source_page == target_page:
+            return False
+
+        with self._lock:
+            self._load()
+            source, target = self._intern(source_page), self._intern(target_page)
+            successors = self._edges.setdefault(source, {})
+            count = successors.get(target, 0.0) + weight
+            successors[target] = count
+            self._totals[source] = self._totals.get(source, 0.0) + weight
+            observations = self._observations.setdefault(source, {})
+            observations[target] = observations.get(target, 0) + 1
+            self._squares[source] = self._squares.get(source, 0.0) + weight * weight
+            self._update_top(source, target, count)
+
+            self._pending += 1
+            if self._pending >= SAVE_EVERY:
+                self._save()
+        return True
+
+    def _update_top(self, source: int, target: int, count: float):
+        top = self._top.setdefault(source, [])
+        for index, (_, page_id) in enumerate(top):
+            if page_id == target:
+                del top[index]
+                break
+        else:
+            if len(top) >= TOP_K and count <= top[-1][0]:
+                return
+        # Insert keeping descending order; at most TOP_K entries
+        position = len(top)
+        while position > 0 and top[position - 1][0] < count:
+            position -= 1
+        top.insert(position, (count, target))
+        del top[TOP_K:]
+
+    def predict(
+        self,
+        url: str,
+        k: int = 3,
+        threshold: float = PREFETCH_THRESHOLD
+    ) -> List[Dict]:
+        """
+        Likely next pages from url whose transition probability is above
+        the threshold with 95% confidence: the Wilson lower bound of the
+        weighted probability over the effective number of observations
+        """
+        with self._lock:
+            self._load()
+            source = self._ids.get(normalize_page(url))
+            if source is None:
+                return []
+            total = self._totals.get(source, 0.0)
+            n = effective_sample_size(total, self._squares.get(source, 0.0))
+            predictions = []
+            for count, target in self._top.get(source, [])[:k]:
+                probability = count / total
+                confidence = wilson_lower_bound(probability, n)
+                if confidence < threshold:
+                    break
+                predictions.append({
+                    "page": self._pages[target],
+                    "probability": round(probability, 4),
+                    "confidence": round(confidence, 4),
+                    "count": round(count, 2),
+                    "observations": self._observations[source][target]
+                })
+            return predictions
+
+    def next_pages(self, url: str, k: int = 3, threshold: float = PREFETCH_THRESHOLD) -> List[str]:
+        return [prediction["page"] for prediction in self.predict(url, k, threshold)]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._load()
+            return {
+                "pages": len(self._pages),
+                "transitions": sum(len(successors) for successors in self._edges.values()),
+                "observations": sum(sum(counts.values()) for counts in self._observations.values()),
+                "weighted_observations": round(sum(self._totals.values()), 2)
+            }
+
+    def save(self):
+        """
+        Persist transitions recorded since the last save, if any
+        """
+        with self._lock:
+            if self._pending:
+                self._save()
+
+    def _save(self):
+        self._pending = 0
+        self._store.set("model", {
+            "pages": self._pages,
+            "edges": {
+                str(source): {
+                    str(target): [count, self._observations[source][target]]
+                    for target, count in successors.items()
+                }
+                for source, successors in self._edges.items()
+            },
+            "squares": {str(source): squares for source, squares in self._squares.items()}
+        })
+        self._store.save()
+
+navigation_model = NavigationModel()
@@ -0,0 +1,229 @@
+"""
+Near-Duplicate Content Utility
+Persistent MinHash/LSH index over page word shingles for finding
+near-duplicate copy without pairwise comparison
+"""
+
+import hashlib
+import os
+import random
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from mcp.utils.content_analyzer import BLOCK_BREAK, scan_content
+from mcp.utils.disk_cache import JsonFileCache
+from mcp.utils.site_content import DEFAULT_ROOTS, REPO_ROOT, extract_page, find_pages
+
+SHINGLE_SIZE = 5
+NUM_PERMUTATIONS = 128
+# 32 bands of 4 rows put the LSH threshold (1/bands)^(1/rows) near 0.42, so
+# pairs at 0.7 Jaccard share a bucket with ~99.98% probability; candidates are
+# then filtered by their estimated similarity
+BANDS = 32
+ROWS = NUM_PERMUTATIONS // BANDS
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed so signatures stay comparable across runs and processes
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+def shingles(words: List[str], size: int = SHINGLE_SIZE) -> Set[int]:
+    """
+    32-bit hashes of the page's overlapping word n-grams
+    """
+    if not words:
+        return set()
+    if len(words) <= size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))}
+    return {
+        zlib.crc32(" ".join(words[i:i + size]).encode("utf-8"))
+        for i in range(len(words) - size + 1)
+    }
+
+def minhash(hashes: Set[int]) -> List[int]:
+    """
+    MinHash signature: the minimum of each universal hash over the shingles
+    """
+    return [
+        min((a * value + b) % _PRIME for value in hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    ]
+
+def estimate_jaccard(first: List[int], second: List[int]) -> float:
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+def _band_keys(signature: List[int]) -> List[str]:
+    return [
+        f"{band}:{hash(tuple(signature[band * ROWS:(band + 1) * ROWS]))}"
+        for band in range(BANDS)
+    ]
+
+class NearDuplicateIndex:
+    """
+    LSH index of page MinHash signatures.
+
+    Signatures (with the content hash they were computed from) persist in
+    .mcp-cache; band buckets are rebuilt in memory on load. Updating a page
+    only touches that page's buckets, and candidates for a query come from
+    its buckets alone rather than from every other page.
+    """
+
+    def __init__(self, name: str = "near-duplicates.json"):
+        self._store = JsonFileCache(name)
+        self._buckets: Optional[Dict[str, Set[str]]] = None
+        self._lock = threading.Lock()
+
+    def _index(self) -> Dict[str, Set[str]]:
+        if self._buckets is None:
+            self._buckets = defaultdict(set)
+            for path in self._store.keys():
+                for key in _band_keys(self._store.get(path)["signature"]):
+                    self._buckets[key].add(path)
+        return self._buckets
+
+    def paths(self) -> List[str]:
+        return self._store.keys()
+
+    def content_hash(self, path: str) -> Optional[str]:
+        entry = self._store.get(path)
+        return entry["hash"] if entry is not None else None
+
+    def update(self, path: str, content_hash: str, words: List[str]) -> bool:
+        """
+        (Re)index one page; returns False when its content is unchanged
+        """
+        with self._lock:
+            entry = self._store.get(path)
+            if entry is not None and entry["hash"] == content_hash:
+                return False
+            hashes = shingles(words)
+            if not hashes:
+                # Pages without text are not indexed
+                self._remove(path)
+                return entry is not None
+            signature = minhash(hashes)
+            buckets = self._index()
+            if entry is not None:
+                for key in _band_keys(entry["signature"]):
+                    buckets[key].discard(path)
+            for key in _band_keys(signature):
+                buckets[key].add(path)
+            self._store.set(path, {"hash": content_hash, "signature": signature, "words": len(words)})
+            return True
+
+    def remove(self, path: str):
+        with self._lock:
+            self._remove(path)
+
+    def _remove(self, path: str):
+        entry = self._store.pop(path)
+        if entry is not None:
+            buckets = self._index()
+            for key in _band_keys(entry["signature"]):
+                buckets[key].discard(path)
+
+    def save(self):
+        self._store.save()
+
+    def similar(self, path: str, threshold: float = 0.7) -> List[Dict]:
+        """
+        Pages whose estimated Jaccard similarity to `path` meets the threshold
+        """
+        entry = self._store.get(path)
+        if entry is None:
+            return []
+        buckets = self._index()
+        candidates = set()
+        for key in _band_keys(entry["signature"]):
+            candidates |= buckets.get(key, set())
+        candidates.discard(path)
+
+        matches = []
+        for other in candidates:
+            similarity = estimate_jaccard(entry["signature"], self._store.get(other)["signature"])
+            if similarity >= threshold:
+                matches.append({"path": other, "jaccard": round(similarity, 3)})
+        matches.sort(key=lambda match: -match["jaccard"])
+        return matches
+
+    def clusters(self, threshold: float = 0.7) -> List[Dict]:
+        """
+        Groups of near-duplicate pages (connected by pairs above the threshold)
+        """
+        signatures = {path: self._store.get(path)["signature"] for path in self._store.keys()}
+        parent = {path: path for path in signatures}
+
+        def find(path: str) -> str:
+            while parent[path] != path:
+                parent[path] = parent[parent[path]]
+                path = parent[path]
+            return path
+
+        pairs = []
+        seen = set()
+        for members in self._index().values():
+            if len(members) < 2:
+                continue
+            ordered = sorted(members)
+            for i, first in enumerate(ordered):
+                for second in ordered[i + 1:]:
+                    if (first, second) in seen:
+                        continue
+                    seen.add((first, second))
+                    similarity = estimate_jaccard(signatures[first], signatures[second])
+                    if similarity >= threshold:
+                        pairs.append((first, second, similarity))
+                        parent[find(first)] = find(second)
+
+        groups: Dict[str, Dict] = defaultdict(lambda: {"pages": set(), "pairs": []})
+        for first, second, similarity in pairs:
+            group = groups[find(first)]
+            group["pages"].update((first, second))
+            group["pairs"].append({"a": first, "b": second, "jaccard": round(similarity, 3)})
+
+        clusters = []
+        for group in groups.values():
+            scores = [pair["jaccard"] for pair in group["pairs"]]
+            clusters.append({
+                "pages": sorted(group["pages"]),
+                "max_jaccard": max(scores),
+                "min_jaccard": min(scores),
+                "pairs": sorted(group["pairs"], key=lambda pair: -pair["jaccard"])
+            })
+        clusters.sort(key=lambda cluster: (-cluster["max_jaccard"], -len(cluster["pages"])))
+        return clusters
+
+_site_index = NearDuplicateIndex()
+
+def sync_site_index(roots: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Bring the site index up to date with content/ and src/pages: re-shingle
+    changed pages and drop deleted ones
+    """
+    present = set()
+    updated = 0
+    for path in find_pages(list(roots or DEFAULT_ROOTS)):
+        relative = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+        present.add(relative)
+        html = extract_page(path)["html"]
+        content_hash = "sha1:" + hashlib.sha1(html.encode("utf-8")).hexdigest()
+        if _site_index.content_hash(relative) == content_hash:
+            continue
+        words = [token for token in scan_content(html)["tokens"] if token != BLOCK_BREAK]
+        updated += _site_index.update(relative, content_hash, words)
+
+    removed = [path for path in _site_index.paths() if path not in present]
+    for path in removed:
+        _site_index.remove(path)
+    _site_index.save()
+    return {"indexed": len(present), "updated": updated, "removed": len(removed)}
+
+def site_index() -> NearDuplicateIndex:
+    return _site_index
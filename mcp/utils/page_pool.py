@@ -0,0 +1,68 @@
+"""
+Page Pool Utility
+Runs per-page jobs in a process pool and streams results as they finish,
+for the site-wide content analysis and build head audit
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+def _describe(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+def iter_pool_results(
+    worker: Callable[[Any], Dict],
+    jobs: List[Any],
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[Any, Optional[Dict], Optional[str]]]:
+    """
+    (job, result, error) for every job in completion order. More than one
+    job runs in worker processes, a single job runs inline. A job that
+    raises yields its error message so the remaining pages still stream.
+    """
+    if len(jobs) <= 1:
+        for job in jobs:
+            try:
+                result, error = worker(job), None
+            except Exception as e:
+                result, error = None, _describe(e)
+            yield job, result, error
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(worker, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, _describe(e)
+            yield futures[future], result, error
+
+def error_entry(path: str, error: str) -> Dict:
+    return {"type": "error", "path": path, "error": error}
+
+class PageSummary:
+    """
+    Running counts shared by per-page summaries; subclasses add their own
+    aggregates in add() and result()
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.cached = 0
+        self.failed: List[str] = []
+
+    def add(self, page: Dict):
+        self.pages += 1
+        self.cached += page["cached"]
+
+    def fail(self, entry: Dict):
+        self.failed.append(entry["path"])
+
+    def result(self) -> Dict:
+        return {
+            "type": "summary",
+            "pages": self.pages,
+            "cached": self.cached,
+            "failed": self.failed
+        }
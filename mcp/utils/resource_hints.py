@@ -3,16 +3,125 @@ Resource Hints Generator Utility
 Generates optimal preload, prefetch, and preconnect hints
 """
 
-from typing import Dict, List
-from urllib.parse import urlparse
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlparse
+import hashlib
+import os
 import re
 
+from mcp.utils.compression import compress_files
+from mcp.utils.disk_cache import JsonFileCache
+from mcp.utils.manifest_graph import ManifestGraph, analyze_critical_path, find_manifest
+
+# Connection classes (navigator.connection.effectiveType plus broadband):
+# downlink in kbit/s; the preload budget is what arrives in PRELOAD_WINDOW_SECONDS
+CONNECTION_PROFILES = {
+    "slow-2g": {"downlink_kbps": 50},
+    "2g": {"downlink_kbps": 250},
+    "3g": {"downlink_kbps": 700},
+    "4g": {"downlink_kbps": 1600},
+    "desktop": {"downlink_kbps": 10000}
+}
+DEFAULT_CONNECTION = "4g"
+PRELOAD_WINDOW_SECONDS = 1.5
+
+# Value of preloading one resource of each type; render-blocking first
+PRELOAD_PRIORITY = {"style": 10, "font": 8, "image": 7, "script": 5, "fetch": 2, "video": 1, "audio": 1}
+# Transfer sizes assumed for resources not found in the build directory
+ESTIMATED_BYTES = {"style": 20000, "font": 25000, "image": 100000, "script": 50000}
+DEFAULT_ESTIMATED_BYTES = 50000
+# Knapsack capacity is bucketed to this many bytes
+KNAPSACK_UNIT = 1024
+MAX_PRELOADS = 10
+
+def preload_budget(connection: str) -> int:
+    profile = CONNECTION_PROFILES.get(connection, CONNECTION_PROFILES[DEFAULT_CONNECTION])
+    return int(profile["downlink_kbps"] * 1000 / 8 * PRELOAD_WINDOW_SECONDS)
+
+def resource_sizes(resources: List[str], build_dir: str) -> Dict[str, Dict]:
+    """
+    Transfer size of each resource: gzip size for compressible files in the
+    build directory, raw size for precompressed ones, an estimate otherwise
+    """
+    paths = {}
+    for resource in resources:
+        path = _local_path(resource, os.path.join(build_dir, "index.html"), build_dir)
+        if path and os.path.isfile(path):
+            paths[resource] = path
+    compressed = compress_files(paths.values())
+
+    sizes = {}
+    for resource in resources:
+        path = paths.get(resource)
+        if path is None:
+            estimate = ESTIMATED_BYTES.get(detect_resource_type(resource), DEFAULT_ESTIMATED_BYTES)
+            sizes[resource] = {"bytes": estimate, "estimated": True}
+        else:
+            sizes[resource] = {"bytes": compressed[path]["gzip"] or os.path.getsize(path), "estimated": False}
+    return sizes
+
+def optimize_preloads(resources: List[str], sizes: Dict[str, Dict], budget_bytes: int) -> Dict:
+    """
+    Choose at most MAX_PRELOADS resources with the highest total priority
+    whose bytes fit the budget (0/1 knapsack over KNAPSACK_UNIT buckets with
+    a count dimension), ordered by priority per byte. Position in the input
+    only breaks ties between equal priorities.
+    """
+    items = []
+    for position, resource in enumerate(dict.fromkeys(resources)):
+        size = sizes[resource]["bytes"]
+        value = PRELOAD_PRIORITY.get(detect_resource_type(resource), 1) + 1e-3 / (position + 1)
+        items.append((resource, size, value, max(1, -(-size // KNAPSACK_UNIT))))
+
+    capacity = budget_bytes // KNAPSACK_UNIT
+    # best[k][c] = (value, chosen item indexes) using at most k items and c units
+    best = [[(0.0, ())] * (capacity + 1) for _ in range(MAX_PRELOADS + 1)]
+    for index, (_, _, value, units) in enumerate(items):
+        for k in range(MAX_PRELOADS, 0, -1):
+            row, previous = best[k], best[k - 1]
+            for c in range(capacity, units - 1, -1):
+                candidate = previous[c - units][0] + value
+                if candidate > row[c][0]:
+                    row[c] = (candidate, previous[c - units][1] + (index,))
+
+    chosen = sorted(best[MAX_PRELOADS][capacity][1], key=lambda index: -items[index][2] / max(items[index][1], 1))
+    selected = {items[index][0] for index in chosen}
+    return {
+        "preloads": [items[index][0] for index in chosen],
+        "expected_critical_bytes": sum(items[index][1] for index in chosen),
+        "budget_bytes": budget_bytes,
+        "skipped": [
+            {"href": resource, "bytes": size}
+            for resource, size, _, _ in items if resource not in selected
+        ]
+    }
+
 def generate_resource_hints(request) -> Dict:
     """
     Generate optimal resource hints based on page analysis
+
+    With a build_dir, preloads are chosen per connection profile to fit a
+    byte budget instead of taking the first 10 critical resources.
     """
     hints = []
     html_tags = []
+    preloads = request.critical_resources[:10]  # Limit to 10
+    optimization = {}
+
+    if request.build_dir:
+        connection = request.connection_type or DEFAULT_CONNECTION
+        profiles = list(dict.fromkeys((request.connection_profiles or []) + [connection]))
+        sizes = resource_sizes(request.critical_resources, request.build_dir)
+        profile_results = {
+            profile: optimize_preloads(request.critical_resources, sizes, preload_budget(profile))
+            for profile in profiles
+        }
+        preloads = profile_results[connection]["preloads"]
+        optimization = {
+            "expected_critical_bytes": profile_results[connection]["expected_critical_bytes"],
+            "profiles": profile_results
+        }
 
     # Preconnect to external domains
     if request.external_domains:
@@ -30,7 +139,7 @@ def generate_resource_hints(request) -> Dict:
 
     # Preload critical resources
     priority_order = []
-    for i, resource in enumerate(request.critical_resources[:10]):  # Limit to 10
+    for i, resource in enumerate(preloads):
         resource_type = detect_resource_type(resource)
 
         hint = {
@@ -69,7 +178,9 @@ def generate_resource_hints(request) -> Dict:
     return {
         "hints": hints,
         "html_tags": html_tags,
-        "priority_order": priority_order
+        "priority_order": priority_order,
+        "link_headers": link_headers(hints),
+        **optimization
     }
 
 def detect_resource_type(url: str) -> str:
@@ -93,20 +204,300 @@ def detect_resource_type(url: str) -> str:
     else:
         return "fetch"
 
-def analyze_page_resources(page_url: str) -> Dict:
+# Critical-path tiers, earliest first; within a tier larger files go first
+TIER_PRECONNECT = 0
+TIER_BLOCKING_CSS = 1
+TIER_FONT = 2
+TIER_LCP_IMAGE = 3
+TIER_ENTRY_JS = 4
+TIER_STATIC_IMPORT = 5
+TIER_ROUTE = 6
+
+MAX_FONT_PRELOADS = 3
+MAX_LCP_CANDIDATES = 2
+MAX_PRECONNECTS = 5
+HINTS_VERSION = 2
+
+# "<build dir>|<page URL path>" -> {"key": content key, "files": files read, "result": resources}
+_page_cache = JsonFileCache("resource-hints.json")
+
+_CSS_FONT_URL = re.compile(r"url\(\s*['\"]?([^'\")]+?\.(woff2?|ttf|otf))(?:[?#][^'\")]*)?['\"]?\s*\)", re.I)
+
+class PageResourceParser(HTMLParser):
+    """
+    Collects the stylesheets, scripts, images and external origins a page
+    references, in document order
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.in_head = True
+        self.stylesheets: List[Dict] = []
+        self.scripts: List[Dict] = []
+        self.modulepreloads: List[str] = []
+        self.images: List[Dict] = []
+        self.origins: List[str] = []
+
+    def _origin(self, url: str):
+        parsed = urlparse(url)
+        if parsed.scheme in ("http", "https") and parsed.netloc:
+            origin = f"{parsed.scheme}://{parsed.netloc}"
+            if origin not in self.origins:
+                self.origins.append(origin)
+
+    def handle_starttag(self, tag, attrs):
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "body":
+            self.in_head = False
+        elif tag == "link":
+            rel = attributes.get("rel", "").lower().split()
+            href = attributes.get("href", "")
+            if not href:
+                return
+            if "stylesheet" in rel:
+                blocking = attributes.get("media", "all") in ("all", "screen", "") and "disabled" not in attributes
+                self.stylesheets.append({"href": href, "blocking": blocking})
+                self._origin(href)
+            elif "modulepreload" in rel:
+                self.modulepreloads.append(href)
+            elif "preload" in rel and attributes.get("as") == "image":
+                self.images.append({"href": href, "priority": True, "lazy": False})
+        elif tag == "script" and attributes.get("src"):
+            self.scripts.append({
+                "href": attributes["src"],
+                "module": attributes.get("type") == "module",
+                "blocking": self.in_head and not ({"async", "defer"} & set(attributes)) and attributes.get("type") != "module"
+            })
+            self._origin(attributes["src"])
+        elif tag == "img" and (attributes.get("src") or attributes.get("srcset")):
+            href = attributes.get("src") or attributes["srcset"].split(",")[0].split()[0]
+            self.images.append({
+                "href": href,
+                "priority": attributes.get("fetchpriority") == "high",
+                "lazy": attributes.get("loading") == "lazy"
+            })
+            self._origin(href)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+def _page_file(page_url: str, build_dir: str) -> Optional[str]:
     """
-    Analyze a page URL and automatically detect resource hints
-    Note: This is a placeholder - in production, you'd fetch and parse the HTML
+    Built HTML file serving a page URL; single-page apps fall back to index.html
     """
-    # In production, fetch the page and parse HTML
-    # Extract CSS, JS, fonts, images
-    # Return suggested hints
+    path = unquote(urlparse(page_url).path or "/").strip("/")
+    candidates = [os.path.join(path, "index.html"), f"{path}.html", path] if path else []
+    for candidate in candidates + ["index.html"]:
+        full = os.path.join(build_dir, candidate)
+        if candidate.endswith(".html") and os.path.isfile(full):
+            return full
+    return None
+
+def _local_path(href: str, base_path: str, build_dir: str) -> Optional[str]:
+    parsed = urlparse(href)
+    if parsed.scheme or parsed.netloc or not parsed.path:
+        return None
+    if parsed.path.startswith("/"):
+        return os.path.join(build_dir, parsed.path.lstrip("/"))
+    return os.path.normpath(os.path.join(os.path.dirname(base_path), parsed.path))
+
+def _public_href(path: str, build_dir: str) -> str:
+    return "/" + os.path.relpath(path, build_dir).replace(os.sep, "/")
+
+def _size(path: Optional[str]) -> int:
+    return os.path.getsize(path) if path and os.path.isfile(path) else 0
 
+def _css_fonts(css_path: str, build_dir: str) -> List[str]:
+    """
+    Font files referenced by a stylesheet; woff2 only when the CSS offers it
+    """
+    try:
+        with open(css_path, "r", encoding="utf-8", errors="ignore") as f:
+            css = f.read()
+    except OSError:
+        return []
+    fonts = [(url, extension.lower()) for url, extension in _CSS_FONT_URL.findall(css)]
+    if any(extension == "woff2" for _, extension in fonts):
+        fonts = [font for font in fonts if font[1] == "woff2"]
+    hrefs = []
+    for url, _ in fonts:
+        local = _local_path(url, css_path, build_dir)
+        href = _public_href(local, build_dir) if local else url
+        if href not in hrefs:
+            hrefs.append(href)
+    return hrefs
+
+def _page_key(html_path: str, build_dir: str, files: List[str]) -> str:
+    """
+    Content of the page and the manifest, plus size and mtime of every
+    other file the result was built from
+    """
+    digest = hashlib.sha1(str(HINTS_VERSION).encode("utf-8"))
+    manifest = find_manifest(build_dir)
+    for path in (html_path, manifest):
+        if path:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    for path in files:
+        try:
+            stat = os.stat(path)
+            digest.update(f"{path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+        except OSError:
+            digest.update(f"{path}|missing\n".encode("utf-8"))
+    return "sha1:" + digest.hexdigest()
+
+def collect_page_resources(page_url: str, build_dir: str = "dist") -> Dict:
+    """
+    Render-critical resources of a built page (from its HTML, the CSS it
+    links and the Vite manifest), ordered by critical-path tier then size.
+    Cached per build directory and page until the page, the manifest or
+    any file it references changes.
+    """
+    html_path = _page_file(page_url, build_dir)
+    if html_path is None:
+        return {"error": f"No HTML file for {page_url} in {build_dir}"}
+    relative = os.path.relpath(html_path, build_dir).replace(os.sep, "/")
+    route_path = "/" + unquote(urlparse(page_url).path or "/").strip("/")
+    entry = f"{os.path.abspath(build_dir)}|{route_path}"
+    cached = _page_cache.get(entry)
+    if cached is not None and cached["key"] == _page_key(html_path, build_dir, cached["files"]):
+        return cached["result"]
+
+    parser = PageResourceParser()
+    with open(html_path, "r", encoding="utf-8", errors="ignore") as f:
+        parser.feed(f.read())
+    parser.close()
+
+    resources: Dict[str, Dict] = {}
+    files = set()
+
+    def add(href: str, kind: str, tier: int, path: Optional[str] = None, **extra):
+        if path:
+            files.add(os.path.abspath(path))
+        if href not in resources or resources[href]["tier"] > tier:
+            resources[href] = {"href": href, "kind": kind, "tier": tier, "bytes": _size(path), **extra}
+
+    for origin in parser.origins[:MAX_PRECONNECTS]:
+        add(origin, "origin", TIER_PRECONNECT)
+
+    fonts: List[str] = []
+    for sheet in parser.stylesheets:
+        path = _local_path(sheet["href"], html_path, build_dir)
+        if sheet["blocking"]:
+            add(sheet["href"], "style", TIER_BLOCKING_CSS, path)
+        if path:
+            files.add(os.path.abspath(path))
+            fonts.extend(font for font in _css_fonts(path, build_dir) if font not in fonts)
+    for font in fonts[:MAX_FONT_PRELOADS]:
+        add(font, "font", TIER_FONT, _local_path(font, html_path, build_dir))
+
+    candidates = [image for image in parser.images if not image["lazy"]]
+    candidates.sort(key=lambda image: not image["priority"])
+    for image in candidates[:MAX_LCP_CANDIDATES]:
+        add(image["href"], "image", TIER_LCP_IMAGE, _local_path(image["href"], html_path, build_dir))
+
+    graph = ManifestGraph.load(build_dir)
+    by_file = {chunk["file"]: key for key, chunk in graph.manifest.items()} if graph else {}
+    for script in parser.scripts:
+        path = _local_path(script["href"], html_path, build_dir)
+        add(script["href"], "script", TIER_ENTRY_JS, path, module=script["module"])
+        chunk = by_file.get(_public_href(path, build_dir).lstrip("/")) if path else None
+        if chunk is None:
+            continue
+        js_files, css_files = graph.files(graph.static_closure(chunk) - {chunk})
+        for file in js_files:
+            add("/" + file, "script", TIER_STATIC_IMPORT, os.path.join(build_dir, file), module=True)
+        for file in css_files:
+            add("/" + file, "style", TIER_BLOCKING_CSS, os.path.join(build_dir, file))
+    for href in parser.modulepreloads:
+        add(href, "script", TIER_STATIC_IMPORT, _local_path(href, html_path, build_dir), module=True)
+
+    # Lazy route chunks the SPA fetches right after boot for this URL
+    if graph is not None:
+        for route in analyze_critical_path(build_dir, graph=graph).get("routes", []):
+            if route.get("path") == route_path and "files" in route:
+                for file in route["files"]:
+                    kind = "style" if file.endswith(".css") else "script"
+                    add("/" + file, kind, TIER_ROUTE, os.path.join(build_dir, file), module=kind == "script")
+
+    ordered = sorted(resources.values(), key=lambda resource: (resource["tier"], -resource["bytes"]))
+    result = {"page": relative, "path": route_path, "resources": ordered}
+    files = sorted(files)
+    _page_cache.set(entry, {"key": _page_key(html_path, build_dir, files), "files": files, "result": result})
+    _page_cache.save()
+    return result
+
+def resource_hint(resource: Dict) -> Dict:
+    """
+    ResourceHint fields for one collected resource
+    """
+    kind = resource["kind"]
+    if kind == "origin":
+        return {"rel": "preconnect", "href": resource["href"], "crossorigin": "anonymous"}
+    if kind == "script" and resource.get("module"):
+        return {"rel": "modulepreload", "href": resource["href"]}
+    hint = {"rel": "preload", "href": resource["href"], "as_": kind}
+    if kind == "font":
+        hint["crossorigin"] = "anonymous"
+        hint["type_"] = "font/" + os.path.splitext(resource["href"])[1].lstrip(".").lower()
+    return hint
+
+def link_tag(hint: Dict) -> str:
+    parts = [f'<link rel="{hint["rel"]}" href="{hint["href"]}"']
+    if hint.get("as_"):
+        parts.append(f'as="{hint["as_"]}"')
+    if hint.get("as_") == "image":
+        parts.append('fetchpriority="high"')
+    if hint.get("crossorigin"):
+        parts.append(f'crossorigin="{hint["crossorigin"]}"')
+    if hint.get("type_"):
+        parts.append(f'type="{hint["type_"]}"')
+    return " ".join(parts) + ">"
+
+# Relations browsers act on from a Link header (including 103 Early Hints)
+LINK_HEADER_RELS = ("preconnect", "preload", "modulepreload")
+
+def link_header(hint: Dict) -> str:
+    """
+    One Link header value, e.g. </app.css>; rel=preload; as=style
+    """
+    parts = [f"<{hint['href']}>", f"rel={hint['rel']}"]
+    if hint.get("as_"):
+        parts.append(f"as={hint['as_']}")
+    if hint.get("as_") == "image":
+        parts.append("fetchpriority=high")
+    if hint.get("crossorigin"):
+        parts.append("crossorigin" if hint["crossorigin"] == "anonymous" else f"crossorigin={hint['crossorigin']}")
+    if hint.get("type_"):
+        parts.append(f'type="{hint["type_"]}"')
+    return "; ".join(parts)
+
+def link_headers(hints: List[Dict]) -> List[str]:
+    return [link_header(hint) for hint in hints if hint["rel"] in LINK_HEADER_RELS]
+
+def page_link_headers(pages: List[str], build_dir: str = "dist") -> Dict[str, List[str]]:
+    """
+    Link header values per page path, derived from the build output
+    """
+    headers = {}
+    for page in pages:
+        analysis = analyze_page_resources(page, build_dir)
+        if "error" not in analysis and analysis["link_headers"]:
+            headers["/" + unquote(urlparse(page).path or "/").strip("/")] = analysis["link_headers"]
+    return headers
+
+def analyze_page_resources(page_url: str, build_dir: str = "dist") -> Dict:
+    """
+    Resource hints for a page derived from the local build output, in the
+    same shape generate_resource_hints returns
+    """
+    collected = collect_page_resources(page_url, build_dir)
+    if "error" in collected:
+        return collected
+    hints = [resource_hint(resource) for resource in collected["resources"]]
     return {
-        "message": "Page analysis requires fetching the page HTML",
-        "suggestions": [
-            "Use browser DevTools Network tab to identify critical resources",
-            "Consider using Puppeteer or Playwright for automated analysis"
-        ]
+        "hints": hints,
+        "html_tags": [link_tag(hint) for hint in hints],
+        "link_headers": link_headers(hints),
+        "priority_order": [resource["href"] for resource in collected["resources"] if resource["kind"] != "origin"]
     }
-
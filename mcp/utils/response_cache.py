@@ -0,0 +1,107 @@
+"""
+Response Cache Utility
+Memoizes pure endpoint responses keyed by a canonical hash of the request
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+DEFAULT_MAX_ENTRIES = 2048
+
+def canonical_key(route: str, arguments: Dict[str, Any]) -> str:
+    """
+    Stable hash of a route and its validated arguments: Pydantic models are
+    encoded to JSON-compatible data and serialized with sorted keys, so
+    field order and equivalent inputs map to the same key
+    """
+    payload = json.dumps(
+        [route, jsonable_encoder(arguments)],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """
+    Size-bounded LRU of endpoint results with a TTL per entry and
+    hit/miss/eviction counters per route
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+        )
+        self._lock = threading.Lock()
+
+    def get(self, route: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            stats = self._stats[route]
+            if entry is None:
+                stats["misses"] += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                stats["expired"] += 1
+                stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            stats["hits"] += 1
+            return value
+
+    def set(self, route: str, key: str, value: Any, ttl_seconds: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value, route)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, (_, _, evicted_route) = self._entries.popitem(last=False)
+                self._stats[evicted_route]["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            routes = {}
+            for route, counts in self._stats.items():
+                lookups = counts["hits"] + counts["misses"]
+                routes[route] = {**counts, "hit_rate": round(counts["hits"] / lookups, 3) if lookups else 0}
+            return {"entries": len(self._entries), "max_entries": self.max_entries, "routes": routes}
+
+response_cache = ResponseCache()
+
+def memoize_response(route: str, ttl_seconds: float, cache: ResponseCache = response_cache) -> Callable:
+    """
+    Decorator for async endpoints that are pure functions of their
+    arguments. Exceptions (including HTTPException) are never cached.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        signature = inspect.signature(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            # Bind so positional and keyword calls share an entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = canonical_key(route, dict(bound.arguments))
+            cached = cache.get(route, key)
+            if cached is not None:
+                return cached
+            result = await endpoint(*args, **kwargs)
+            cache.set(route, key, result, ttl_seconds)
+            return result
+        return wrapper
+    return decorator
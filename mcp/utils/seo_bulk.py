@@ -0,0 +1,152 @@
+"""
+Bulk SEO Utility
+Validates and generates meta tags for many pages in one pass, with
+cross-page duplicate title/description checks
+"""
+
+import hashlib
+import json
+import re
+from typing import AsyncIterator, Dict, Iterable, Iterator, List
+
+from mcp.models.seo import PageData
+from mcp.utils.seo_generator import generate_seo_meta, validate_seo
+
+_WHITESPACE = re.compile(r"\s+")
+
+def _fingerprint(text: str) -> str:
+    """
+    Hash of text normalized for case and whitespace
+    """
+    normalized = _WHITESPACE.sub(" ", text).strip().casefold()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+class DuplicateIndex:
+    """
+    Hash index of one text field across pages; remembers the first text
+    seen for each hash and every URL that used it
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Dict] = {}
+
+    def add(self, text: str, url: str) -> List[str]:
+        """
+        Record the page; returns the URLs that already used this text
+        """
+        if not text.strip():
+            return []
+        entry = self._entries.setdefault(_fingerprint(text), {"text": text, "urls": []})
+        previous = list(entry["urls"])
+        entry["urls"].append(url)
+        return previous
+
+    def duplicates(self) -> List[Dict]:
+        groups = [entry for entry in self._entries.values() if len(entry["urls"]) > 1]
+        return sorted(groups, key=lambda entry: -len(entry["urls"]))
+
+class BulkSEOChecker:
+    """
+    Checks pages one at a time so results can be streamed as they are
+    produced; summary() reports the cross-page duplicates found overall
+    """
+
+    def __init__(self, include_meta: bool = False):
+        self.include_meta = include_meta
+        self.titles = DuplicateIndex()
+        self.descriptions = DuplicateIndex()
+        self.pages = 0
+        self.valid = 0
+        self.rejected = 0
+
+    def check(self, item, index: int) -> Dict:
+        """
+        Result line for one raw page (dict or PageData, or the ValueError
+        from a line that failed to decode)
+        """
+        if isinstance(item, ValueError):
+            return self.reject(index, f"Invalid JSON: {item}")
+        try:
+            page = item if isinstance(item, PageData) else PageData(**item)
+        except Exception as e:
+            return self.reject(index, str(e))
+
+        validation = validate_seo(page)
+        errors = list(validation["errors"])
+        warnings = list(validation["warnings"])
+        duplicate_title = self.titles.add(page.title, page.url)
+        duplicate_description = self.descriptions.add(page.description, page.url)
+        if duplicate_title:
+            errors.append(f"Duplicate title (also used by {duplicate_title[0]})")
+        if duplicate_description:
+            warnings.append(f"Duplicate description (also used by {duplicate_description[0]})")
+
+        self.pages += 1
+        self.valid += not errors
+        result = {
+            "type": "page",
+            "index": index,
+            "url": page.url,
+            "valid": not errors,
+            "errors": errors,
+            "warnings": warnings
+        }
+        if self.include_meta:
+            result["meta"] = generate_seo_meta(page)
+        return result
+
+    def reject(self, index: int, error: str) -> Dict:
+        self.rejected += 1
+        return {"type": "error", "index": index, "error": error}
+
+    def summary(self) -> Dict:
+        return {
+            "type": "summary",
+            "pages": self.pages,
+            "valid": self.valid,
+            "invalid": self.pages - self.valid,
+            "rejected": self.rejected,
+            "duplicate_titles": [
+                {"title": entry["text"], "urls": entry["urls"]} for entry in self.titles.duplicates()
+            ],
+            "duplicate_descriptions": [
+                {"description": entry["text"], "urls": entry["urls"]} for entry in self.descriptions.duplicates()
+            ]
+        }
+
+def iter_bulk_seo(pages: Iterable, include_meta: bool = False) -> Iterator[Dict]:
+    """
+    One result per page, then the site-level summary
+    """
+    checker = BulkSEOChecker(include_meta)
+    for index, item in enumerate(pages):
+        yield checker.check(item, index)
+    yield checker.summary()
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator:
+    """
+    Decode NDJSON from a byte stream as it arrives; lines that are not
+    valid JSON are yielded as the ValueError raised for them
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        # Only the new bytes are searched, so a line spanning many chunks
+        # is scanned once rather than once per chunk
+        start = len(buffer)
+        buffer += chunk
+        end = buffer.rfind(b"\n", start)
+        if end < 0:
+            continue
+        complete = bytes(buffer[:end])
+        del buffer[:end + 1]
+        for line in complete.split(b"\n"):
+            if line.strip():
+                yield _decode(line)
+    if buffer.strip():
+        yield _decode(bytes(buffer))
+
+def _decode(line: bytes):
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return e
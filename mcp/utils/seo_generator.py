@@ -3,9 +3,14 @@ SEO Generator Utility
 Generates optimized meta tags, Open Graph, Twitter Cards, and structured data
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+import gzip
+import os
 import re
+import zlib
 from datetime import datetime
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
 
 def generate_seo_meta(page_data) -> Dict:
     """
@@ -146,24 +151,196 @@ def validate_seo(page_data) -> Dict:
         "warnings": warnings
     }
 
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+# Protocol limits per sitemap file (uncompressed)
+SITEMAP_MAX_URLS = 50000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+# Entries are flushed to the response/file in chunks of about this size
+SITEMAP_CHUNK_BYTES = 64 * 1024
+
+_URLSET_OPEN = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NAMESPACE}">\n'
+_URLSET_CLOSE = "</urlset>"
+_XML_ENTITIES = {'"': "&quot;", "'": "&apos;"}
+
+def sitemap_entry(page, lastmod: str) -> str:
+    """
+    One <url> element with the location entity-escaped
+    """
+    return (
+        "  <url>\n"
+        f"    <loc>{escape(page.url, _XML_ENTITIES)}</loc>\n"
+        f"    <lastmod>{escape(page.modified_time or lastmod, _XML_ENTITIES)}</lastmod>\n"
+        "    <changefreq>weekly</changefreq>\n"
+        "    <priority>0.8</priority>\n"
+        "  </url>\n"
+    )
+
+def iter_sitemap_xml(pages: Iterable, lastmod: Optional[str] = None) -> Iterator[str]:
+    """
+    Stream a single <urlset> document in chunks; pages are consumed lazily
+    """
+    lastmod = lastmod or datetime.now().isoformat()
+    buffer = [_URLSET_OPEN]
+    size = len(_URLSET_OPEN)
+    for page in pages:
+        entry = sitemap_entry(page, lastmod)
+        buffer.append(entry)
+        size += len(entry)
+        if size >= SITEMAP_CHUNK_BYTES:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    buffer.append(_URLSET_CLOSE)
+    yield "".join(buffer)
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """
+    Gzip a stream of text chunks on the fly
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
 def generate_sitemap_xml(pages: List) -> str:
     """
     Generate sitemap.xml from list of pages
     """
-    xml_parts = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
-    ]
+    return "".join(iter_sitemap_xml(pages))
 
-    for page in pages:
-        lastmod = page.modified_time or datetime.now().isoformat()
-        xml_parts.append("  <url>")
-        xml_parts.append(f"    <loc>{page.url}</loc>")
-        xml_parts.append(f"    <lastmod>{lastmod}</lastmod>")
-        xml_parts.append(f"    <changefreq>weekly</changefreq>")
-        xml_parts.append(f"    <priority>0.8</priority>")
-        xml_parts.append("  </url>")
+def _is_absolute(url: str) -> bool:
+    parsed = urlparse(url)
+    return parsed.scheme in ("http", "https") and bool(parsed.netloc)
 
-    xml_parts.append("</urlset>")
-    return "\n".join(xml_parts)
+class SitemapWriter:
+    """
+    Writes pages into sitemap files under output_dir as they are added.
 
+    A single file is written as sitemap.xml; once a file would exceed
+    max_urls or max_bytes the output is split into sitemap-N.xml shards
+    referenced from a sitemap.xml index, whose <loc> entries must be
+    absolute, so sharding requires an absolute base_url. Memory use does
+    not grow with the number of pages.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        base_url: str = "",
+        compress: bool = False,
+        max_urls: int = SITEMAP_MAX_URLS,
+        max_bytes: int = SITEMAP_MAX_BYTES
+    ):
+        if base_url and not _is_absolute(base_url):
+            raise ValueError(f"base_url must be an absolute http(s) URL, got {base_url!r}")
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.base_url = base_url.rstrip("/")
+        self.compress = compress
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.extension = ".xml.gz" if compress else ".xml"
+        self.lastmod = datetime.now().isoformat()
+        self.shards: List[Dict] = []
+        self.total = 0
+        self._closing = len(_URLSET_CLOSE.encode("utf-8"))
+        self._handle = None
+        self._count = self._size = 0
+
+    def _open(self, path: str):
+        return gzip.open(path, "wt", encoding="utf-8") if self.compress else open(path, "w", encoding="utf-8")
+
+    def _open_shard(self):
+        if self.shards and not self.base_url:
+            self.discard()
+            raise ValueError(
+                f"More than {self.max_urls} URLs or {self.max_bytes} bytes; "
+                "pass an absolute base_url to write a sitemap index"
+            )
+        path = os.path.join(self.output_dir, f"sitemap-{len(self.shards) + 1}{self.extension}")
+        self.shards.append({"path": path, "urls": 0})
+        self._handle = self._open(path)
+        self._handle.write(_URLSET_OPEN)
+        self._count, self._size = 0, len(_URLSET_OPEN)
+
+    def _close_shard(self):
+        self._handle.write(_URLSET_CLOSE)
+        self._handle.close()
+        self._handle = None
+        self.shards[-1]["urls"] = self._count
+
+    def add(self, page):
+        entry = sitemap_entry(page, self.lastmod)
+        entry_size = len(entry.encode("utf-8"))
+        if self._handle is not None and (
+            self._count >= self.max_urls or self._size + entry_size + self._closing > self.max_bytes
+        ):
+            self._close_shard()
+        if self._handle is None:
+            self._open_shard()
+        self._handle.write(entry)
+        self._count += 1
+        self._size += entry_size
+        self.total += 1
+
+    def discard(self):
+        """
+        Remove every shard written so far, e.g. after invalid input
+        """
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        for shard in self.shards:
+            if os.path.exists(shard["path"]):
+                os.remove(shard["path"])
+        self.shards = []
+
+    def close(self) -> Dict:
+        """
+        Finish the last shard and write sitemap.xml (the index when sharded)
+        """
+        if self._handle is None and not self.shards:
+            self._open_shard()
+        if self._handle is not None:
+            self._close_shard()
+
+        index_path = os.path.join(self.output_dir, f"sitemap{self.extension}")
+        if len(self.shards) == 1:
+            os.replace(self.shards[0]["path"], index_path)
+            return {
+                "sitemap": index_path,
+                "index": False,
+                "urls": self.total,
+                "files": [{"path": index_path, "urls": self.total}]
+            }
+
+        lines = [f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NAMESPACE}">\n']
+        for shard in self.shards:
+            location = f"{self.base_url}/{os.path.basename(shard['path'])}"
+            lines.append(
+                f"  <sitemap>\n    <loc>{escape(location, _XML_ENTITIES)}</loc>\n"
+                f"    <lastmod>{self.lastmod}</lastmod>\n  </sitemap>\n"
+            )
+        lines.append("</sitemapindex>")
+        with self._open(index_path) as f:
+            f.writelines(lines)
+        return {"sitemap": index_path, "index": True, "urls": self.total, "files": self.shards}
+
+def write_sitemaps(
+    pages: Iterable,
+    output_dir: str,
+    base_url: str = "",
+    compress: bool = False,
+    max_urls: int = SITEMAP_MAX_URLS,
+    max_bytes: int = SITEMAP_MAX_BYTES
+) -> Dict:
+    """
+    Stream pages into sitemap files under output_dir (see SitemapWriter).
+    Raises ValueError when the pages need a sitemap index and base_url is
+    not absolute.
+    """
+    writer = SitemapWriter(output_dir, base_url, compress, max_urls, max_bytes)
+    for page in pages:
+        writer.add(page)
+    return writer.close()
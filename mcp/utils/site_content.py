@@ -0,0 +1,247 @@
+"""
+Site Content Utility
+Extracts page text from content/ and src/pages and analyzes every page,
+caching results by content hash
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from mcp.utils.content_analyzer import analyze_content
+from mcp.utils.disk_cache import JsonFileCache
+from mcp.utils.page_pool import PageSummary, error_entry, iter_pool_results
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_ROOTS = ["content", "src/pages"]
+
+MARKDOWN_EXTENSIONS = (".md", ".mdx")
+JSX_EXTENSIONS = (".tsx", ".jsx")
+HTML_EXTENSIONS = (".html",)
+SKIP_DIRS = {"node_modules", ".git", "__tests__", "__snapshots__"}
+
+# Bump when extraction or analysis output changes, to invalidate cached results
+ANALYSIS_VERSION = 1
+# Least recently used results beyond this are evicted
+MAX_CACHED_PAGES = 5000
+
+# content hash -> analysis result
+_cache = JsonFileCache("content-analysis.json", max_entries=MAX_CACHED_PAGES)
+
+_FRONT_MATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_MD_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$", re.MULTILINE)
+_MD_IMAGE = re.compile(r"!\[([^\]]*)\]\(([^)\s]+)[^)]*\)")
+_MD_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)[^)]*\)")
+_MD_CODE = re.compile(r"^```.*?^```", re.MULTILINE | re.DOTALL)
+
+_JS_COMMENT = re.compile(r"/\*.*?\*/|(?<![:\"'])//[^\n]*", re.DOTALL)
+# JSX tag; attribute values may be quoted strings or one level of nested braces
+_JSX_TAG = re.compile(
+    r"<(/?)([A-Za-z][\w.]*)((?:[^<>\"'{}]|\"[^\"]*\"|'[^']*'|\{(?:[^{}]|\{[^{}]*\})*\})*?)(/?)>"
+)
+_JSX_EXPRESSION = re.compile(r"\{(?:[^{}]|\{[^{}]*\})*\}")
+_TEXT_PROPS = re.compile(r"\b(title|alt|content|description|label|heading|subtitle|caption)=\"([^\"]+)\"")
+_HREF = re.compile(r"\b(?:href|to)=(\"[^\"]*\"|\{[^}]*\})")
+_TITLE = re.compile(r"<title>([^<{]+)</title>", re.IGNORECASE)
+_CODE_SIGNS = re.compile(r";|=>|&&|\|\||\bconst\b|\breturn\b|=")
+
+def extract_markdown(source: str) -> Dict[str, str]:
+    """
+    Page title and analyzable HTML from a Markdown file
+    """
+    title = ""
+    front_matter = _FRONT_MATTER.match(source)
+    if front_matter:
+        source = source[front_matter.end():]
+        for line in front_matter.group(1).splitlines():
+            if line.startswith("title:"):
+                title = line.split(":", 1)[1].strip().strip("\"'")
+
+    source = _MD_CODE.sub("", source)
+    source = _MD_HEADING.sub(lambda m: f"<h{len(m.group(1))}>{m.group(2)}</h{len(m.group(1))}>", source)
+    source = _MD_IMAGE.sub(r'<img src="\2" alt="\1">', source)
+    source = _MD_LINK.sub(r'<a href="\2">\1</a>', source)
+    # Blank lines separate paragraphs
+    html = "".join(f"<p>{block}</p>" for block in re.split(r"\n\s*\n", source) if block.strip())
+    return {"title": title, "html": html}
+
+def extract_jsx(source: str) -> Dict[str, str]:
+    """
+    Page title and analyzable HTML from a React page component
+
+    Keeps intrinsic elements (so headings, images and links are counted),
+    literal text between tags and text-like string props; JavaScript code
+    and {expressions} are dropped.
+    """
+    source = _JS_COMMENT.sub("", source)
+    title_match = _TITLE.search(source)
+    title = title_match.group(1).strip() if title_match else ""
+
+    parts = []
+    previous_end = None
+    for match in _JSX_TAG.finditer(source):
+        if previous_end is not None:
+            text = _JSX_EXPRESSION.sub(" ", source[previous_end:match.start()])
+            if text.strip() and not _CODE_SIGNS.search(text):
+                parts.append(text)
+        previous_end = match.end()
+
+        closing, name, attributes, self_closing = match.groups()
+        if name[0].islower():
+            href = _HREF.search(attributes)
+            attribute = f' href="{href.group(1).strip(chr(34))}"' if href and name == "a" else ""
+            parts.append(f"<{closing}{name}{attribute}{self_closing}>")
+        if not closing:
+            for prop, value in _TEXT_PROPS.findall(attributes):
+                # Only the description among <meta content="..."> values is prose
+                if name == "meta" and 'name="description"' not in attributes:
+                    continue
+                parts.append(f"<p>{value}</p>")
+
+    return {"title": title, "html": "".join(parts)}
+
+def extract_page(path: str) -> Dict[str, str]:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        source = f.read()
+    if path.endswith(MARKDOWN_EXTENSIONS):
+        return extract_markdown(source)
+    if path.endswith(JSX_EXTENSIONS):
+        return extract_jsx(source)
+    title = _TITLE.search(source)
+    return {"title": title.group(1).strip() if title else "", "html": source}
+
+def find_pages(roots: List[str]) -> List[str]:
+    """
+    Page source files under the given directories (relative to the repo root)
+    """
+    pages = []
+    for root in roots:
+        root_path = root if os.path.isabs(root) else os.path.join(REPO_ROOT, root)
+        for directory, dirs, files in os.walk(root_path):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+            for file in sorted(files):
+                if file.endswith(MARKDOWN_EXTENSIONS + JSX_EXTENSIONS + HTML_EXTENSIONS) \
+                        and not file.endswith((".test.tsx", ".stories.tsx")):
+                    pages.append(os.path.join(directory, file))
+    return pages
+
+def page_type(relative_path: str) -> str:
+    """
+    Page type expected by analyze_content, inferred from the file location
+    """
+    if relative_path in ("src/pages/index.tsx", "src/pages/Home.tsx"):
+        return "homepage"
+    if "case-studies" in relative_path or "case-study" in relative_path.lower():
+        return "case-study"
+    if relative_path.startswith("content/"):
+        return "blog-post"
+    return os.path.splitext(os.path.basename(relative_path))[0].lower()
+
+def _content_key(html: str, kind: str, keywords: List[str]) -> str:
+    payload = json.dumps([ANALYSIS_VERSION, kind, sorted(keywords), html])
+    return "sha1:" + hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def _analyze_page(job) -> Dict:
+    _, html, kind, keywords = job
+    return analyze_content(html, kind, keywords)
+
+def iter_site_analysis(
+    roots: Optional[List[str]] = None,
+    target_keywords: Optional[List[str]] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Yield one result per page (cached pages first, then freshly analyzed
+    pages as workers finish) followed by a site-level summary. A page whose
+    analysis fails yields an error line instead.
+    """
+    keywords = target_keywords or []
+    pages = {}
+    jobs = []
+    summary = SiteSummary()
+
+    for path in find_pages(roots or DEFAULT_ROOTS):
+        relative = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+        try:
+            extracted = extract_page(path)
+        except OSError as e:
+            entry = error_entry(relative, str(e))
+            summary.fail(entry)
+            yield entry
+            continue
+        kind = page_type(relative)
+        key = _content_key(extracted["html"], kind, keywords)
+        page = {"type": "page", "path": relative, "title": extracted["title"], "page_type": kind, "content_hash": key}
+
+        cached = _cache.get(key)
+        if cached is not None:
+            page.update(cached=True, **cached)
+            summary.add(page)
+            yield page
+            continue
+        pages.setdefault(key, []).append(page)
+        if len(pages[key]) == 1:
+            jobs.append((key, extracted["html"], kind, keywords))
+
+    for job, result, error in iter_pool_results(_analyze_page, jobs, max_workers):
+        if error is None:
+            _cache.set(job[0], result)
+        for page in pages[job[0]]:
+            if error is not None:
+                entry = error_entry(page["path"], error)
+                summary.fail(entry)
+                yield entry
+                continue
+            page.update(cached=False, **result)
+            summary.add(page)
+            yield page
+
+    _cache.save()
+    yield summary.result()
+
+class SiteSummary(PageSummary):
+    """
+    Running site-level aggregates over per-page results
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.words = 0
+        self.score_total = 0.0
+        self.readability_total = 0.0
+        self.missing_h1: List[str] = []
+        self.multiple_h1: List[str] = []
+        self.thin_pages: List[str] = []
+        self.lowest: List[Dict] = []
+
+    def add(self, page: Dict):
+        super().add(page)
+        metrics = page["metrics"]
+        self.words += metrics["word_count"]
+        self.score_total += page["score"]
+        self.readability_total += metrics["readability_score"]
+        h1 = metrics["heading_structure"]["h1"]
+        if h1 == 0:
+            self.missing_h1.append(page["path"])
+        elif h1 > 1:
+            self.multiple_h1.append(page["path"])
+        if metrics["word_count"] < 300:
+            self.thin_pages.append(page["path"])
+        self.lowest.append({"path": page["path"], "score": page["score"]})
+        self.lowest = sorted(self.lowest, key=lambda entry: entry["score"])[:10]
+
+    def result(self) -> Dict:
+        return {
+            **super().result(),
+            "analyzed": self.pages - self.cached,
+            "total_words": self.words,
+            "average_score": round(self.score_total / self.pages, 1) if self.pages else 0,
+            "average_readability": round(self.readability_total / self.pages, 1) if self.pages else 0,
+            "missing_h1": self.missing_h1,
+            "multiple_h1": self.multiple_h1,
+            "thin_pages": self.thin_pages,
+            "lowest_scoring": self.lowest
+        }
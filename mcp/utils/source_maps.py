@@ -0,0 +1,263 @@
+"""
+Source Map Utility
+Attributes generated chunk bytes back to original source files and packages
+"""
+
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
+
+from mcp.utils.json_stream import JsonStreamReader
+
+_BASE64 = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+
+class MappingsAttributor:
+    """
+    Streaming decoder for the source map "mappings" field.
+
+    Consumes Base64 VLQ text piecewise and, using the generated file's lines,
+    credits the bytes between consecutive segments to the segment's source.
+    Only running totals per source index are kept.
+    """
+
+    def __init__(self, generated_lines: Iterator[str]):
+        self.lines = generated_lines
+        self.bytes_by_source: Dict[int, int] = defaultdict(int)
+        self.unmapped_bytes = 0
+        self._carry = ""
+        self._source = 0
+        self._segments: List[tuple] = []
+
+    def feed(self, text: str):
+        text = self._carry + text
+        cut = max(text.rfind(';'), text.rfind(','))
+        if cut < 0:
+            self._carry = text
+            return
+        self._carry = text[cut + 1:]
+        self._consume(text[:cut + 1])
+
+    def close(self):
+        self._consume(self._carry + ';')
+        self._carry = ""
+        # Lines past the last mapping line are unmapped (e.g. sourceMappingURL)
+        for line in self.lines:
+            self.unmapped_bytes += len(line.encode("utf-8"))
+
+    def _consume(self, text: str):
+        lines = text.split(';')
+        last = len(lines) - 1
+        for index, line in enumerate(lines):
+            for segment in line.split(','):
+                if segment:
+                    self._decode_segment(segment)
+            if index < last:
+                self._finish_line()
+
+    def _decode_segment(self, segment: str):
+        values = []
+        value = shift = 0
+        for char in segment:
+            digit = _BASE64[char]
+            value += (digit & 31) << shift
+            if digit & 32:
+                shift += 5
+            else:
+                values.append(-(value >> 1) if value & 1 else value >> 1)
+                value = shift = 0
+
+        column = values[0] + (self._segments[-1][0] if self._segments else 0)
+        source = None
+        if len(values) >= 4:
+            self._source += values[1]
+            source = self._source
+        self._segments.append((column, source))
+
+    def _finish_line(self):
+        line = next(self.lines, "")
+        segments, self._segments = self._segments, []
+
+        if line.isascii():
+            width = len(line)
+
+            def measure(start: int, end: int) -> int:
+                return end - start
+        else:
+            # Generated columns count UTF-16 code units, like JavaScript string
+            # indexes, so characters outside the BMP take two columns
+            utf16 = line.encode("utf-16-le", "surrogatepass")
+            width = len(utf16) // 2
+
+            def measure(start: int, end: int) -> int:
+                part = utf16[2 * start:2 * end].decode("utf-16-le", "surrogatepass")
+                return len(part.encode("utf-8", "surrogatepass"))
+
+        if not segments:
+            self.unmapped_bytes += measure(0, width)
+            return
+
+        self.unmapped_bytes += measure(0, min(segments[0][0], width))
+        for i, (column, source) in enumerate(segments):
+            end = min(segments[i + 1][0], width) if i + 1 < len(segments) else width
+            if end <= column:
+                continue
+            size = measure(column, end)
+            if source is None:
+                self.unmapped_bytes += size
+            else:
+                self.bytes_by_source[source] += size
+
+def normalize_source(source: str, source_root: str = "") -> str:
+    """
+    Strip bundler prefixes and relative segments from a source path
+    """
+    if source_root and not source.startswith(source_root):
+        source = source_root.rstrip("/") + "/" + source
+    source = re.sub(r"^[a-z]+://[^/]*/?", "", source)
+    source = source.replace("\\", "/").split("?")[0]
+    while source.startswith(("../", "./", "/")):
+        source = source.split("/", 1)[1] if "/" in source else source
+    return source
+
+def source_package(source: str) -> str:
+    """
+    node_modules package a source file belongs to, or "(app)"
+    """
+    marker = source.rfind("node_modules/")
+    if marker < 0:
+        return "(app)"
+    parts = source[marker + len("node_modules/"):].split("/")
+    if parts[0].startswith("@") and len(parts) > 1:
+        return f"{parts[0]}/{parts[1]}"
+    return parts[0]
+
+def attribute_chunk(chunk_path: str, map_path: str) -> Dict:
+    """
+    Attribute one generated file's bytes to the sources in its map
+    """
+    sources: List[str] = []
+    source_root = ""
+
+    with open(chunk_path, "r", encoding="utf-8", newline="\n") as generated, \
+            open(map_path, "r", encoding="utf-8") as map_file:
+        attributor = MappingsAttributor(generated)
+        reader = JsonStreamReader(map_file)
+
+        for key in reader.iter_object():
+            if key == "mappings":
+                for piece in reader.iter_string():
+                    attributor.feed(piece)
+                attributor.close()
+            elif key == "sources":
+                sources = reader.read_value()
+            elif key == "sourceRoot":
+                source_root = reader.read_value() or ""
+            elif key == "sections":
+                raise ValueError("Indexed source maps are not supported")
+            else:
+                reader.skip_value()
+
+    by_source: Dict[str, int] = defaultdict(int)
+    for index, size in attributor.bytes_by_source.items():
+        name = normalize_source(sources[index], source_root) if index < len(sources) else f"(source {index})"
+        by_source[name] += size
+
+    return {
+        "chunk": os.path.basename(chunk_path),
+        "total_bytes": os.path.getsize(chunk_path),
+        "unmapped_bytes": attributor.unmapped_bytes,
+        "sources": dict(by_source)
+    }
+
+def _attribute_chunk_safe(paths) -> Dict:
+    chunk_path, map_path = paths
+    try:
+        return attribute_chunk(chunk_path, map_path)
+    except (OSError, ValueError, KeyError, IndexError) as e:
+        return {"chunk": os.path.basename(chunk_path), "error": str(e)}
+
+def find_mapped_chunks(build_dir: str) -> List[tuple]:
+    """
+    (chunk, map) path pairs for every JS/CSS file with a sibling .map
+    """
+    pairs = []
+    for root, dirs, files in os.walk(build_dir):
+        names = set(files)
+        for file in files:
+            if file.endswith(('.js', '.mjs', '.css')) and f"{file}.map" in names:
+                pairs.append((os.path.join(root, file), os.path.join(root, f"{file}.map")))
+    return pairs
+
+def _tree(name: str, sizes: Dict[str, int], group: Callable[[str], str]) -> Dict:
+    groups: Dict[str, Dict[str, int]] = defaultdict(dict)
+    for source, size in sizes.items():
+        groups[group(source)][source] = size
+    children = [
+        {
+            "name": package,
+            "size": sum(files.values()),
+            "children": [
+                {"name": source, "size": size}
+                for source, size in sorted(files.items(), key=lambda item: -item[1])
+            ]
+        }
+        for package, files in groups.items()
+    ]
+    children.sort(key=lambda node: -node["size"])
+    return {"name": name, "size": sum(sizes.values()), "children": children}
+
+def attribute_build_directory(build_dir: str, max_workers: Optional[int] = None) -> Dict:
+    """
+    Attribute every mapped chunk in a build directory, in parallel, and
+    return per-package/per-file totals plus a treemap payload
+    """
+    if not os.path.exists(build_dir):
+        return {"error": f"Build directory {build_dir} not found"}
+
+    pairs = find_mapped_chunks(build_dir)
+    if len(pairs) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_attribute_chunk_safe, pairs))
+    else:
+        results = [_attribute_chunk_safe(pair) for pair in pairs]
+
+    packages: Dict[str, int] = defaultdict(int)
+    files: Dict[str, int] = defaultdict(int)
+    chunk_trees = []
+    errors = []
+    unmapped = 0
+
+    for result in results:
+        if "error" in result:
+            errors.append(result)
+            continue
+        unmapped += result["unmapped_bytes"]
+        for source, size in result["sources"].items():
+            files[source] += size
+            packages[source_package(source)] += size
+        tree = _tree(result["chunk"], result["sources"], source_package)
+        tree["unmapped_bytes"] = result["unmapped_bytes"]
+        chunk_trees.append(tree)
+
+    chunk_trees.sort(key=lambda node: -node["size"])
+
+    return {
+        "chunks_analyzed": len(chunk_trees),
+        "unmapped_bytes": unmapped,
+        "packages": [
+            {"name": name, "bytes": size}
+            for name, size in sorted(packages.items(), key=lambda item: -item[1])
+        ],
+        "files": [
+            {"name": name, "package": source_package(name), "bytes": size}
+            for name, size in sorted(files.items(), key=lambda item: -item[1])
+        ],
+        "treemap": {
+            "name": os.path.basename(os.path.normpath(build_dir)),
+            "size": sum(files.values()),
+            "children": chunk_trees
+        },
+        "errors": errors
+    }
@@ -15,6 +15,7 @@ export interface PerformanceMetrics {
   timestamp?: string;
   user_agent?: string;
   connection_type?: string;
+  referrer?: string;
 }
 
 export interface ImageOptimizationRequest {
@@ -53,6 +54,7 @@ export const usePerformanceAnalytics = () => {
           timestamp: new Date().toISOString(),
           user_agent: navigator.userAgent,
           connection_type: (navigator as any).connection?.effectiveType || 'unknown',
+          referrer: metrics.referrer ?? (document.referrer || undefined),
         }),
       });
       return await response.json();